@@ -0,0 +1,12 @@
+"""
+ESP32-CAM 스탠드인 서버
+차량 없이 frontend, free_car, line_tracking의 ESP32 통신을 부하/지연 테스트
+
+실행:
+    python -m esp32_stand_in --latency 40 --jitter 30 --bandwidth 300
+    ESP32_IP=127.0.0.1:8080 python app.py
+"""
+
+from .server import CameraFeed, NetworkProfile, StandInServer
+
+__all__ = ["CameraFeed", "NetworkProfile", "StandInServer"]
@@ -0,0 +1,85 @@
+"""
+ESP32-CAM 스탠드인 서버 실행 스크립트
+
+예시:
+    # 합성 트랙, 지연 없음
+    python -m esp32_stand_in
+
+    # 녹화 파일 재생 + 느린 Wi-Fi 흉내
+    python -m esp32_stand_in --replay recordings/session.esprec \\
+        --latency 60 --jitter 40 --bandwidth 200 --drop-rate 0.02
+"""
+
+import argparse
+import logging
+
+from frame_source import ReplayFrameSource, SyntheticFrameSource
+
+from .server import NetworkProfile, StandInServer
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="ESP32-CAM stand-in server")
+    parser.add_argument("--host", default="127.0.0.1", help="bind address")
+    parser.add_argument("--port", type=int, default=8080, help="port")
+    parser.add_argument("--replay", help="recorded session (.esprec) to serve")
+    parser.add_argument("--width", type=int, default=320, help="synthetic width")
+    parser.add_argument("--height", type=int, default=240, help="synthetic height")
+    parser.add_argument("--camera-fps", type=float, default=15.0, help="sensor FPS")
+    parser.add_argument("--stream-fps", type=float, default=5.0, help="/stream FPS")
+    parser.add_argument("--latency", type=float, default=0.0, help="latency (ms)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="jitter (ms)")
+    parser.add_argument("--bandwidth", type=float, help="bandwidth cap (KB/s)")
+    parser.add_argument("--drop-rate", type=float, default=0.0, help="drop ratio")
+    parser.add_argument(
+        "--concurrent",
+        action="store_true",
+        help="handle requests in parallel (firmware handles one at a time)",
+    )
+    parser.add_argument("--seed", type=int, help="random seed for jitter/drops")
+    parser.add_argument("--verbose", action="store_true", help="log every request")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+
+    if args.replay:
+        source = ReplayFrameSource(args.replay, mode="max")
+    else:
+        source = SyntheticFrameSource(width=args.width, height=args.height)
+
+    profile = NetworkProfile(
+        latency_ms=args.latency,
+        jitter_ms=args.jitter,
+        bandwidth_kbps=args.bandwidth,
+        drop_rate=args.drop_rate,
+        single_connection=not args.concurrent,
+        seed=args.seed,
+    )
+    server = StandInServer(
+        source,
+        host=args.host,
+        port=args.port,
+        profile=profile,
+        camera_fps=args.camera_fps,
+        stream_fps=args.stream_fps,
+    )
+
+    print(f"ESP32-CAM stand-in: {server.url}")
+    print(f"  ESP32_IP={server.address}  (frontend / free_car)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        # 카메라 피드의 재생 생성기를 먼저 닫은 뒤 소스 닫기
+        server.stop()
+        source.close()
+        print(f"Stats: {server.get_stats()}")
+
+
+if __name__ == "__main__":
+    main()
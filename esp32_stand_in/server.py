@@ -0,0 +1,538 @@
+"""
+ESP32-CAM 스탠드인 HTTP 서버
+
+펌웨어(arduino/free_car)와 같은 엔드포인트와 응답 형식을 흉내 내어
+트랙/차량 없이 노트북에서 Flask 앱과 폴링 루프를 부하/지연 테스트합니다.
+
+엔드포인트: /, /capture, /stream, /control, /led, /speed, /camera, /status
+
+네트워크 조건(NetworkProfile):
+- 요청마다 고정 지연 + 지터
+- 대역폭 제한 (응답 바디를 잘게 나눠 속도 조절)
+- 일정 확률로 응답 없이 연결 끊기
+- 한 번에 한 요청만 처리 (펌웨어의 단일 httpd 태스크처럼,
+  /stream이 열려 있으면 다른 요청은 스트림이 끝날 때까지 대기)
+"""
+
+import json
+import logging
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from frame_source import FrameSource, SyntheticFrameSource
+
+logger = logging.getLogger(__name__)
+
+STREAM_BOUNDARY = "frame"
+MOTOR_COMMANDS = ("left", "right", "center", "stop")
+CAMERA_PARAMS = (
+    "brightness",
+    "contrast",
+    "saturation",
+    "agc_gain",
+    "gainceiling",
+    "aec2",
+    "hmirror",
+    "vflip",
+)
+
+
+class NetworkProfile:
+    """주입할 네트워크 조건"""
+
+    def __init__(
+        self,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        bandwidth_kbps: Optional[float] = None,
+        drop_rate: float = 0.0,
+        single_connection: bool = True,
+        seed: Optional[int] = None,
+    ):
+        """
+        네트워크 조건 초기화
+
+        Args:
+            latency_ms: 응답 전 고정 지연 (ms)
+            jitter_ms: 지연에 더해지는 0 ~ jitter_ms 무작위 지연 (ms)
+            bandwidth_kbps: 응답 전송 속도 제한 (KB/s, None이면 제한 없음)
+            drop_rate: 응답 없이 연결을 끊을 확률 (0~1)
+            single_connection: 한 번에 한 요청만 처리 (펌웨어 동작)
+            seed: 지터/드롭 난수 시드
+        """
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.bandwidth_kbps = bandwidth_kbps
+        self.drop_rate = drop_rate
+        self.single_connection = single_connection
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+
+    def delay(self) -> float:
+        """이번 응답에 적용할 지연 (초)"""
+        with self._rng_lock:
+            jitter = self._rng.uniform(0, self.jitter_ms) if self.jitter_ms else 0.0
+        return (self.latency_ms + jitter) / 1000
+
+    def should_drop(self) -> bool:
+        """이번 요청의 연결을 끊을지 여부"""
+        if self.drop_rate <= 0:
+            return False
+        with self._rng_lock:
+            return self._rng.random() < self.drop_rate
+
+
+class CameraFeed:
+    """
+    카메라 센서 흉내: camera_fps 주기로만 새 프레임으로 바뀜
+
+    같은 주기 안의 /capture, /stream 요청은 같은 프레임을 받습니다.
+    소스가 끝나면 처음부터 다시 재생합니다.
+    close() 후에는 소스를 더 읽지 않고 마지막 프레임을 계속 보냅니다.
+    """
+
+    def __init__(self, source: FrameSource, camera_fps: float = 15.0):
+        """
+        Args:
+            source: 프레임 소스 (녹화 재생은 mode="max" 권장, 주기는 여기서 결정)
+            camera_fps: 센서 프레임 속도
+        """
+        self.source = source
+        self.frame_interval = 1.0 / camera_fps
+        self._lock = threading.Lock()
+        self._frames = iter(source)
+        self._jpeg: Optional[bytes] = None
+        self._seq = 0
+        self._updated_at = 0.0
+        self._closed = False
+
+    def latest(self) -> Tuple[bytes, int]:
+        """
+        현재 센서 프레임
+
+        Returns:
+            (JPEG 바이트, 프레임 번호)
+        """
+        with self._lock:
+            if self._closed:
+                if self._jpeg is None:
+                    raise RuntimeError("카메라 피드가 닫혔습니다")
+                return self._jpeg, self._seq
+            now = time.time()
+            if self._jpeg is None or now - self._updated_at >= self.frame_interval:
+                self._jpeg = self._next_jpeg()
+                self._seq += 1
+                self._updated_at = now
+            return self._jpeg, self._seq
+
+    def close(self):
+        """소스 생성기 닫기 (소스를 닫기 전에 호출, 생성기가 잡은 자원 해제)"""
+        with self._lock:
+            self._closed = True
+            self._frames.close()
+
+    def _next_jpeg(self) -> bytes:
+        """소스의 다음 프레임을 JPEG로 (끝나면 처음부터)"""
+        image = next(self._frames, None)
+        if image is None:
+            self._frames = iter(self.source)
+            image = next(self._frames, None)
+            if image is None:
+                raise RuntimeError("프레임 소스가 비어 있습니다")
+
+        if self.source.jpeg is not None:
+            return bytes(self.source.jpeg)
+        if isinstance(self.source, SyntheticFrameSource):
+            return self.source.encode_jpeg(image)
+
+        import cv2
+
+        _, buffer = cv2.imencode(".jpg", image)
+        return buffer.tobytes()
+
+
+class CarState:
+    """펌웨어가 /status로 보고하는 차량 상태"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.command = "stop"
+        self.led_on = False
+        self.speed = 200  # MOTOR_SPEED_NORMAL
+        self.camera = {name: 0 for name in CAMERA_PARAMS}
+
+    def to_status(self, ip_address: str) -> dict:
+        """/status 응답 JSON"""
+        with self.lock:
+            return {
+                "wifi_connected": True,
+                "ip_address": ip_address,
+                "camera_status": "ok",
+                "motor_status": "stopped" if self.command == "stop" else "running",
+                "current_command": self.command.upper(),
+                "led_state": "on" if self.led_on else "off",
+                "speed": self.speed,
+                "camera_settings": dict(self.camera),
+            }
+
+
+class StandInServer:
+    """ESP32-CAM 스탠드인 서버 (백그라운드 스레드에서 실행)"""
+
+    def __init__(
+        self,
+        source: Optional[FrameSource] = None,
+        host: str = "127.0.0.1",
+        port: int = 8080,
+        profile: Optional[NetworkProfile] = None,
+        camera_fps: float = 15.0,
+        stream_fps: float = 5.0,
+    ):
+        """
+        서버 초기화 (start()로 시작)
+
+        Args:
+            source: 프레임 소스 (None이면 합성 트랙)
+            host: 바인드 주소
+            port: 포트 (0이면 임의 포트)
+            profile: 네트워크 조건 (None이면 지연/드롭 없음)
+            camera_fps: 센서 프레임 속도 (/capture가 새 프레임을 받는 주기)
+            stream_fps: /stream 전송 속도 (펌웨어 STREAM_DELAY_MS)
+        """
+        self.feed = CameraFeed(source or SyntheticFrameSource(), camera_fps)
+        self.profile = profile or NetworkProfile()
+        self.stream_interval = 1.0 / stream_fps
+        self.state = CarState()
+
+        # 펌웨어의 단일 httpd 태스크 (single_connection일 때 요청 직렬화)
+        self.request_lock = threading.Lock()
+
+        self._stats_lock = threading.Lock()
+        self.stats = {
+            "requests": {},  # 엔드포인트별 요청 수
+            "dropped": 0,
+            "bytes_sent": 0,
+            "stream_frames": 0,
+            "max_queue_wait_ms": 0,
+            "total_queue_wait_ms": 0.0,
+        }
+
+        self._httpd = ThreadingHTTPServer((host, port), _StandInHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.stand_in = self
+        self._thread = None
+        self._stopping = threading.Event()
+
+    @property
+    def address(self) -> str:
+        """ESP32_IP로 쓸 주소 (host:port)"""
+        host, port = self._httpd.server_address[:2]
+        return f"{host}:{port}"
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.address}"
+
+    def start(self) -> "StandInServer":
+        """백그라운드 스레드에서 서버 시작"""
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="esp32-stand-in", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"ESP32-CAM 스탠드인 서버 시작: {self.url}")
+        return self
+
+    def serve_forever(self):
+        """현재 스레드에서 서버 실행 (Ctrl+C로 종료)"""
+        logger.info(f"ESP32-CAM 스탠드인 서버 시작: {self.url}")
+        try:
+            self._httpd.serve_forever()
+        finally:
+            self.stop()
+
+    def stop(self):
+        """서버 종료 (열린 스트림과 카메라 피드도 종료)"""
+        self._stopping.set()
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join(timeout=2.0)
+            self._thread = None
+        self._httpd.server_close()
+        self.feed.close()
+
+    @property
+    def is_stopping(self) -> bool:
+        return self._stopping.is_set()
+
+    def get_stats(self) -> dict:
+        """
+        서버 통계
+
+        Returns:
+            통계 딕셔너리
+        """
+        with self._stats_lock:
+            total = sum(self.stats["requests"].values())
+            return {
+                "requests": dict(self.stats["requests"]),
+                "total_requests": total,
+                "dropped": self.stats["dropped"],
+                "bytes_sent": self.stats["bytes_sent"],
+                "stream_frames": self.stats["stream_frames"],
+                "avg_queue_wait_ms": (
+                    self.stats["total_queue_wait_ms"] / total if total else 0
+                ),
+                "max_queue_wait_ms": self.stats["max_queue_wait_ms"],
+            }
+
+    def _count(self, key: str, value: int = 1):
+        with self._stats_lock:
+            self.stats[key] += value
+
+    def _count_request(self, path: str, queue_wait_ms: float):
+        with self._stats_lock:
+            requests = self.stats["requests"]
+            requests[path] = requests.get(path, 0) + 1
+            self.stats["total_queue_wait_ms"] += queue_wait_ms
+            self.stats["max_queue_wait_ms"] = max(
+                self.stats["max_queue_wait_ms"], int(queue_wait_ms)
+            )
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    """펌웨어 엔드포인트 핸들러 (keep-alive 지원)"""
+
+    protocol_version = "HTTP/1.1"
+    server_version = "ESP32-CAM-StandIn"
+
+    def log_message(self, format, *args):
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+    def do_GET(self):
+        stand_in: StandInServer = self.server.stand_in
+        url = urlparse(self.path)
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        handler = self._ROUTES.get(url.path)
+
+        wait_start = time.time()
+        lock = stand_in.request_lock if stand_in.profile.single_connection else None
+        if lock is not None:
+            lock.acquire()
+        try:
+            stand_in._count_request(url.path, (time.time() - wait_start) * 1000)
+
+            # 응답 없이 연결 끊기 (클라이언트는 ConnectionError)
+            if stand_in.profile.should_drop():
+                stand_in._count("dropped")
+                self.close_connection = True
+                return
+
+            time.sleep(stand_in.profile.delay())
+
+            if handler is None:
+                self._send_text("Not Found", status=404)
+                return
+            handler(self, stand_in, query)
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True
+        finally:
+            if lock is not None:
+                lock.release()
+
+    # ----- 엔드포인트 -----
+    def _handle_index(self, stand_in: StandInServer, query: dict):
+        body = (
+            "<html><body><h1>ESP32-CAM Stand-in</h1>"
+            '<img src="/stream"></body></html>'
+        )
+        self._send_body(body.encode("utf-8"), "text/html")
+
+    def _handle_capture(self, stand_in: StandInServer, query: dict):
+        jpeg, _ = stand_in.feed.latest()
+        self._send_body(
+            jpeg,
+            "image/jpeg",
+            {"Cache-Control": "no-store, no-cache, must-revalidate"},
+        )
+
+    def _handle_stream(self, stand_in: StandInServer, query: dict):
+        self.send_response(200)
+        self.send_header(
+            "Content-Type", f"multipart/x-mixed-replace; boundary={STREAM_BOUNDARY}"
+        )
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Cache-Control", "no-cache, no-store, must-revalidate")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+
+        next_frame = time.time()
+        while not stand_in.is_stopping:
+            jpeg, _ = stand_in.feed.latest()
+            part = (
+                f"--{STREAM_BOUNDARY}\r\n"
+                f"Content-Type: image/jpeg\r\nContent-Length: {len(jpeg)}\r\n\r\n"
+            ).encode("ascii")
+            self._write(part + jpeg + b"\r\n")
+            stand_in._count("stream_frames")
+
+            next_frame += stand_in.stream_interval
+            remaining = next_frame - time.time()
+            if remaining > 0:
+                time.sleep(remaining)
+            else:
+                next_frame = time.time()
+
+    def _handle_control(self, stand_in: StandInServer, query: dict):
+        cmd = query.get("cmd", "").strip().lower()
+        if "cmd" not in query:
+            self._send_text("Missing cmd parameter", status=400)
+            return
+        if cmd not in MOTOR_COMMANDS:
+            self._send_text("Unknown command", status=400)
+            return
+
+        with stand_in.state.lock:
+            stand_in.state.command = cmd
+        self._send_text(f"Command executed: {cmd.upper()}")
+
+    def _handle_led(self, stand_in: StandInServer, query: dict):
+        if "state" not in query:
+            self._send_text("Missing state parameter", status=400)
+            return
+
+        state = stand_in.state
+        value = query["state"].strip().lower()
+        with state.lock:
+            if value == "on":
+                state.led_on = True
+            elif value == "off":
+                state.led_on = False
+            elif value == "toggle":
+                state.led_on = not state.led_on
+            else:
+                self._send_text(
+                    "Unknown LED state. Use: on, off, or toggle", status=400
+                )
+                return
+            led_on = state.led_on
+        self._send_text(f"LED state: {'ON' if led_on else 'OFF'}")
+
+    def _handle_speed(self, stand_in: StandInServer, query: dict):
+        if "op" not in query:
+            self._send_text("Missing op parameter", status=400)
+            return
+
+        op = query["op"].strip().lower()
+        try:
+            step = min(100, max(1, int(query.get("step", 10))))
+        except ValueError:
+            step = 1
+
+        state = stand_in.state
+        with state.lock:
+            if op == "plus":
+                state.speed = min(255, state.speed + step)
+            elif op == "minus":
+                state.speed = max(0, state.speed - step)
+            else:
+                self._send_text("Unknown op. Use plus or minus", status=400)
+                return
+            speed = state.speed
+        self._send_text(f"speed={speed}")
+
+    def _handle_camera(self, stand_in: StandInServer, query: dict):
+        state = stand_in.state
+        if not query or query.get("get", "").lower() == "settings":
+            with state.lock:
+                settings = dict(state.camera)
+            self._send_json(settings)
+            return
+
+        if "param" not in query:
+            self._send_text("Missing param parameter", status=400)
+            return
+        if "value" not in query:
+            self._send_text("Missing value parameter", status=400)
+            return
+
+        param = query["param"].strip().lower()
+        if param not in CAMERA_PARAMS:
+            self._send_text(f"Unknown param. Use: {', '.join(CAMERA_PARAMS)}", 400)
+            return
+        try:
+            value = int(query["value"])
+        except ValueError:
+            value = 0
+
+        with state.lock:
+            state.camera[param] = value
+        self._send_text(f"{param}={value}")
+
+    def _handle_status(self, stand_in: StandInServer, query: dict):
+        self._send_json(stand_in.state.to_status(stand_in.address.split(":")[0]))
+
+    _ROUTES = {
+        "/": _handle_index,
+        "/capture": _handle_capture,
+        "/stream": _handle_stream,
+        "/control": _handle_control,
+        "/led": _handle_led,
+        "/speed": _handle_speed,
+        "/camera": _handle_camera,
+        "/status": _handle_status,
+    }
+
+    # ----- 응답 -----
+    def _send_text(self, text: str, status: int = 200):
+        self._send_body(text.encode("utf-8"), "text/plain", status=status)
+
+    def _send_json(self, data: dict):
+        self._send_body(json.dumps(data, indent=2).encode("utf-8"), "application/json")
+
+    def _send_body(
+        self,
+        body: bytes,
+        content_type: str,
+        headers: Optional[dict] = None,
+        status: int = 200,
+    ):
+        """Content-Length를 붙여 전송 (keep-alive 유지)"""
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Access-Control-Allow-Origin", "*")
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self._write(body)
+
+    def _write(self, data: bytes):
+        """대역폭 제한을 적용하여 전송"""
+        stand_in: StandInServer = self.server.stand_in
+        bandwidth = stand_in.profile.bandwidth_kbps
+        stand_in._count("bytes_sent", len(data))
+
+        if not bandwidth:
+            self.wfile.write(data)
+            return
+
+        bytes_per_sec = bandwidth * 1024
+        piece = max(512, int(bytes_per_sec / 50))  # 약 20ms 단위로 전송
+        start = time.time()
+        view = memoryview(data)
+        for offset in range(0, len(data), piece):
+            self.wfile.write(view[offset : offset + piece])
+            remaining = start + (offset + piece) / bytes_per_sec - time.time()
+            if remaining > 0:
+                time.sleep(remaining)
@@ -0,0 +1,16 @@
+"""
+프레임 처리 공용 패키지
+프레임마다 쓰는 처리 도구(버퍼 아레나, 색상 룩업 테이블, 마스크 통계, 움직임 게이트)를 free_car, frontend가 함께 사용
+"""
+
+from .color_lut import ColorLUT
+from .frame_arena import FrameArena
+from .mask_stats import MaskStats
+from .motion_gate import MotionGate
+
+__all__ = [
+    "ColorLUT",
+    "FrameArena",
+    "MaskStats",
+    "MotionGate",
+]
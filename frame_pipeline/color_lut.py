@@ -0,0 +1,114 @@
+"""
+색상 분류 룩업 테이블 모듈
+
+양자화한 BGR 색상 큐브의 모든 색을 한 번만 HSV로 분류해 두고,
+프레임마다 픽셀 → 큐브 인덱스 → 클래스 코드를 한 번에 조회합니다.
+(프레임마다 HSV 변환 + inRange 여러 번 + bitwise 연산을 대체)
+
+임계값이 바뀌면 해당 키의 테이블만 새로 만듭니다.
+"""
+
+from collections import OrderedDict
+from typing import Callable, Hashable, Optional
+
+import cv2
+import numpy as np
+
+from .frame_arena import FrameArena
+
+
+class ColorLUT:
+    """양자화 BGR 큐브 → 클래스 코드 테이블"""
+
+    def __init__(
+        self, bits: int = 7, cache_size: int = 4, arena: Optional[FrameArena] = None
+    ):
+        """
+        룩업 테이블 초기화
+
+        Args:
+            bits: 채널당 양자화 비트 수 (7 → 128^3색, 테이블 2MB)
+            cache_size: 보관할 테이블 수 (임계값 조합별)
+            arena: 채널/인덱스 작업 버퍼 아레나 (None이면 자체 생성)
+
+        Raises:
+            ValueError: 지원하지 않는 비트 수
+        """
+        if not 1 <= bits <= 8:
+            raise ValueError(f"양자화 비트 수는 1~8이어야 합니다: {bits}")
+        self.bits = bits
+        self.shift = 8 - bits
+        self.cache_size = cache_size
+        self.builds = 0  # 테이블 생성 횟수
+        self.arena = arena if arena is not None else FrameArena()
+
+        # 큐브 각 칸의 대표색 (칸 중앙값), 1행 이미지로 HSV 변환
+        levels = 1 << bits
+        centers = (np.arange(levels) << self.shift) + ((1 << self.shift) >> 1)
+        b, g, r = np.meshgrid(centers, centers, centers, indexing="ij")
+        cube = np.stack([b, g, r], axis=-1).reshape(1, -1, 3).astype(np.uint8)
+        self.cube_hsv = cv2.cvtColor(cube, cv2.COLOR_BGR2HSV)
+
+        self._tables: "OrderedDict[Hashable, np.ndarray]" = OrderedDict()
+
+    def table(
+        self, key: Hashable, classify: Callable[[np.ndarray], np.ndarray]
+    ) -> np.ndarray:
+        """
+        키에 해당하는 테이블 조회 (없으면 생성)
+
+        Args:
+            key: 임계값 조합 (같은 키면 테이블 재사용)
+            classify: HSV 이미지 → uint8 클래스 코드 이미지 함수
+
+        Returns:
+            큐브 인덱스 → 클래스 코드 테이블
+        """
+        table = self._tables.get(key)
+        if table is not None:
+            self._tables.move_to_end(key)
+            return table
+
+        table = np.ascontiguousarray(classify(self.cube_hsv), dtype=np.uint8).ravel()
+        self._tables[key] = table
+        self.builds += 1
+        if len(self._tables) > self.cache_size:
+            self._tables.popitem(last=False)
+        return table
+
+    def apply(
+        self,
+        bgr: np.ndarray,
+        key: Hashable,
+        classify: Callable[[np.ndarray], np.ndarray],
+        dst: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        BGR 이미지를 클래스 코드 이미지로 변환
+
+        Args:
+            bgr: BGR 이미지
+            key: 임계값 조합
+            classify: 테이블 생성 시 사용할 분류 함수
+            dst: 결과 버퍼 (uint8, 높이x너비, None이면 새로 할당)
+
+        Returns:
+            클래스 코드 이미지 (uint8, bgr과 같은 높이/너비)
+        """
+        table = self.table(key, classify)
+        shape = bgr.shape[:2]
+
+        # 채널 분리/인덱스 계산은 아레나 작업 버퍼에서 (프레임마다 할당 없음)
+        channels = [self.arena.buffer(f"color_lut.{c}", shape) for c in "bgr"]
+        b, g, r = cv2.split(bgr, channels)
+        index = self.arena.buffer("color_lut.index", shape, np.uint32)
+
+        np.right_shift(b, self.shift, out=b)
+        np.copyto(index, b)
+        index <<= self.bits
+        np.right_shift(g, self.shift, out=g)
+        index |= g
+        index <<= self.bits
+        np.right_shift(r, self.shift, out=r)
+        index |= r
+        return table.take(index, out=dst)
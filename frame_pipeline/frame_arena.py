@@ -0,0 +1,88 @@
+"""
+프레임 버퍼 아레나 모듈
+
+프레임마다 새로 만들던 중간 결과 배열(그레이, HSV, 마스크, 모폴로지 결과 등)을
+(이름, 해상도, dtype)별로 한 번만 할당해 두고 OpenCV의 dst= 인자로 재사용합니다.
+정상 상태 루프에서는 새 할당이 0이어야 하며, 할당 횟수는 통계로 확인합니다.
+
+주의: 아레나 버퍼는 같은 스레드의 다음 프레임 처리 때 덮어써집니다.
+프레임을 넘겨 보관하려면 복사해야 합니다.
+"""
+
+import threading
+from typing import Any, Dict, Tuple
+
+import numpy as np
+
+
+class FrameArena:
+    """재사용 가능한 프레임 버퍼 모음 (스레드별 분리)"""
+
+    def __init__(self):
+        """아레나 초기화"""
+        self._local = threading.local()  # 스레드마다 별도 버퍼 (동시 처리 안전)
+        self._lock = threading.Lock()
+        self.allocations = 0  # 새 버퍼 할당 횟수 (정상 상태에서 증가하지 않아야 함)
+        self.allocated_bytes = 0  # 누적 할당 바이트
+
+    def buffer(
+        self, name: str, shape: Tuple[int, ...], dtype: Any = np.uint8
+    ) -> np.ndarray:
+        """
+        버퍼 조회 (없으면 할당)
+
+        Args:
+            name: 버퍼 이름 (같은 프레임에서 동시에 쓰는 버퍼는 이름이 달라야 함)
+            shape: 배열 크기
+            dtype: 자료형
+
+        Returns:
+            재사용 버퍼 (내용은 이전 프레임 값, 초기화하지 않음)
+        """
+        buffers = self._buffers()
+        key = (name, tuple(shape), np.dtype(dtype))
+        buf = buffers.get(key)
+        if buf is None:
+            buf = np.empty(shape, dtype=dtype)
+            buffers[key] = buf
+            with self._lock:
+                self.allocations += 1
+                self.allocated_bytes += buf.nbytes
+        return buf
+
+    def like(self, name: str, array: np.ndarray) -> np.ndarray:
+        """
+        array와 같은 크기/자료형의 버퍼 조회
+
+        Args:
+            name: 버퍼 이름
+            array: 기준 배열
+
+        Returns:
+            재사용 버퍼
+        """
+        return self.buffer(name, array.shape, array.dtype)
+
+    def clear(self):
+        """현재 스레드의 버퍼 해제 (해상도 변경 후 이전 버퍼 정리용)"""
+        self._buffers().clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        할당 통계
+
+        Returns:
+            {"allocations", "allocated_kb", "buffers"} (buffers는 현재 스레드 기준)
+        """
+        return {
+            "allocations": self.allocations,
+            "allocated_kb": round(self.allocated_bytes / 1024, 1),
+            "buffers": len(self._buffers()),
+        }
+
+    def _buffers(self) -> Dict[tuple, np.ndarray]:
+        """현재 스레드의 버퍼 사전"""
+        buffers = getattr(self._local, "buffers", None)
+        if buffers is None:
+            buffers = self._local.buffers = {}
+        return buffers
@@ -0,0 +1,252 @@
+"""
+마스크 통계 모듈
+
+마스크 한 장에서 값별 열 개수(누적합)를 한 번만 계산해 두고,
+조향/코너/하이브리드 판단이 같은 통계로 영역 개수와 무게중심을 O(1)로 조회합니다.
+
+값별 개수는 17비트 필드 묶음 커널(build_pack_table + cv2.reduce + unpack_fields)로
+한 번에 셉니다.
+"""
+
+from typing import Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+
+def build_pack_table(
+    values: Tuple[int, ...], field_bits: int, flag_others: bool = False
+) -> np.ndarray:
+    """
+    픽셀 값 → 필드 묶음 값 테이블 (cv2.LUT용)
+
+    Args:
+        values: 필드별 픽셀 값
+        field_bits: 필드당 비트 수
+        flag_others: True면 나머지 1~255 값을 마지막 필드 다음 비트로 표시
+
+    Returns:
+        (1, 256) float64 테이블
+    """
+    table = np.zeros((1, 256), dtype=np.float64)
+    if flag_others:
+        table[0, 1:] = 2.0 ** (len(values) * field_bits)
+    for field, value in enumerate(values):
+        table[0, value] = 2.0 ** (field * field_bits)
+    return table
+
+
+def unpack_fields(packed: np.ndarray, field_count: int, field_bits: int) -> np.ndarray:
+    """
+    필드 묶음 합계를 필드별 개수로 분리
+
+    Args:
+        packed: 필드 묶음 합계 (float64)
+        field_count: 필드 개수
+        field_bits: 필드당 비트 수
+
+    Returns:
+        (..., field_count) int64 필드별 개수
+    """
+    shifts = np.arange(field_count, dtype=np.int64) * field_bits
+    field_mask = (1 << field_bits) - 1
+    return (packed.astype(np.int64)[..., None] >> shifts) & field_mask
+
+
+class MaskStats:
+    """값별 열/행 개수 누적합 (열 범위 개수, 밴드 개수, X 무게중심)"""
+
+    # 값마다 17비트 필드 (float64 가수 53비트 안에 최대 3개, 열/행당 131,071픽셀)
+    FIELD_BITS = 17
+    MAX_VALUES = 3
+
+    def __init__(
+        self,
+        mask: np.ndarray,
+        values: Tuple[int, ...] = (255,),
+        row_bands: Optional[Sequence[Tuple[int, int]]] = None,
+    ):
+        """
+        통계 계산 (LUT + 열 합계 한 번)
+
+        Args:
+            mask: uint8 마스크 (이진 0/255 또는 세그멘테이션 0/1/2)
+            values: 셀 픽셀 값들 (최대 3개)
+            row_bands: 행 전체를 나누는 (시작, 끝) 밴드 경계
+                (지정하면 밴드별 열 개수도 함께 계산, block_counts용)
+
+        Raises:
+            ValueError: 값 개수가 1~3개가 아님
+        """
+        if not 1 <= len(values) <= self.MAX_VALUES:
+            raise ValueError(f"값은 1~{self.MAX_VALUES}개여야 합니다: {values}")
+
+        self.mask = mask
+        self.values = tuple(values)
+        self.row_bands = tuple(row_bands) if row_bands is not None else None
+        self.height, self.width = mask.shape
+        self.size = mask.size
+
+        # 값 → 필드 묶음 테이블, 열 합계 한 번으로 모든 값을 셈
+        self._table = build_pack_table(self.values, self.FIELD_BITS)
+        packed_mask = cv2.LUT(mask, self._table)
+        self.band_prefix: Optional[np.ndarray] = None
+        if self.row_bands is None:
+            columns = self._unpack(
+                cv2.reduce(packed_mask, 0, cv2.REDUCE_SUM).ravel()
+            )  # (너비, 값 개수)
+        else:
+            # 밴드별 열 합계 (밴드를 합치면 전체 열 개수)
+            band_columns = np.zeros(
+                (len(self.row_bands), self.width, len(self.values)), np.int64
+            )
+            for band, (start, end) in enumerate(self.row_bands):
+                if end > start:
+                    band_columns[band] = self._unpack(
+                        cv2.reduce(packed_mask[start:end], 0, cv2.REDUCE_SUM).ravel()
+                    )
+            columns = band_columns.sum(axis=0)
+            self.band_prefix = np.zeros(
+                (len(self.row_bands), self.width + 1, len(self.values)), np.int64
+            )
+            np.cumsum(band_columns, axis=1, out=self.band_prefix[:, 1:])
+
+        # 열 개수 / x 가중 개수 누적합 (앞에 0 한 줄)
+        self.column_prefix = np.zeros((self.width + 1, len(self.values)), np.int64)
+        np.cumsum(columns, axis=0, out=self.column_prefix[1:])
+        x = np.arange(self.width, dtype=np.int64)[:, None]
+        self.weighted_prefix = np.zeros_like(self.column_prefix)
+        np.cumsum(columns * x, axis=0, out=self.weighted_prefix[1:])
+
+        self._row_prefix: Optional[np.ndarray] = None  # 밴드 질의 시 계산
+
+    def total(self, value: int) -> int:
+        """
+        전체 픽셀 수
+
+        Args:
+            value: 픽셀 값
+
+        Returns:
+            픽셀 수
+        """
+        return int(self.column_prefix[-1, self._field(value)])
+
+    def ratio(self, value: int) -> float:
+        """
+        전체 대비 비율
+
+        Args:
+            value: 픽셀 값
+
+        Returns:
+            0.0 ~ 1.0
+        """
+        return self.total(value) / self.size if self.size else 0.0
+
+    def count(self, value: int, x_start: int = 0, x_end: Optional[int] = None) -> int:
+        """
+        열 범위 [x_start, x_end)의 픽셀 수 (전체 높이)
+
+        Args:
+            value: 픽셀 값
+            x_start: 시작 열
+            x_end: 끝 열 (포함 안 함, None이면 끝까지)
+
+        Returns:
+            픽셀 수
+        """
+        field = self._field(value)
+        x_start, x_end = self._clip(x_start, x_end, self.width)
+        prefix = self.column_prefix[:, field]
+        return int(prefix[x_end] - prefix[x_start])
+
+    def band_count(
+        self, value: int, y_start: int = 0, y_end: Optional[int] = None
+    ) -> int:
+        """
+        행 범위 [y_start, y_end)의 픽셀 수 (전체 너비)
+
+        Args:
+            value: 픽셀 값
+            y_start: 시작 행
+            y_end: 끝 행 (포함 안 함, None이면 끝까지)
+
+        Returns:
+            픽셀 수
+        """
+        if self._row_prefix is None:
+            packed = cv2.reduce(
+                cv2.LUT(self.mask, self._table), 1, cv2.REDUCE_SUM
+            ).ravel()
+            self._row_prefix = np.zeros((self.height + 1, len(self.values)), np.int64)
+            np.cumsum(self._unpack(packed), axis=0, out=self._row_prefix[1:])
+
+        field = self._field(value)
+        y_start, y_end = self._clip(y_start, y_end, self.height)
+        prefix = self._row_prefix[:, field]
+        return int(prefix[y_end] - prefix[y_start])
+
+    def block_counts(self, value: int, x_bounds: Sequence[int]) -> np.ndarray:
+        """
+        밴드(row_bands) × 열 범위별 픽셀 수
+
+        Args:
+            value: 픽셀 값
+            x_bounds: 오름차순 열 경계 (예: [0, w/3, 2w/3, w])
+
+        Returns:
+            (밴드 수, 경계 수 - 1) int64 개수
+
+        Raises:
+            ValueError: row_bands 없이 계산한 통계
+        """
+        if self.band_prefix is None:
+            raise ValueError("row_bands 없이 계산한 통계입니다")
+        prefix = self.band_prefix[:, :, self._field(value)]
+        bounds = np.asarray(x_bounds)
+        return prefix[:, bounds[1:]] - prefix[:, bounds[:-1]]
+
+    def centroid_x(
+        self, value: int, x_start: int = 0, x_end: Optional[int] = None
+    ) -> Optional[float]:
+        """
+        열 범위 [x_start, x_end)에서 값 픽셀의 X 무게중심 (cv2.moments m10/m00)
+
+        Args:
+            value: 픽셀 값
+            x_start: 시작 열
+            x_end: 끝 열 (포함 안 함, None이면 끝까지)
+
+        Returns:
+            X 좌표 (이미지 기준) 또는 None (픽셀 없음)
+        """
+        field = self._field(value)
+        x_start, x_end = self._clip(x_start, x_end, self.width)
+        count = self.column_prefix[x_end, field] - self.column_prefix[x_start, field]
+        if count <= 0:
+            return None
+        moment = (
+            self.weighted_prefix[x_end, field] - self.weighted_prefix[x_start, field]
+        )
+        # 범위 시작 기준 무게중심 + 시작 열 (잘라낸 마스크의 moments와 같은 계산)
+        return x_start + (moment - x_start * count) / count
+
+    # ----- 내부 구현 -----
+    def _field(self, value: int) -> int:
+        """값 → 필드 번호"""
+        try:
+            return self.values.index(value)
+        except ValueError:
+            raise ValueError(f"집계하지 않은 값: {value} (집계: {self.values})")
+
+    def _unpack(self, packed: np.ndarray) -> np.ndarray:
+        """필드 묶음 합계 → (N, 값 개수) 개수"""
+        return unpack_fields(packed, len(self.values), self.FIELD_BITS)
+
+    @staticmethod
+    def _clip(start: int, end: Optional[int], limit: int) -> Tuple[int, int]:
+        """범위를 [0, limit]로 제한 (슬라이싱과 같은 규칙)"""
+        end = limit if end is None else min(max(end, 0), limit)
+        start = min(max(start, 0), limit)
+        return start, max(start, end)
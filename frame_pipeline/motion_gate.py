@@ -0,0 +1,147 @@
+"""
+움직임 게이트 모듈
+
+프레임을 작은 그레이스케일 썸네일로 줄여 마지막으로 분석한 프레임과 비교하고,
+장면이 거의 바뀌지 않았으면 이전 판단을 재사용하도록 알려줍니다.
+(정지/저속 주행 시 거의 같은 프레임을 매번 전체 분석하지 않음)
+
+재사용은 연속 max_reuse_age 프레임까지만 허용하므로
+판단 결과가 그보다 오래되는 일은 없습니다.
+
+기준 프레임과 연속 재사용 수는 스레드별로 분리합니다 (FrameArena와 같은 규칙).
+한 게이트를 여러 소비자 스레드가 함께 써도 다른 스레드의 판단을 재사용하지 않습니다.
+"""
+
+import threading
+from typing import Any, Dict, Tuple
+
+import cv2
+import numpy as np
+
+
+class MotionGate:
+    """썸네일 차이 기반 변화 감지 (이전 판단 재사용 여부, 스레드별 기준 프레임)"""
+
+    def __init__(
+        self,
+        pixel_threshold: int = 10,
+        max_changed_ratio: float = 0.01,
+        max_reuse_age: int = 3,
+        size: Tuple[int, int] = (40, 30),
+    ):
+        """
+        움직임 게이트 초기화
+
+        Args:
+            pixel_threshold: 썸네일 픽셀이 바뀌었다고 볼 밝기 차이
+                (JPEG 노이즈는 썸네일에서 2~3 이하)
+            max_changed_ratio: 재사용을 허용할 바뀐 픽셀 비율 상한
+            max_reuse_age: 연속 재사용 최대 프레임 수 (이후 반드시 전체 분석)
+            size: 썸네일 크기 (가로, 세로)
+        """
+        self.pixel_threshold = pixel_threshold
+        self.max_changed_ratio = max_changed_ratio
+        self.max_reuse_age = max_reuse_age
+        self.size = size
+
+        self._local = threading.local()  # 스레드마다 기준 프레임/버퍼/재사용 수
+        self.last_changed_ratio = 0.0  # 마지막 비교 결과 (모든 스레드 공용)
+        self.stats = {"checked": 0, "reused": 0}
+        self._lock = threading.Lock()  # 통계 갱신용
+
+    @property
+    def reuse_age(self) -> int:
+        """현재 스레드의 연속 재사용 프레임 수"""
+        return self._state().reuse_age
+
+    def should_reuse(self, image: np.ndarray) -> bool:
+        """
+        이전 판단 재사용 여부 판단
+
+        False를 반환하면 이 프레임을 현재 스레드의 새 기준으로 삼습니다
+        (호출자가 전체 분석).
+
+        Args:
+            image: 원본 이미지 (BGR 또는 그레이스케일)
+
+        Returns:
+            True: 장면 변화 없음 (이전 판단 재사용), False: 전체 분석 필요
+        """
+        state = self._state()
+        thumbnail = self._make_thumbnail(state, image)
+        reused = False
+
+        if state.reference is not None and state.reuse_age < self.max_reuse_age:
+            cv2.absdiff(thumbnail, state.reference, dst=state.diff)
+            cv2.threshold(
+                state.diff,
+                self.pixel_threshold,
+                255,
+                cv2.THRESH_BINARY,
+                dst=state.diff,
+            )
+            changed = cv2.countNonZero(state.diff) / state.diff.size
+            self.last_changed_ratio = changed
+            reused = changed <= self.max_changed_ratio
+
+        if reused:
+            state.reuse_age += 1
+        else:
+            # 전체 분석: 이 프레임이 새 기준
+            if state.reference is None:
+                state.reference = thumbnail.copy()
+            else:
+                np.copyto(state.reference, thumbnail)
+            state.reuse_age = 0
+
+        with self._lock:
+            self.stats["checked"] += 1
+            self.stats["reused"] += reused
+        return reused
+
+    def reset(self):
+        """
+        현재 스레드의 기준 프레임 삭제
+        (다음 프레임은 반드시 전체 분석, 분석 실패 시 호출)
+        """
+        state = self._state()
+        state.reference = None
+        state.reuse_age = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        통계 조회
+
+        Returns:
+            {"checked", "reused", "reuse_ratio", "max_reuse_age", "last_changed_ratio"}
+        """
+        checked = self.stats["checked"]
+        return {
+            "checked": checked,
+            "reused": self.stats["reused"],
+            "reuse_ratio": self.stats["reused"] / checked if checked else 0.0,
+            "max_reuse_age": self.max_reuse_age,
+            "last_changed_ratio": round(self.last_changed_ratio, 4),
+        }
+
+    def _state(self) -> threading.local:
+        """현재 스레드의 게이트 상태 (처음 호출 시 생성)"""
+        state = self._local
+        if not hasattr(state, "reference"):
+            state.reference = None  # 마지막 분석 프레임 썸네일
+            state.thumbnail = np.empty((self.size[1], self.size[0]), dtype=np.uint8)
+            state.gray = None
+            state.diff = np.empty_like(state.thumbnail)
+            state.reuse_age = 0
+        return state
+
+    def _make_thumbnail(self, state: threading.local, image: np.ndarray) -> np.ndarray:
+        """그레이스케일 썸네일 생성 (면적 평균 축소, 스레드별 재사용 버퍼)"""
+        if image.ndim == 3:
+            shape = image.shape[:2]
+            if state.gray is None or state.gray.shape != shape:
+                state.gray = np.empty(shape, dtype=np.uint8)
+            image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY, dst=state.gray)
+        return cv2.resize(
+            image, self.size, dst=state.thumbnail, interpolation=cv2.INTER_AREA
+        )
@@ -0,0 +1,24 @@
+"""
+프레임 소스 공용 패키지
+ESP32-CAM 프레임 입출력(스트림 파싱, 녹화/재생 등)을 free_car, frontend, line_tracking이 함께 사용
+"""
+
+from .base import FrameSource
+from .esp32 import MJPEGStreamFrameSource, PollingFrameSource, create_session
+from .mjpeg_parser import MJPEGParser
+from .recording import FrameRecorder, RecordingReader
+from .replay import REPLAY_MODES, ReplayFrameSource
+from .synthetic import SyntheticFrameSource
+
+__all__ = [
+    "FrameSource",
+    "PollingFrameSource",
+    "MJPEGStreamFrameSource",
+    "create_session",
+    "MJPEGParser",
+    "FrameRecorder",
+    "RecordingReader",
+    "REPLAY_MODES",
+    "ReplayFrameSource",
+    "SyntheticFrameSource",
+]
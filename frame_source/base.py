@@ -0,0 +1,163 @@
+"""
+프레임 소스 기본 클래스
+
+자율주행 루프는 ESP32 제너레이터 대신 FrameSource를 순회하여 BGR 이미지를 받습니다.
+실시간 카메라(is_live=True)가 아닌 소스는 연결 확인/명령 전송/FPS 제한 없이
+소스가 정한 타이밍대로 처리됩니다.
+
+모든 소스는 마지막으로 반환한 프레임의 정보를 같은 속성으로 제공합니다:
+index, jpeg, timestamp, latency_ms, decode_ms
+"""
+
+import time
+from typing import Callable, Iterator, Optional, Union
+
+import cv2
+import numpy as np
+
+# 축소 디코딩 배율 → imdecode 플래그 (JPEG DCT 단계에서 축소, 전체 디코딩보다 빠름)
+DECODE_FLAGS = {
+    1: cv2.IMREAD_COLOR,
+    2: cv2.IMREAD_REDUCED_COLOR_2,
+    4: cv2.IMREAD_REDUCED_COLOR_4,
+    8: cv2.IMREAD_REDUCED_COLOR_8,
+}
+
+
+class FrameSource:
+    """프레임 소스 인터페이스 (for image in source: ... 또는 source.run(callback))"""
+
+    # 실제 카메라에서 오는 프레임인지 (False면 오프라인 재생/합성)
+    is_live = False
+
+    def __init__(self, scale: int = 1):
+        """
+        프레임 정보 초기화 (마지막으로 반환한 프레임 기준)
+
+        Args:
+            scale: JPEG 축소 디코딩 배율 (1, 2, 4, 8)
+
+        Raises:
+            ValueError: 지원하지 않는 배율
+        """
+        if scale not in DECODE_FLAGS:
+            raise ValueError(f"지원하지 않는 디코딩 배율: {scale} (가능: 1, 2, 4, 8)")
+        self.scale = scale
+        self._decode_flag = DECODE_FLAGS[scale]
+
+        self.index = -1  # 프레임 번호
+        self.jpeg: Optional[memoryview] = None  # 원본 JPEG (있으면)
+        self.timestamp = 0.0  # 캡처 시각 (epoch 초)
+        self.latency_ms = 0.0  # 캡처 지연 (ms)
+        self.decode_ms = 0.0  # 디코딩 시간 (ms)
+
+        self.stats = {
+            "frames": 0,
+            "errors": 0,  # 수신/디코딩 실패
+            "total_latency_ms": 0.0,
+            "total_decode_ms": 0.0,
+            "start_time": None,
+        }
+
+    def frames(self) -> Iterator[np.ndarray]:
+        """
+        프레임 생성
+
+        Yields:
+            이미지 (BGR)
+        """
+        raise NotImplementedError
+
+    def run(
+        self,
+        callback: Callable[[np.ndarray, "FrameSource"], Optional[bool]],
+        max_frames: Optional[int] = None,
+    ) -> int:
+        """
+        프레임마다 callback(image, source) 호출 (콜백 방식)
+
+        Args:
+            callback: 프레임 처리 함수 (False를 반환하면 중단)
+            max_frames: 최대 처리 프레임 수 (None이면 소스가 끝날 때까지)
+
+        Returns:
+            처리한 프레임 수
+        """
+        count = 0
+        for image in self:
+            count += 1
+            if callback(image, self) is False:
+                break
+            if max_frames is not None and count >= max_frames:
+                break
+        return count
+
+    def get_stats(self) -> dict:
+        """
+        소스 통계
+
+        Returns:
+            통계 딕셔너리 (처리량 fps 포함)
+        """
+        frames = self.stats["frames"]
+        start_time = self.stats["start_time"]
+        elapsed = time.time() - start_time if start_time else 0
+
+        return {
+            "frames": frames,
+            "errors": self.stats["errors"],
+            "avg_latency_ms": self.stats["total_latency_ms"] / frames if frames else 0,
+            "avg_decode_ms": self.stats["total_decode_ms"] / frames if frames else 0,
+            "elapsed": elapsed,
+            "fps": frames / elapsed if elapsed > 0 else 0,
+        }
+
+    def close(self):
+        """리소스 정리"""
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        if self.stats["start_time"] is None:
+            self.stats["start_time"] = time.time()
+        return self.frames()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    # ----- 하위 클래스용 -----
+    def decode(self, jpeg: Union[bytes, memoryview]) -> Optional[np.ndarray]:
+        """
+        JPEG 디코딩 (scale 배율 적용, decode_ms 갱신)
+
+        Args:
+            jpeg: JPEG 바이트
+
+        Returns:
+            이미지 (BGR) 또는 None
+        """
+        decode_start = time.time()
+        image = cv2.imdecode(np.frombuffer(jpeg, np.uint8), self._decode_flag)
+        self.decode_ms = (time.time() - decode_start) * 1000
+        if image is None or image.size == 0:
+            self.stats["errors"] += 1
+            return None
+        return image
+
+    def _publish(
+        self,
+        jpeg: Optional[Union[bytes, memoryview]],
+        timestamp: float,
+        latency_ms: float = 0.0,
+        index: Optional[int] = None,
+    ):
+        """반환할 프레임의 정보 갱신 및 통계 누적"""
+        self.index = self.index + 1 if index is None else index
+        self.jpeg = memoryview(jpeg) if isinstance(jpeg, bytes) else jpeg
+        self.timestamp = timestamp
+        self.latency_ms = latency_ms
+
+        self.stats["frames"] += 1
+        self.stats["total_latency_ms"] += latency_ms
+        self.stats["total_decode_ms"] += self.decode_ms
@@ -0,0 +1,295 @@
+"""
+ESP32-CAM 실시간 프레임 소스
+
+- PollingFrameSource: /capture 주기적 호출 (keep-alive 세션 재사용)
+- MJPEGStreamFrameSource: /stream multipart 스트림 (MJPEGParser, 복사 없는 분리)
+
+두 소스 모두 수신한 원본 JPEG를 FrameRecorder에 기록할 수 있고,
+scale 배율로 축소 디코딩할 수 있습니다.
+"""
+
+import logging
+import time
+from typing import Iterator, Optional, Tuple, Union
+
+import numpy as np
+import requests
+from requests.adapters import HTTPAdapter
+
+from .base import FrameSource
+from .mjpeg_parser import MJPEGParser
+from .recording import FrameRecorder
+
+logger = logging.getLogger(__name__)
+
+NO_CACHE_HEADERS = {"Cache-Control": "no-cache", "Pragma": "no-cache"}
+
+
+def create_session(pool_size: int = 1) -> requests.Session:
+    """
+    keep-alive 연결 풀 세션 생성 (재시도 없음, 실패는 호출 측에서 처리)
+
+    Args:
+        pool_size: 연결 풀 크기
+
+    Returns:
+        requests.Session
+    """
+    session = requests.Session()
+    session.mount(
+        "http://",
+        HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=0),
+    )
+    return session
+
+
+class PollingFrameSource(FrameSource):
+    """/capture 폴링 소스"""
+
+    is_live = True
+
+    # 연속 실패 시 대기 (초)
+    ERROR_BACKOFF = 0.1
+    # 이 시간 동안 성공이 없으면 세션 재생성 (초)
+    SESSION_RESET_AFTER = 5.0
+
+    def __init__(
+        self,
+        capture_url: str,
+        fps: Optional[float] = None,
+        timeout: float = 2.0,
+        session: Optional[requests.Session] = None,
+        recorder: Optional[FrameRecorder] = None,
+        scale: int = 1,
+    ):
+        """
+        폴링 소스 초기화
+
+        Args:
+            capture_url: /capture URL (예: http://192.168.0.65/capture)
+            fps: 최대 폴링 속도 (None이면 응답 즉시 다음 요청)
+            timeout: 요청 타임아웃 (초)
+            session: 사용할 세션 (None이면 전용 keep-alive 세션 생성)
+            recorder: 수신한 JPEG를 기록할 녹화기 (None이면 기록 안 함)
+            scale: JPEG 축소 디코딩 배율 (1, 2, 4, 8)
+        """
+        super().__init__(scale)
+        self.capture_url = capture_url
+        self.fps = fps
+        self.timeout = timeout
+        self.session = session or create_session()
+        # 직접 만든 세션만 재설정 시 닫고 다시 생성 (주입받은 세션은 호출 측 소유)
+        self._owns_session = session is None
+        self.recorder = recorder
+        self._closed = False
+
+    def read(self) -> Optional[np.ndarray]:
+        """
+        프레임 한 장 캡처 (성공 시 프레임 정보 갱신)
+
+        Returns:
+            이미지 (BGR) 또는 None
+        """
+        try:
+            # 타임스탬프 파라미터로 캐시된 응답 방지
+            request_start = time.time()
+            response = self.session.get(
+                self.capture_url,
+                params={"t": int(request_start * 1000)},
+                headers=NO_CACHE_HEADERS,
+                timeout=self.timeout,
+            )
+            captured_at = time.time()
+        except requests.exceptions.RequestException as e:
+            logger.debug(f"캡처 실패: {e}")
+            self.stats["errors"] += 1
+            return None
+
+        if response.status_code != 200 or not response.content:
+            logger.debug(f"캡처 실패: HTTP {response.status_code}")
+            self.stats["errors"] += 1
+            return None
+
+        jpeg = response.content
+        latency_ms = (captured_at - request_start) * 1000
+        if self.recorder is not None:
+            self.recorder.record(jpeg, captured_at, latency_ms)
+
+        image = self.decode(jpeg)
+        if image is None:
+            return None
+
+        self._publish(jpeg, captured_at, latency_ms)
+        return image
+
+    def frames(self) -> Iterator[np.ndarray]:
+        """
+        fps 주기로 캡처한 프레임 생성 (실패한 캡처는 건너뜀)
+
+        Yields:
+            이미지 (BGR)
+        """
+        interval = 1.0 / self.fps if self.fps else 0.0
+        last_success = time.time()
+        failures = 0
+
+        while not self._closed:
+            start = time.time()
+            image = self.read()
+
+            if image is not None:
+                failures = 0
+                last_success = time.time()
+                yield image
+            else:
+                failures += 1
+                if failures > 3:
+                    time.sleep(self.ERROR_BACKOFF)
+                if time.time() - last_success > self.SESSION_RESET_AFTER:
+                    self._reset_session()
+                    last_success = time.time()
+                    failures = 0
+
+            remaining = interval - (time.time() - start)
+            if remaining > 0:
+                time.sleep(remaining)
+
+    def close(self):
+        """폴링 중지"""
+        self._closed = True
+
+    # ----- 내부 구현 -----
+    def _reset_session(self):
+        """캡처 실패가 이어질 때 세션 재설정 (소유한 세션만 다시 생성)"""
+        if not self._owns_session:
+            logger.warning("🔄 캡처 실패 지속 - 주입된 세션은 유지")
+            return
+        logger.warning("🔄 캡처 실패 지속 - 세션 재설정")
+        old_session, self.session = self.session, create_session()
+        old_session.close()  # 이전 세션의 연결 풀 정리
+
+
+class MJPEGStreamFrameSource(FrameSource):
+    """/stream MJPEG 스트림 소스"""
+
+    is_live = True
+
+    def __init__(
+        self,
+        stream_url: str,
+        timeout: Union[float, Tuple[float, float]] = (5, 5),
+        chunk_size: int = 4096,
+        stall_timeout: float = 30.0,
+        reconnect: bool = True,
+        reconnect_delay: float = 1.0,
+        session: Optional[requests.Session] = None,
+        recorder: Optional[FrameRecorder] = None,
+        scale: int = 1,
+    ):
+        """
+        스트림 소스 초기화
+
+        Args:
+            stream_url: /stream URL (예: http://192.168.0.65/stream)
+            timeout: (연결, 읽기) 타임아웃 (초)
+            chunk_size: 수신 청크 크기
+            stall_timeout: 데이터가 이 시간 이상 없으면 연결 종료 (초)
+            reconnect: 연결이 끊기면 다시 연결
+            reconnect_delay: 재연결 전 대기 (초)
+            session: 사용할 세션 (None이면 requests 기본)
+            recorder: 수신한 JPEG를 기록할 녹화기 (None이면 기록 안 함)
+            scale: JPEG 축소 디코딩 배율 (1, 2, 4, 8)
+        """
+        super().__init__(scale)
+        self.stream_url = stream_url
+        self.timeout = timeout
+        self.chunk_size = chunk_size
+        self.stall_timeout = stall_timeout
+        self.reconnect = reconnect
+        self.reconnect_delay = reconnect_delay
+        self.session = session or requests
+        self.recorder = recorder
+
+        self.parser: Optional[MJPEGParser] = None
+        self._response = None
+        self._closed = False
+        self.stats["connections"] = 0
+
+    def frames(self) -> Iterator[np.ndarray]:
+        """
+        스트림 프레임 생성 (jpeg는 다음 프레임을 받기 전까지만 유효)
+
+        Yields:
+            이미지 (BGR)
+        """
+        while not self._closed:
+            try:
+                yield from self._read_stream()
+            except requests.exceptions.RequestException as e:
+                logger.error(f"스트림 오류: {e}")
+                self.stats["errors"] += 1
+            finally:
+                self._close_response()
+
+            if self._closed or not self.reconnect:
+                break
+            logger.info("스트림 재연결 중...")
+            time.sleep(self.reconnect_delay)
+
+    def restart(self):
+        """현재 연결을 끊고 다시 연결 (reconnect=True일 때)"""
+        self._close_response()
+
+    def close(self):
+        """스트림 종료"""
+        self._closed = True
+        self._close_response()
+
+    # ----- 내부 구현 -----
+    def _read_stream(self) -> Iterator[np.ndarray]:
+        """연결 하나에서 프레임 생성"""
+        logger.info(f"스트림 연결: {self.stream_url}")
+        response = self.session.get(
+            self.stream_url,
+            stream=True,
+            timeout=self.timeout,
+            headers={"Accept": "multipart/x-mixed-replace"},
+        )
+        self._response = response
+        if response.status_code != 200:
+            logger.error(f"스트림 연결 실패: HTTP {response.status_code}")
+            self.stats["errors"] += 1
+            return
+        self.stats["connections"] += 1
+
+        # boundary/Content-Length 기반 파서 (버퍼 재검색 없음)
+        self.parser = MJPEGParser(
+            MJPEGParser.boundary_from_content_type(response.headers.get("Content-Type"))
+        )
+        last_data_time = time.time()
+
+        for chunk in response.iter_content(chunk_size=self.chunk_size):
+            if not chunk:
+                if time.time() - last_data_time > self.stall_timeout:
+                    logger.warning("스트림 데이터 없음 - 연결 종료")
+                    break
+                continue
+            last_data_time = time.time()
+
+            for jpeg in self.parser.feed(chunk):
+                # 스트림은 요청 단위 지연이 없으므로 0
+                if self.recorder is not None:
+                    self.recorder.record(jpeg, last_data_time)
+
+                # 파서 버퍼를 복사 없이 디코딩
+                image = self.decode(jpeg)
+                if image is None:
+                    continue
+                self._publish(jpeg, last_data_time)
+                yield image
+
+    def _close_response(self):
+        """현재 응답 연결 닫기"""
+        response, self._response = self._response, None
+        if response is not None:
+            response.close()
@@ -0,0 +1,274 @@
+"""
+MJPEG multipart 스트림 파서
+
+ESP32-CAM /stream (multipart/x-mixed-replace) 응답을 JPEG 프레임 단위로
+분리합니다. 미리 할당한 bytearray 버퍼에 청크를 이어 붙이고, 이전에 검색을
+멈춘 위치부터 다시 검색하므로 프레임 크기에 대해 선형 시간으로 동작합니다.
+
+- boundary를 알면 파트 헤더의 Content-Length를 우선 사용합니다.
+- Content-Length가 없으면 JPEG 끝 마커(FFD9)를 이어서 검색합니다.
+- boundary를 모르면 JPEG 시작/끝 마커(FFD8/FFD9)만으로 분리합니다.
+
+반환되는 프레임은 내부 버퍼의 memoryview(복사 없음)이며,
+다음 feed() 호출 전까지만 유효합니다.
+"""
+
+import re
+from typing import Iterable, Iterator, Optional
+
+JPEG_SOI = b"\xff\xd8"  # JPEG 시작 마커
+JPEG_EOI = b"\xff\xd9"  # JPEG 끝 마커
+HEADER_END = b"\r\n\r\n"
+
+_CONTENT_LENGTH_RE = re.compile(rb"content-length:\s*(\d+)", re.IGNORECASE)
+_BOUNDARY_RE = re.compile(r'boundary="?([^";]+)"?', re.IGNORECASE)
+
+
+class MJPEGParser:
+    """MJPEG multipart 스트림 → JPEG 프레임(memoryview) 파서"""
+
+    DEFAULT_BUFFER_SIZE = 256 * 1024  # 초기 버퍼 크기 (QVGA~VGA JPEG 수 장)
+    MAX_BUFFER_SIZE = 8 * 1024 * 1024  # 이 이상이면 스트림 손상으로 보고 리셋
+    MIN_FRAME_SIZE = 100  # 너무 작은 JPEG 무시
+
+    # 파서 상태
+    _SEEK_PART = 0  # 다음 파트(boundary 또는 SOI) 검색 중
+    _READ_BODY = 1  # JPEG 본문 수신 중
+
+    def __init__(
+        self,
+        boundary: Optional[bytes] = None,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        max_buffer_size: int = MAX_BUFFER_SIZE,
+    ):
+        """
+        파서 초기화
+
+        Args:
+            boundary: multipart boundary (앞의 "--" 제외, None이면 마커 검색)
+            buffer_size: 초기 버퍼 크기 (바이트)
+            max_buffer_size: 최대 버퍼 크기 (초과 시 버퍼 리셋)
+        """
+        if isinstance(boundary, str):
+            boundary = boundary.encode("ascii")
+        if boundary is not None and boundary.startswith(b"--"):
+            boundary = boundary[2:]
+
+        self.delimiter = b"--" + boundary if boundary else None
+        self.max_buffer_size = max_buffer_size
+
+        self._buf = bytearray(buffer_size)
+        self._view = memoryview(self._buf)
+        self._start = 0  # 아직 소비하지 않은 데이터 시작
+        self._end = 0  # 데이터 끝 (다음 쓰기 위치)
+
+        self._state = self._SEEK_PART
+        self._scan = 0  # 검색 재개 위치
+        self._body_start = 0
+        self._body_length: Optional[int] = None
+
+        self.stats = {
+            "frames": 0,
+            "bytes_in": 0,
+            "skipped_frames": 0,  # 너무 작거나 JPEG가 아닌 파트
+            "resets": 0,  # 버퍼 초과로 인한 리셋
+            "compactions": 0,
+            "buffer_size": buffer_size,
+        }
+
+    @staticmethod
+    def boundary_from_content_type(content_type: Optional[str]) -> Optional[bytes]:
+        """
+        Content-Type 헤더에서 boundary 추출
+
+        Args:
+            content_type: 예) "multipart/x-mixed-replace; boundary=frame"
+
+        Returns:
+            boundary 바이트 또는 None
+        """
+        if not content_type:
+            return None
+        match = _BOUNDARY_RE.search(content_type)
+        if not match:
+            return None
+        return match.group(1).strip().encode("ascii")
+
+    def reset(self):
+        """버퍼와 파서 상태 초기화"""
+        self._start = 0
+        self._end = 0
+        self._scan = 0
+        self._state = self._SEEK_PART
+        self._body_length = None
+
+    def iter_frames(self, chunks: Iterable[bytes]) -> Iterator[memoryview]:
+        """
+        청크 iterable(예: response.iter_content())에서 프레임 생성
+
+        Args:
+            chunks: 바이트 청크 iterable
+
+        Yields:
+            JPEG 프레임 memoryview (다음 청크를 읽기 전까지 유효)
+        """
+        for chunk in chunks:
+            if chunk:
+                yield from self.feed(chunk)
+
+    def feed(self, chunk: bytes) -> Iterator[memoryview]:
+        """
+        청크 추가 후 완성된 프레임 생성
+
+        Args:
+            chunk: 수신한 바이트
+
+        Yields:
+            JPEG 프레임 memoryview (다음 feed() 호출 전까지 유효)
+        """
+        self._append(chunk)
+
+        while True:
+            if self._state == self._SEEK_PART:
+                if not self._seek_part():
+                    break
+            frame = self._read_body()
+            if frame is None:
+                break
+            if len(frame) < self.MIN_FRAME_SIZE or frame[:2] != JPEG_SOI:
+                self.stats["skipped_frames"] += 1
+                continue
+            self.stats["frames"] += 1
+            yield frame
+
+    # ----- 내부 구현 -----
+    def _append(self, chunk: bytes):
+        """버퍼 끝에 청크 복사 (필요하면 압축/확장)"""
+        size = len(chunk)
+        self.stats["bytes_in"] += size
+
+        if self._end + size > len(self._buf):
+            self._compact()
+        if self._end + size > len(self._buf):
+            pending = self._end - self._start + size
+            if pending > self.max_buffer_size:
+                # 프레임 경계를 찾지 못한 채 너무 커짐 → 손상된 스트림
+                self.stats["resets"] += 1
+                self.reset()
+            else:
+                self._grow(pending)
+
+        if size > len(self._buf):
+            # 리셋 후에도 청크가 버퍼보다 큰 경우
+            self._grow(size)
+
+        self._buf[self._end : self._end + size] = chunk
+        self._end += size
+
+    def _compact(self):
+        """미소비 데이터를 버퍼 앞으로 이동 (남은 부분 프레임만 복사됨)"""
+        offset = self._start
+        if offset == 0:
+            return
+        length = self._end - offset
+        remaining = self._view[offset : self._end]
+        if length > offset:
+            # 원본/대상 영역이 겹치면 임시 복사본을 거쳐 이동
+            remaining = remaining.tobytes()
+        self._buf[0:length] = remaining
+        self._start = 0
+        self._end = length
+        self._scan -= offset
+        self._body_start = max(0, self._body_start - offset)
+        self.stats["compactions"] += 1
+
+    def _grow(self, required: int):
+        """버퍼 확장 (이미 내보낸 memoryview는 이전 버퍼를 계속 참조)"""
+        new_size = len(self._buf)
+        while new_size < required:
+            new_size *= 2
+        new_buf = bytearray(new_size)
+        length = self._end - self._start
+        new_buf[0:length] = self._view[self._start : self._end]
+
+        self._scan -= self._start
+        self._body_start = max(0, self._body_start - self._start)
+        self._buf = new_buf
+        self._view = memoryview(new_buf)
+        self._start = 0
+        self._end = length
+        self.stats["buffer_size"] = new_size
+
+    def _seek_part(self) -> bool:
+        """
+        다음 파트의 본문 시작 위치 찾기
+
+        Returns:
+            본문 시작을 찾았으면 True (상태가 _READ_BODY로 바뀜)
+        """
+        if self.delimiter is None:
+            return self._seek_soi()
+
+        buf = self._buf
+        pos = buf.find(self.delimiter, self._scan, self._end)
+        if pos == -1:
+            # 경계 문자열이 청크 사이에 걸칠 수 있으므로 꼬리는 남겨 둠
+            keep = len(self.delimiter) - 1
+            self._start = max(self._start, self._end - keep)
+            self._scan = self._start
+            return False
+
+        # 경계 이전 데이터(이전 파트의 CRLF 등)는 버림
+        self._start = pos
+        header_end = buf.find(HEADER_END, pos, self._end)
+        if header_end == -1:
+            self._scan = pos
+            return False
+
+        match = _CONTENT_LENGTH_RE.search(self._view[pos:header_end].tobytes())
+        self._body_start = header_end + len(HEADER_END)
+        self._body_length = int(match.group(1)) if match else None
+        self._scan = self._body_start
+        self._state = self._READ_BODY
+        return True
+
+    def _seek_soi(self) -> bool:
+        """boundary 없이 JPEG 시작 마커 찾기"""
+        pos = self._buf.find(JPEG_SOI, self._scan, self._end)
+        if pos == -1:
+            # 마커가 청크 경계에 걸칠 수 있으므로 마지막 1바이트는 남겨 둠
+            self._start = max(self._start, self._end - 1)
+            self._scan = self._start
+            return False
+
+        self._start = pos
+        self._body_start = pos
+        self._body_length = None
+        self._scan = pos + len(JPEG_SOI)
+        self._state = self._READ_BODY
+        return True
+
+    def _read_body(self) -> Optional[memoryview]:
+        """
+        현재 파트의 JPEG 본문 읽기
+
+        Returns:
+            완성된 프레임 memoryview 또는 None (데이터 부족)
+        """
+        if self._body_length is not None:
+            frame_end = self._body_start + self._body_length
+            if frame_end > self._end:
+                return None
+        else:
+            pos = self._buf.find(JPEG_EOI, self._scan, self._end)
+            if pos == -1:
+                # 끝 마커가 청크 경계에 걸칠 수 있으므로 1바이트 앞부터 재검색
+                self._scan = max(self._body_start, self._end - 1)
+                return None
+            frame_end = pos + len(JPEG_EOI)
+
+        frame = self._view[self._body_start : frame_end]
+        self._start = frame_end
+        self._scan = frame_end
+        self._state = self._SEEK_PART
+        return frame
@@ -0,0 +1,344 @@
+"""
+프레임 녹화/재생 파일 포맷
+
+주행 세션의 원본 JPEG와 캡처 정보를 하나의 append-only 파일에 저장합니다.
+트랙 없이도 파이프라인을 벤치마크/회귀 테스트할 수 있도록
+30분 세션도 메모리에 올리지 않고 mmap으로 탐색/슬라이스할 수 있습니다.
+
+파일 구조:
+    [파일 헤더]  FILE_MAGIC (8바이트)
+    [레코드 N개] RECORD_HEADER (28바이트) + JPEG 바이트
+    [인덱스]     INDEX_DTYPE 배열 (레코드당 32바이트, 고정 폭)
+    [트레일러]   인덱스 오프셋, 레코드 수, INDEX_MAGIC (20바이트)
+
+레코드 헤더에도 같은 정보가 있으므로 비정상 종료로 인덱스가 없으면
+레코드를 순차 스캔하여 인덱스를 다시 만듭니다.
+"""
+
+import mmap
+import os
+import struct
+import time
+from typing import Optional, Union
+
+import numpy as np
+
+FILE_MAGIC = b"ESPREC01"
+RECORD_MAGIC = b"FRM0"
+INDEX_MAGIC = b"ESPIDX01"
+
+# magic, JPEG 길이, 캡처 시각(epoch 초), 캡처 지연(ms), 명령
+RECORD_HEADER = struct.Struct("<4sIdf8s")
+# 인덱스 오프셋, 레코드 수, magic
+TRAILER = struct.Struct("<QI8s")
+
+# 고정 폭 인덱스 항목 (np.frombuffer로 mmap에서 바로 읽음)
+INDEX_DTYPE = np.dtype(
+    [
+        ("offset", "<u8"),  # JPEG 데이터 시작 위치
+        ("length", "<u4"),  # JPEG 길이
+        ("timestamp", "<f8"),  # 캡처 시각 (epoch 초)
+        ("latency_ms", "<f4"),  # 캡처 지연 (ms)
+        ("command", "S8"),  # 해당 프레임에서 결정된 명령
+    ]
+)
+
+RECORDING_EXTENSION = ".esprec"
+
+
+class FrameRecorder:
+    """프레임 녹화기 (append-only)"""
+
+    def __init__(self, path: str, flush_interval: int = 30):
+        """
+        녹화 파일 생성
+
+        Args:
+            path: 녹화 파일 경로 (이미 있으면 덮어씀)
+            flush_interval: 이 프레임 수마다 디스크에 flush (비정상 종료 대비)
+        """
+        self.path = path
+        self.flush_interval = flush_interval
+
+        self._file = open(path, "wb")
+        self._file.write(FILE_MAGIC)
+        self._entries = []  # (offset, length, timestamp, latency_ms, command)
+
+        # 명령은 분석 후에 결정되므로 마지막 프레임은 다음 프레임까지 보류
+        self._pending = None
+
+    @classmethod
+    def create_in(cls, directory: str, prefix: str = "session") -> "FrameRecorder":
+        """
+        디렉토리에 타임스탬프 이름으로 녹화 파일 생성
+
+        Args:
+            directory: 저장 디렉토리 (없으면 생성)
+            prefix: 파일 이름 접두사
+
+        Returns:
+            FrameRecorder
+        """
+        os.makedirs(directory, exist_ok=True)
+        name = f"{prefix}_{time.strftime('%Y%m%d_%H%M%S')}{RECORDING_EXTENSION}"
+        return cls(os.path.join(directory, name))
+
+    @property
+    def frame_count(self) -> int:
+        return len(self._entries) + (1 if self._pending is not None else 0)
+
+    @property
+    def is_closed(self) -> bool:
+        return self._file is None
+
+    def record(
+        self,
+        jpeg: Union[bytes, memoryview],
+        timestamp: Optional[float] = None,
+        latency_ms: float = 0.0,
+    ):
+        """
+        프레임 추가 (명령은 set_command()로 나중에 지정)
+
+        Args:
+            jpeg: 원본 JPEG 바이트
+            timestamp: 캡처 시각 (None이면 현재 시각)
+            latency_ms: 캡처 지연 (ms)
+        """
+        if self._file is None:
+            return
+        self._flush_pending()
+        if isinstance(jpeg, memoryview) and not jpeg.readonly:
+            # 파서 버퍼 등 재사용되는 버퍼는 보류 중 덮어써질 수 있음
+            jpeg = jpeg.tobytes()
+        self._pending = [
+            jpeg,
+            time.time() if timestamp is None else timestamp,
+            latency_ms,
+            b"",
+        ]
+
+    def set_command(self, command: Optional[str]):
+        """
+        마지막으로 기록한 프레임에 결정된 명령 지정
+
+        Args:
+            command: "left", "right", "center", "stop" 등 (최대 8바이트)
+        """
+        if self._pending is not None and command:
+            self._pending[3] = command.encode("ascii", "replace")[:8]
+
+    def close(self):
+        """보류 프레임 기록 후 인덱스/트레일러를 쓰고 파일 닫기"""
+        if self._file is None:
+            return
+        self._flush_pending()
+
+        index = np.array(self._entries, dtype=INDEX_DTYPE)
+        index_offset = self._file.tell()
+        self._file.write(index.tobytes())
+        self._file.write(TRAILER.pack(index_offset, len(index), INDEX_MAGIC))
+        self._file.close()
+        self._file = None
+
+    def _flush_pending(self):
+        """보류 중인 프레임을 파일에 기록"""
+        if self._pending is None:
+            return
+        jpeg, timestamp, latency_ms, command = self._pending
+        self._pending = None
+
+        length = len(jpeg)
+        self._file.write(
+            RECORD_HEADER.pack(RECORD_MAGIC, length, timestamp, latency_ms, command)
+        )
+        offset = self._file.tell()
+        self._file.write(jpeg)
+        self._entries.append((offset, length, timestamp, latency_ms, command))
+
+        if len(self._entries) % self.flush_interval == 0:
+            self._file.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class RecordingReader:
+    """녹화 파일 리더 (mmap, 메모리에 전체를 올리지 않음)"""
+
+    def __init__(self, path: str):
+        """
+        녹화 파일 열기
+
+        Args:
+            path: 녹화 파일 경로
+
+        Raises:
+            ValueError: 녹화 파일 형식이 아닌 경우
+        """
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"빈 녹화 파일: {path}")
+
+        if self._mm[: len(FILE_MAGIC)] != FILE_MAGIC:
+            self.close()
+            raise ValueError(f"녹화 파일 형식이 아닙니다: {path}")
+
+        index = self._read_index()
+        self.recovered = index is None
+        self.index = index if index is not None else self._scan_records()
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """프레임별 캡처 시각 배열"""
+        return self.index["timestamp"]
+
+    @property
+    def duration(self) -> float:
+        """녹화 길이 (초)"""
+        if len(self.index) < 2:
+            return 0.0
+        return float(self.index["timestamp"][-1] - self.index["timestamp"][0])
+
+    def get_jpeg(self, i: int) -> memoryview:
+        """
+        i번째 프레임의 JPEG (mmap을 가리키는 memoryview, 복사 없음)
+
+        Args:
+            i: 프레임 번호
+
+        Returns:
+            JPEG memoryview
+        """
+        entry = self.index[i]
+        start = int(entry["offset"])
+        return memoryview(self._mm)[start : start + int(entry["length"])]
+
+    def get_frame(self, i: int) -> Optional[np.ndarray]:
+        """
+        i번째 프레임 디코딩
+
+        Args:
+            i: 프레임 번호
+
+        Returns:
+            이미지 (BGR) 또는 None
+        """
+        import cv2
+
+        data = np.frombuffer(self.get_jpeg(i), np.uint8)
+        return cv2.imdecode(data, cv2.IMREAD_COLOR)
+
+    def get_command(self, i: int) -> str:
+        """i번째 프레임에서 기록된 명령"""
+        return self.index[i]["command"].decode("ascii", "replace")
+
+    def find_frame(self, seconds: float) -> int:
+        """
+        녹화 시작 후 seconds초 이후의 첫 프레임 번호 (탐색용)
+
+        Args:
+            seconds: 녹화 시작 기준 상대 시간 (초)
+
+        Returns:
+            프레임 번호 (끝을 넘으면 len(self))
+        """
+        if len(self.index) == 0:
+            return 0
+        target = float(self.index["timestamp"][0]) + seconds
+        return int(np.searchsorted(self.index["timestamp"], target))
+
+    def save_slice(self, path: str, start: int, stop: Optional[int] = None) -> int:
+        """
+        프레임 구간을 새 녹화 파일로 저장
+
+        Args:
+            path: 저장 경로
+            start: 시작 프레임 번호
+            stop: 끝 프레임 번호 (포함 안 함, None이면 끝까지)
+
+        Returns:
+            저장된 프레임 수
+        """
+        entries = self.index[start:stop]
+        with FrameRecorder(path) as recorder:
+            for i, entry in enumerate(entries, start):
+                recorder.record(
+                    self.get_jpeg(i),
+                    float(entry["timestamp"]),
+                    float(entry["latency_ms"]),
+                )
+                recorder.set_command(self.get_command(i))
+        return len(entries)
+
+    def close(self):
+        """파일 닫기 (get_jpeg()로 받은 memoryview는 먼저 해제해야 함)"""
+        if self._mm is not None:
+            # mmap을 가리키는 인덱스 뷰를 해제해야 mmap을 닫을 수 있음
+            self.index = self.index.copy()
+            self._mm.close()
+            self._mm = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    # ----- 내부 구현 -----
+    def _read_index(self) -> Optional[np.ndarray]:
+        """
+        트레일러가 가리키는 인덱스를 mmap에서 바로 읽기
+
+        Returns:
+            인덱스 배열 (mmap 뷰) 또는 None (트레일러 없음/손상)
+        """
+        size = len(self._mm)
+        if size < len(FILE_MAGIC) + TRAILER.size:
+            return None
+
+        index_offset, count, magic = TRAILER.unpack_from(self._mm, size - TRAILER.size)
+        if magic != INDEX_MAGIC:
+            return None
+        if index_offset + count * INDEX_DTYPE.itemsize != size - TRAILER.size:
+            return None
+
+        return np.frombuffer(
+            self._mm, dtype=INDEX_DTYPE, count=count, offset=index_offset
+        )
+
+    def _scan_records(self) -> np.ndarray:
+        """
+        레코드 헤더를 순차 스캔하여 인덱스 재구성 (비정상 종료 복구)
+
+        Returns:
+            인덱스 배열
+        """
+        entries = []
+        pos = len(FILE_MAGIC)
+        size = len(self._mm)
+
+        while pos + RECORD_HEADER.size <= size:
+            magic, length, timestamp, latency_ms, command = RECORD_HEADER.unpack_from(
+                self._mm, pos
+            )
+            offset = pos + RECORD_HEADER.size
+            if magic != RECORD_MAGIC or offset + length > size:
+                break  # 잘린 마지막 레코드 또는 인덱스 시작
+            entries.append((offset, length, timestamp, latency_ms, command))
+            pos = offset + length
+
+        return np.array(entries, dtype=INDEX_DTYPE)
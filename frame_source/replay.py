@@ -0,0 +1,137 @@
+"""
+녹화 파일 재생 프레임 소스
+
+FrameRecorder로 녹화한 세션을 ESP32 없이 파이프라인에 흘려보냅니다.
+
+재생 모드:
+- "original": 녹화 당시 타이밍 그대로 (speed 배속 가능)
+- "fixed":    고정 FPS
+- "max":      대기 없이 최대 속도 (처리량 측정용)
+"""
+
+import time
+from typing import Iterator, Optional
+
+import numpy as np
+
+from .base import FrameSource
+from .recording import RecordingReader
+
+REPLAY_MODES = ("original", "fixed", "max")
+
+
+class ReplayFrameSource(FrameSource):
+    """녹화 파일 재생 소스"""
+
+    def __init__(
+        self,
+        path: str,
+        mode: str = "original",
+        fps: float = 10.0,
+        speed: float = 1.0,
+        start: int = 0,
+        stop: Optional[int] = None,
+        loop: bool = False,
+        scale: int = 1,
+    ):
+        """
+        재생 소스 초기화
+
+        Args:
+            path: 녹화 파일 경로 (.esprec)
+            mode: "original" | "fixed" | "max"
+            fps: fixed 모드 재생 FPS
+            speed: original 모드 배속 (2.0 = 2배 빠르게)
+            start: 시작 프레임 번호
+            stop: 끝 프레임 번호 (포함 안 함, None이면 끝까지)
+            loop: 끝에 도달하면 처음부터 반복
+            scale: JPEG 축소 디코딩 배율 (1, 2, 4, 8)
+
+        Raises:
+            ValueError: 알 수 없는 재생 모드
+        """
+        super().__init__(scale)
+        if mode not in REPLAY_MODES:
+            raise ValueError(f"알 수 없는 재생 모드: {mode} (가능: {REPLAY_MODES})")
+
+        self.reader = RecordingReader(path)
+        self.mode = mode
+        self.fps = fps
+        self.speed = speed
+        self.start_index = start
+        total = len(self.reader)
+        self.stop_index = total if stop is None else min(stop, total)
+        self.loop = loop
+
+        self.command = ""  # 녹화 당시 결정된 명령
+        self._closed = False
+
+    def __len__(self) -> int:
+        return max(0, self.stop_index - self.start_index)
+
+    def frames(self) -> Iterator[np.ndarray]:
+        """
+        녹화된 프레임을 재생 모드의 타이밍에 맞춰 생성
+        (재생 중에 close()해도 안전, 다음 프레임부터 생성 중지)
+
+        Yields:
+            이미지 (BGR)
+        """
+        # mmap 뷰 대신 복사본 사용 (살아 있는 생성기가 mmap 닫기를 막지 않음)
+        timestamps = np.array(self.reader.timestamps)
+
+        while not self._closed:
+            play_start = time.time()
+            for i in range(self.start_index, self.stop_index):
+                # 재생 타이밍
+                if self.mode == "original":
+                    offset = timestamps[i] - timestamps[self.start_index]
+                    self._sleep_until(play_start + offset / self.speed)
+                elif self.mode == "fixed":
+                    self._sleep_until(play_start + (i - self.start_index) / self.fps)
+
+                if self._closed:  # 대기 중에 close()됨
+                    return
+                image = self._read(i)
+                if image is not None:
+                    yield image
+
+            if not self.loop:
+                break
+
+    def get_stats(self) -> dict:
+        """
+        재생 통계
+
+        Returns:
+            통계 딕셔너리 (재생 모드, 처리량 fps 포함)
+        """
+        stats = super().get_stats()
+        stats["mode"] = self.mode
+        return stats
+
+    def close(self):
+        """녹화 파일 닫기 (재생 중이면 생성기도 끝남)"""
+        self._closed = True
+        self.jpeg = None
+        self.reader.close()
+
+    # ----- 내부 구현 -----
+    def _read(self, i: int) -> Optional[np.ndarray]:
+        """i번째 프레임 디코딩 및 프레임 정보 갱신"""
+        entry = self.reader.index[i]
+        jpeg = self.reader.get_jpeg(i)
+        image = self.decode(jpeg)
+        if image is None:
+            return None
+
+        self._publish(jpeg, float(entry["timestamp"]), float(entry["latency_ms"]), i)
+        self.command = self.reader.get_command(i)
+        return image
+
+    @staticmethod
+    def _sleep_until(deadline: float):
+        """deadline(epoch 초)까지 대기"""
+        remaining = deadline - time.time()
+        if remaining > 0:
+            time.sleep(remaining)
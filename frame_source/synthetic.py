@@ -0,0 +1,132 @@
+"""
+합성 트랙 프레임 소스
+
+녹화 파일이나 카메라 없이 파이프라인/스탠드인 서버를 돌릴 수 있도록
+검은 노면 위에 흰 차선 두 줄이 좌우로 휘어지는 영상을 생성합니다.
+"""
+
+import math
+import time
+from typing import Iterator, Optional
+
+import cv2
+import numpy as np
+
+from .base import FrameSource
+
+
+class SyntheticFrameSource(FrameSource):
+    """좌우로 굽이치는 차선 영상 생성 소스"""
+
+    def __init__(
+        self,
+        width: int = 320,
+        height: int = 240,
+        fps: Optional[float] = None,
+        count: Optional[int] = None,
+        curve_period: float = 120,
+        curve_amplitude: float = 0.25,
+        lane_width_ratio: float = 0.5,
+        noise: int = 8,
+        jpeg_quality: int = 80,
+        seed: int = 0,
+        scale: int = 1,
+    ):
+        """
+        합성 소스 초기화
+
+        Args:
+            width: 이미지 너비
+            height: 이미지 높이
+            fps: 생성 FPS (None이면 대기 없이 최대 속도)
+            count: 생성할 프레임 수 (None이면 무한)
+            curve_period: 좌우 한 번 굽이치는 데 걸리는 프레임 수
+            curve_amplitude: 차선 중심 이동 폭 (이미지 너비 비율)
+            lane_width_ratio: 아래쪽 두 차선 사이 간격 (이미지 너비 비율)
+            noise: 센서 노이즈 표준편차 (0이면 노이즈 없음)
+            jpeg_quality: encode_jpeg() JPEG 품질
+            seed: 노이즈 난수 시드
+            scale: 축소 배율 (1, 2, 4, 8, 축소 디코딩과 같은 크기로 생성)
+        """
+        super().__init__(scale)
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.count = count
+        self.curve_period = curve_period
+        self.curve_amplitude = curve_amplitude
+        self.lane_width_ratio = lane_width_ratio
+        self.noise = noise
+        self.jpeg_quality = jpeg_quality
+        self._rng = np.random.default_rng(seed)
+
+    def frames(self) -> Iterator[np.ndarray]:
+        """
+        합성 프레임 생성
+
+        Yields:
+            이미지 (BGR)
+        """
+        start = time.time()
+        i = 0
+        while self.count is None or i < self.count:
+            if self.fps:
+                remaining = start + i / self.fps - time.time()
+                if remaining > 0:
+                    time.sleep(remaining)
+
+            image = self.render(i)
+            self._publish(None, time.time(), index=i)
+            yield image
+            i += 1
+
+    def render(self, i: int) -> np.ndarray:
+        """
+        i번째 프레임 그리기
+
+        Args:
+            i: 프레임 번호 (차선 곡률 위상)
+
+        Returns:
+            이미지 (BGR)
+        """
+        w, h = self.width // self.scale, self.height // self.scale
+        image = np.full((h, w, 3), 40, dtype=np.uint8)
+
+        # 화면 위쪽일수록 차선 중심이 더 크게 휘어짐
+        phase = 2 * math.pi * i / self.curve_period
+        shift = math.sin(phase) * self.curve_amplitude * w
+        half_lane = self.lane_width_ratio * w / 2
+        thickness = max(2, w // 40)
+
+        rows = np.linspace(h - 1, 0, 8)
+        for side in (-1, 1):
+            points = []
+            for y in rows:
+                depth = 1 - y / h  # 0 = 아래, 1 = 위
+                center = w / 2 + shift * depth**2
+                x = center + side * half_lane * (1 - 0.6 * depth)
+                points.append((int(x), int(y)))
+            cv2.polylines(
+                image, [np.array(points, np.int32)], False, (235, 235, 235), thickness
+            )
+
+        if self.noise:
+            noise = self._rng.normal(0, self.noise, image.shape)
+            image = np.clip(image + noise, 0, 255).astype(np.uint8)
+        return image
+
+    def encode_jpeg(self, image: np.ndarray) -> bytes:
+        """
+        합성 이미지를 JPEG로 인코딩
+
+        Args:
+            image: 이미지 (BGR)
+
+        Returns:
+            JPEG 바이트
+        """
+        _, buffer = cv2.imencode(
+            ".jpg", image, [cv2.IMWRITE_JPEG_QUALITY, self.jpeg_quality]
+        )
+        return buffer.tobytes()
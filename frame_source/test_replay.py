@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+녹화 재생 소스 확인 스크립트
+
+임시 녹화 파일을 만들어 ReplayFrameSource로 재생하고,
+전체 재생 프레임 수와 재생 도중 close()가 안전한지 확인합니다.
+
+사용법:
+    python frame_source/test_replay.py
+"""
+
+import os
+import sys
+import tempfile
+
+import cv2
+import numpy as np
+
+# 저장소 루트를 sys.path에 추가 (frame_source 패키지 import용)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from frame_source import FrameRecorder, ReplayFrameSource  # noqa: E402
+
+FRAME_COUNT = 10
+
+
+def make_recording(path: str):
+    """단색 프레임 FRAME_COUNT장 녹화"""
+    with FrameRecorder(path) as recorder:
+        for i in range(FRAME_COUNT):
+            image = np.full((48, 64, 3), i * 20, dtype=np.uint8)
+            ok, jpeg = cv2.imencode(".jpg", image)
+            recorder.record(jpeg.tobytes(), 1000.0 + i * 0.01, 5.0)
+
+
+def check_full_playback(path: str) -> bool:
+    """끝까지 재생하면 모든 프레임이 나옴"""
+    source = ReplayFrameSource(path, mode="max")
+    frames = sum(1 for _ in source)
+    source.close()
+    return frames == FRAME_COUNT
+
+
+def check_close_after_partial_iteration(path: str, mode: str) -> bool:
+    """재생 도중 close()해도 BufferError 없이 닫히고 생성기가 끝남"""
+    source = ReplayFrameSource(path, mode=mode, fps=200.0, speed=10.0)
+    frames = iter(source)
+    next(frames)
+    next(frames)
+    try:
+        source.close()
+    except BufferError as e:
+        print(f"   close() 실패: {e}")
+        return False
+    return next(frames, None) is None
+
+
+def main():
+    failed = 0
+
+    print("=" * 60)
+    print("🎞️ Replay Frame Source Check")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "session.esprec")
+        make_recording(path)
+
+        checks = [("full playback", check_full_playback(path))]
+        for mode in ("original", "fixed", "max"):
+            checks.append(
+                (
+                    f"close after partial iteration ({mode})",
+                    check_close_after_partial_iteration(path, mode),
+                )
+            )
+
+    for name, ok in checks:
+        print(f"{'✅' if ok else '❌'} {name}")
+        failed += not ok
+
+    print("=" * 60)
+    if failed:
+        print(f"❌ {failed}개 확인 실패")
+        return 1
+    print("✅ 모든 확인 통과")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,6 +5,7 @@ Autonomous Driving Main Script
 
 실행 방법:
 python3 autonomous_drive.py
+python3 autonomous_drive.py --replay recordings/session.esprec --mode max
 
 키보드 컨트롤:
 - 'A' 키: 자율주행 모드 ON/OFF
@@ -13,38 +14,78 @@ python3 autonomous_drive.py
 - 'Q' 또는 ESC: 종료
 """
 
+import argparse
 import sys
 import time
 import cv2
 import numpy as np
 
 # 모듈 임포트
-from realtime_analysis.config import ESP32_IP, AUTONOMOUS_DRIVING_ENABLED
+from realtime_analysis.config import (
+    ESP32_IP,
+    AUTONOMOUS_DRIVING_ENABLED,
+    RECORD_DIR,
+    MOTION_GATE_ENABLED,
+    MOTION_GATE_MAX_REUSE_AGE,
+)
 from realtime_analysis.capture_client import CaptureClient
 from realtime_analysis.image_processor import ImageProcessor
 from realtime_analysis.lane_detector import LaneDetector
-from realtime_analysis.autonomous_driver import AutonomousDriver
+from realtime_analysis.autonomous_driver import AutonomousDriver, SEG_VALUES
 from realtime_analysis.ui_components import UIComponents
+# capture_client가 저장소 루트를 sys.path에 추가
+from frame_source import FrameRecorder, ReplayFrameSource, REPLAY_MODES
+from frame_pipeline import MotionGate
 
 
 class AutonomousDrivingSystem:
     """Complete Autonomous Driving System"""
 
-    def __init__(self):
-        """Initialize all modules"""
+    def __init__(self, frame_source=None):
+        """
+        Initialize all modules
+
+        Args:
+            frame_source: FrameSource to read instead of ESP32 /capture
+                          (offline sources run without sending any command)
+        """
         print("=" * 70)
         print("🚗 ESP32-CAM Autonomous Driving System")
         print("=" * 70)
         print(f"ESP32-CAM IP: {ESP32_IP}")
         print()
 
+        # 프레임 소스 (None이면 ESP32 /capture)
+        self.frame_source = frame_source
+        self.offline = frame_source is not None and not frame_source.is_live
+        self._frames = iter(frame_source) if frame_source is not None else None
+        self.source_exhausted = False
+        if self.offline:
+            print("🎞️ Offline frame source - commands are NOT sent to ESP32")
+
+        # 녹화기 (RECORD_DIR 지정 시, 오프라인 재생은 녹화 안 함)
+        self.recorder = None
+        if RECORD_DIR and not self.offline:
+            self.recorder = FrameRecorder.create_in(RECORD_DIR)
+        if self.recorder is not None:
+            print(f"🎞️ Recording to: {self.recorder.path}")
+
         # 모듈 초기화
-        self.capture_client = CaptureClient()
+        self.capture_client = CaptureClient(recorder=self.recorder)
         self.image_processor = ImageProcessor()
         self.lane_detector = LaneDetector()
         self.autonomous_driver = AutonomousDriver()
         self.ui = UIComponents()
 
+        # 움직임 게이트 (장면 변화가 없으면 이전 분석/판단 재사용)
+        self.motion_gate = (
+            MotionGate(max_reuse_age=MOTION_GATE_MAX_REUSE_AGE)
+            if MOTION_GATE_ENABLED
+            else None
+        )
+        self._last_analysis = None  # 마지막 전체 분석 결과
+        self._analysis_key = None  # 분석 설정 (모드/HSV, 바뀌면 재사용 안 함)
+
         # 상태 변수
         self.autonomous_mode = AUTONOMOUS_DRIVING_ENABLED
         self.obstacle_mode = False
@@ -124,8 +165,8 @@ class AutonomousDrivingSystem:
             while True:
                 current_time = time.time()
 
-                # FPS 제한
-                if current_time - last_frame_time < frame_interval:
+                # FPS 제한 (오프라인 소스는 소스가 재생 타이밍 결정)
+                if not self.offline and current_time - last_frame_time < frame_interval:
                     time.sleep(0.01)
                     continue
 
@@ -138,6 +179,9 @@ class AutonomousDrivingSystem:
 
                 # 프레임 처리
                 self._process_frame()
+                if self.source_exhausted:
+                    print("\n🎞️ End of frame source")
+                    break
 
                 # FPS 계산
                 self._update_fps()
@@ -161,7 +205,7 @@ class AutonomousDrivingSystem:
             self.hsv_params = self.ui.get_trackbar_values()
 
         # ESP32 카메라 컨트롤 (50프레임마다 - 간섭 최소화)
-        if self.frame_count % self.esp32_update_interval == 0:
+        if not self.offline and self.frame_count % self.esp32_update_interval == 0:
             new_controls = self.ui.get_camera_controls()
             if new_controls != self.camera_controls:
                 self.camera_controls = new_controls
@@ -189,7 +233,7 @@ class AutonomousDrivingSystem:
             print(f"\n🔍 Debug Mode: {mode_str}")
 
         # LED 토글 ('L' 키)
-        if key == ord("l") or key == ord("L"):
+        if not self.offline and (key == ord("l") or key == ord("L")):
             self.led_state = not self.led_state
             led_value = 1 if self.led_state else 0
             if self.capture_client.toggle_led(led_value):
@@ -239,38 +283,26 @@ class AutonomousDrivingSystem:
         capture_start = time.time()
 
         # 1. 이미지 캡처
-        image, capture_time = self.capture_client.capture_frame()
+        image, capture_time = self._capture_frame()
         if image is None:
             return
 
-        # 2. 이미지 전처리 (밝기 향상, 노이즈 제거, 햇빛 반사 제거!)
-        enhanced = self.image_processor.preprocess_image(image)
-
-        # 3. ROI 추출
-        roi, roi_y_start = self.image_processor.extract_roi(enhanced)
-
-        # 4. 세그멘테이션 (0=도로, 1=장애물, 2=도로선)
-        seg_mask = self.image_processor.create_segmentation_mask(
-            roi, self.hsv_params["white_v_min"], self.hsv_params["white_s_max"]
-        )
-
-        # 5. 히스토그램 계산 (다층 ROI 가중치, 도로선 x5)
-        histogram = self.lane_detector.calculate_histogram(seg_mask)
-
-        # 6. 방향 결정
-        if self.autonomous_mode:
-            # 하이브리드 자율주행 알고리즘
-            command, confidence, method = (
-                self.autonomous_driver.decide_direction_hybrid(seg_mask, histogram, 0.8)
-            )
-            # 모터 제어 명령 전송
+        # 2~6. 분석 (장면 변화가 없으면 이전 분석/판단 재사용)
+        analysis = self._analyze_frame(image)
+        enhanced = analysis["enhanced"]
+        roi_y_start = analysis["roi_y_start"]
+        seg_mask = analysis["seg_mask"]
+        histogram = analysis["histogram"]
+        command = analysis["command"]
+        confidence = analysis["confidence"]
+
+        # 모터 제어 명령 전송 (재사용한 판단도 매 프레임 전송)
+        if self.autonomous_mode and not self.offline:
             self.autonomous_driver.send_motor_command(command, confidence)
-        else:
-            # 수동 모드: 단순 히스토그램 방향만 표시
-            command, confidence = self.lane_detector.judge_steering(
-                histogram, self.hsv_params["min_pixels"], prefer_low=self.obstacle_mode
-            )
-            method = "manual"
+
+        # 녹화 파일에 이 프레임의 결정 명령 기록
+        if self.recorder is not None:
+            self.recorder.set_command(command)
 
         # 7. 처리 시간 계산
         total_time = (time.time() - capture_start) * 1000
@@ -376,8 +408,106 @@ class AutonomousDrivingSystem:
 
         self.ui.show_display(display_image)
 
+        # 전처리 스케줄러에 프레임 전체 시간 반영 (재사용 프레임은 전처리 안 함)
+        if not analysis["reused"]:
+            scheduler = self.image_processor.scheduler
+            scheduler.end_frame((time.time() - capture_start) * 1000)
+            if scheduler.plan_changed:
+                print(
+                    f"⚙️  Preprocess stages: {scheduler.describe()} "
+                    f"(budget {scheduler.budget_ms:.0f}ms)"
+                )
+
         self.fps_counter += 1
 
+    def _analyze_frame(self, image) -> dict:
+        """
+        Analyze one frame, or reuse the last analysis if the scene is unchanged
+
+        Args:
+            image: Captured BGR image
+
+        Returns:
+            {"enhanced", "roi_y_start", "seg_mask", "histogram",
+             "command", "confidence", "method", "reused"}
+            (재사용 시 "enhanced"는 전처리하지 않은 현재 프레임)
+        """
+        if self.motion_gate is not None:
+            # 모드/HSV 파라미터가 바뀌면 이전 분석은 무효
+            key = (
+                self.autonomous_mode,
+                self.obstacle_mode,
+                tuple(self.hsv_params.values()),
+            )
+            if key != self._analysis_key:
+                self.motion_gate.reset()
+                self._analysis_key = key
+            if self.motion_gate.should_reuse(image) and self._last_analysis:
+                # 판단(명령/신뢰도/히스토그램/마스크)만 재사용, 화면은 현재 프레임
+                return dict(self._last_analysis, enhanced=image, reused=True)
+
+        # 2. 이미지 전처리 (밝기 향상, 노이즈 제거, 햇빛 반사 제거!)
+        enhanced = self.image_processor.preprocess_image(image)
+
+        # 3. ROI 추출
+        roi, roi_y_start = self.image_processor.extract_roi(enhanced)
+
+        # 4. 세그멘테이션 (0=도로, 1=장애물, 2=도로선)
+        seg_mask = self.image_processor.create_segmentation_mask(
+            roi, self.hsv_params["white_v_min"], self.hsv_params["white_s_max"]
+        )
+
+        # 5. 마스크 통계 한 번 계산 → 히스토그램(다층 ROI 가중치, 도로선 x5)과
+        #    하이브리드 판단이 같은 통계 사용
+        mask_stats = self.lane_detector.calculate_mask_stats(seg_mask, SEG_VALUES)
+        histogram = self.lane_detector.histogram_stats_from_mask_stats(
+            mask_stats
+        ).as_dict()
+
+        # 6. 방향 결정
+        if self.autonomous_mode:
+            # 하이브리드 자율주행 알고리즘
+            command, confidence, method = (
+                self.autonomous_driver.decide_direction_hybrid(
+                    seg_mask, histogram, 0.8, stats=mask_stats
+                )
+            )
+        else:
+            # 수동 모드: 단순 히스토그램 방향만 표시
+            command, confidence = self.lane_detector.judge_steering(
+                histogram, self.hsv_params["min_pixels"], prefer_low=self.obstacle_mode
+            )
+            method = "manual"
+
+        # 재사용 시 아레나 버퍼(seg_mask)는 다음 분석 전까지 유효
+        self._last_analysis = {
+            "enhanced": enhanced,
+            "roi_y_start": roi_y_start,
+            "seg_mask": seg_mask,
+            "histogram": histogram,
+            "command": command,
+            "confidence": confidence,
+            "method": method,
+            "reused": False,
+        }
+        return self._last_analysis
+
+    def _capture_frame(self):
+        """
+        Capture one frame from ESP32 or the frame source
+
+        Returns:
+            (image, capture_time_ms) - image is None on failure
+        """
+        if self._frames is None:
+            return self.capture_client.capture_frame()
+
+        image = next(self._frames, None)
+        if image is None:
+            self.source_exhausted = True
+            return None, 0
+        return image, self.frame_source.latency_ms + self.frame_source.decode_ms
+
     def _update_fps(self):
         """Update FPS counter"""
         elapsed = time.time() - self.fps_start
@@ -408,6 +538,50 @@ class AutonomousDrivingSystem:
             )
             print(f"  Stop: {stats['command_history']['stop']}")
 
+        # 녹화 파일 닫기 (인덱스 기록)
+        if self.recorder is not None:
+            self.recorder.close()
+            print(
+                f"\n🎞️ Recording saved: {self.recorder.path} "
+                f"({self.recorder.frame_count} frames)"
+            )
+
+        # 재생 통계
+        if self.frame_source is not None and hasattr(self.frame_source, "get_stats"):
+            source_stats = self.frame_source.get_stats()
+            print("\n🎞️ Frame Source Statistics:")
+            print(f"  Frames: {source_stats['frames']}")
+            print(f"  Average FPS: {source_stats['fps']:.2f}")
+            self.frame_source.close()
+
+        # 움직임 게이트 통계
+        if self.motion_gate is not None:
+            gate_stats = self.motion_gate.get_stats()
+            print("\n🧊 Motion Gate Statistics:")
+            print(f"  Reused: {gate_stats['reused']} / {gate_stats['checked']}")
+            print(f"  Reuse ratio: {gate_stats['reuse_ratio']*100:.1f}%")
+            print(f"  Max reuse age: {gate_stats['max_reuse_age']} frames")
+
+        # 전처리 스케줄러 통계
+        scheduler_stats = self.image_processor.scheduler.get_stats()
+        print("\n⚙️  Preprocess Scheduler Statistics:")
+        print(
+            f"  Degraded frames: {scheduler_stats['degraded_frames']} "
+            f"/ {scheduler_stats['frames']}"
+        )
+        for name, stage in scheduler_stats["stages"].items():
+            print(
+                f"  {name}: runs {stage['runs']}, skipped {stage['skipped']}, "
+                f"cost {stage['cost_ms']}"
+            )
+
+        # 프레임 버퍼 통계 (워밍업 이후 할당이 늘지 않아야 함)
+        arena_stats = self.image_processor.arena.get_stats()
+        print("\n🧱 Frame Buffer Statistics:")
+        print(f"  Buffers: {arena_stats['buffers']}")
+        print(f"  Allocations: {arena_stats['allocations']}")
+        print(f"  Allocated: {arena_stats['allocated_kb']:.0f} KB")
+
         # 캡처 통계
         capture_stats = self.capture_client.get_statistics()
         print("\n📸 Capture Statistics:")
@@ -425,7 +599,19 @@ class AutonomousDrivingSystem:
 
 def main():
     """Main entry point"""
-    system = AutonomousDrivingSystem()
+    parser = argparse.ArgumentParser(description="ESP32-CAM autonomous driving")
+    parser.add_argument("--replay", help="recorded session (.esprec) to replay")
+    parser.add_argument(
+        "--mode", choices=REPLAY_MODES, default="original", help="replay timing"
+    )
+    parser.add_argument("--fps", type=float, default=10.0, help="fixed-mode FPS")
+    args = parser.parse_args()
+
+    frame_source = None
+    if args.replay:
+        frame_source = ReplayFrameSource(args.replay, mode=args.mode, fps=args.fps)
+
+    system = AutonomousDrivingSystem(frame_source)
     system.setup()
     system.run()
 
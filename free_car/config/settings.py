@@ -40,6 +40,9 @@ class Settings:
     ROI_BOTTOM = {"y_start": 180, "y_end": 240, "x_start": 0, "x_end": 320}
     ROI_CENTER = {"y_start": 120, "y_end": 180, "x_start": 0, "x_end": 320}
 
+    # 녹화 설정 (비어 있으면 녹화 안 함, 지정 시 세션별 .esprec 파일 생성)
+    RECORD_DIR = os.getenv("RECORD_DIR", "")
+
     # 디버그 설정
     DEBUG_MODE = os.getenv("DEBUG_MODE", "True").lower() == "true"
     SHOW_PREVIEW = os.getenv("SHOW_PREVIEW", "True").lower() == "true"
@@ -55,6 +58,7 @@ class Settings:
         print(
             f"영상 모드: {'폴링 (/capture)' if cls.USE_POLLING_MODE else '스트림 (/stream)'}"
         )
+        print(f"녹화: {cls.RECORD_DIR or '사용 안 함'}")
         print(f"디버그 모드: {cls.DEBUG_MODE}")
         print(f"화면 미리보기: {cls.SHOW_PREVIEW}")
         print("=" * 60)
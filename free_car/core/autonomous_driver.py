@@ -12,6 +12,7 @@ from services.esp32_communication import ESP32Communication
 from services.lane_tracking_service import LaneTrackingService
 from services.control_panel import ControlPanel
 from config.settings import Settings
+from frame_source import FrameRecorder, FrameSource
 
 logger = logging.getLogger(__name__)
 
@@ -28,8 +29,16 @@ class AutonomousDriver:
         """
         self.settings = settings
 
+        # 녹화기 (RECORD_DIR 지정 시)
+        self.recorder = None
+        if settings.RECORD_DIR:
+            self.recorder = FrameRecorder.create_in(settings.RECORD_DIR)
+            logger.info(f"🎞️ 녹화 파일: {self.recorder.path}")
+
         # 서비스 초기화
-        self.esp32 = ESP32Communication(settings.ESP32_BASE_URL, timeout=5)
+        self.esp32 = ESP32Communication(
+            settings.ESP32_BASE_URL, timeout=5, recorder=self.recorder
+        )
         self.lane_tracker = LaneTrackingService(
             brightness_threshold=settings.BRIGHTNESS_THRESHOLD,
             min_lane_pixels=settings.MIN_LANE_PIXELS,
@@ -50,20 +59,32 @@ class AutonomousDriver:
         }
 
         self.is_running = False
+        self.offline = False  # 오프라인 소스 재생 중 (명령 전송 안 함)
         logger.info("자율주행 드라이버 초기화 완료")
 
-    def start(self):
-        """자율주행 시작"""
+    def start(self, frame_source: Optional[FrameSource] = None):
+        """
+        자율주행 시작
+
+        Args:
+            frame_source: 프레임 소스 (None이면 ESP32 폴링/스트림,
+                          녹화 재생 등 오프라인 소스면 연결 확인/명령 전송 생략)
+        """
         logger.info("=" * 60)
         logger.info("🚗 자율주행 시작")
         logger.info("=" * 60)
 
-        # ESP32 연결 확인
-        if not self.esp32.check_connection():
+        offline = frame_source is not None and not frame_source.is_live
+        self.offline = offline
+        if offline:
+            logger.info("🎞️ 오프라인 프레임 소스 - 명령 전송 없이 실행")
+        elif not self.esp32.check_connection():
+            # ESP32 연결 확인
             logger.error("❌ ESP32-CAM 연결 실패")
+            self.stop()
             return
-
-        logger.info("✅ ESP32-CAM 연결 성공")
+        else:
+            logger.info("✅ ESP32-CAM 연결 성공")
 
         self.is_running = True
         self.stats["start_time"] = time.time()
@@ -76,13 +97,15 @@ class AutonomousDriver:
         last_frame_time = 0
 
         try:
-            # 영상 소스 선택 (폴링 or 스트림)
-            if self.settings.USE_POLLING_MODE:
+            # 영상 소스 선택 (외부 소스 or 폴링 or 스트림)
+            if frame_source is not None:
+                video_source = frame_source
+            elif self.settings.USE_POLLING_MODE:
                 logger.info("📸 폴링 모드 (/capture) 사용")
-                video_source = self.esp32.polling_generator(self.settings.TARGET_FPS)
+                video_source = self.esp32.polling_source(self.settings.TARGET_FPS)
             else:
                 logger.info("📹 스트림 모드 (/stream) 사용")
-                video_source = self.esp32.stream_generator()
+                video_source = self.esp32.stream_source()
 
             # 프레임 처리 루프
             frame_count = 0
@@ -91,9 +114,9 @@ class AutonomousDriver:
                 if not self.is_running:
                     break
 
-                # FPS 제한
+                # FPS 제한 (오프라인 소스는 소스가 재생 타이밍 결정)
                 current_time = time.time()
-                if current_time - last_frame_time < frame_interval:
+                if not offline and current_time - last_frame_time < frame_interval:
                     continue
                 last_frame_time = current_time
 
@@ -111,7 +134,9 @@ class AutonomousDriver:
 
                 # 명령 전송
                 command = result["command"]
-                if self.esp32.send_command(command):
+                if self.recorder is not None:
+                    self.recorder.set_command(command)
+                if not offline and self.esp32.send_command(command):
                     self.stats["commands_sent"] += 1
 
                 # 디버그 정보 출력
@@ -142,13 +167,21 @@ class AutonomousDriver:
 
     def stop(self):
         """자율주행 중지"""
+        # 녹화 파일 닫기 (인덱스 기록, 연결 실패로 시작 못 한 경우 포함)
+        if self.recorder is not None and not self.recorder.is_closed:
+            self.recorder.close()
+            logger.info(
+                f"녹화 저장: {self.recorder.path} ({self.recorder.frame_count} 프레임)"
+            )
+
         if not self.is_running:
             return
 
         self.is_running = False
 
         # 정지 명령 전송
-        self.esp32.send_command("stop")
+        if not self.offline:
+            self.esp32.send_command("stop")
 
         # 통계 출력
         elapsed = (
@@ -1,12 +1,17 @@
 import cv2
 import numpy as np
+import sys
 import time
+from pathlib import Path
+
+# 저장소 루트를 sys.path에 추가 (공용 frame_source 패키지 import용)
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from frame_source import MJPEGStreamFrameSource
 
 # 1) ESP32-CAM 스트림 주소
 URL = "http://192.168.0.65/stream"  # ← 본인 IP로 변경
-cap = cv2.VideoCapture(URL)
-if not cap.isOpened():
-    raise RuntimeError("스트림을 열 수 없습니다. 브라우저에서 URL 확인")
+source = MJPEGStreamFrameSource(URL)
 
 WIN = "COLOR TRACK | Left: ORIGINAL  Right: RESULT"
 cv2.namedWindow(WIN)
@@ -23,11 +28,7 @@ V_min = 80  # 명도 하한
 
 print("[INFO] 키: r=RED, g=GREEN, b=BLUE, q=종료")
 
-while True:
-    ok, frame = cap.read()
-    if not ok:
-        continue
-
+for frame in source:
     # 보기 부담 줄이기
     if frame.shape[1] > max_w:
         r = max_w / frame.shape[1]
@@ -110,5 +111,5 @@ while True:
         Hc, Rg, S_min, V_min = 110, 15, 120, 80
         print("▶ BLUE MODE")
 
-cap.release()
+source.close()
 cv2.destroyAllWindows()
@@ -4,17 +4,33 @@
 ESP32-CAM의 /capture 엔드포인트를 사용한 실시간 차선 검출 및 조향 판단
 """
 
+import sys
+from pathlib import Path
+
+# 저장소 루트를 sys.path에 추가 (공용 frame_pipeline 패키지 import용)
+_REPO_ROOT = str(Path(__file__).resolve().parents[2])
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+
+from frame_pipeline import FrameArena, MaskStats, MotionGate
+
 from .analyzer import RealtimeAnalyzer
 from .capture_client import CaptureClient
 from .image_processor import ImageProcessor
-from .lane_detector import LaneDetector
+from .lane_detector import HistogramStats, LaneDetector
+from .stage_scheduler import StageScheduler
 from .ui_components import UIComponents
 
 __all__ = [
     "RealtimeAnalyzer",
     "CaptureClient",
+    "FrameArena",
     "ImageProcessor",
     "LaneDetector",
+    "HistogramStats",
+    "MaskStats",
+    "MotionGate",
+    "StageScheduler",
     "UIComponents",
 ]
 
@@ -269,6 +269,15 @@ class RealtimeAnalyzer:
         # 3. 전체 처리 시간 계산
         total_time = (time.time() - capture_start) * 1000
 
+        # 전처리 스케줄러에 프레임 전체 시간 반영 (다음 프레임 예산)
+        scheduler = self.image_processor.scheduler
+        scheduler.end_frame(total_time)
+        if scheduler.plan_changed:
+            print(
+                f"⚙️  Preprocess stages: {scheduler.describe()} "
+                f"(budget {scheduler.budget_ms:.0f}ms)"
+            )
+
         # 4. 화면 표시
         self._display_results(image, result, capture_time, total_time)
 
@@ -409,4 +418,19 @@ class RealtimeAnalyzer:
         print(f"Success rate: {capture_stats['success_rate']:.1f}%")
         print(f"Elapsed time: {elapsed:.1f}s")
         print(f"Average FPS: {avg_fps:.1f}")
+
+        # 전처리 스케줄러 (예산 초과로 선택 단계를 낮추거나 생략한 프레임)
+        scheduler_stats = self.image_processor.scheduler.get_stats()
+        print(
+            f"Degraded preprocess frames: {scheduler_stats['degraded_frames']} "
+            f"/ {scheduler_stats['frames']}"
+        )
+
+        # 프레임 버퍼 할당 (워밍업 이후 증가하지 않아야 함)
+        arena_stats = self.image_processor.arena.get_stats()
+        print(
+            f"Frame buffers: {arena_stats['buffers']} "
+            f"({arena_stats['allocations']} allocations, "
+            f"{arena_stats['allocated_kb']:.0f} KB)"
+        )
         print("=" * 60)
@@ -9,6 +9,8 @@ from typing import Dict, Tuple, Optional
 import requests
 import time
 
+from frame_pipeline import MaskStats
+
 from .config import (
     MOTOR_CONTROL_URL,
     STEERING_CENTER_THRESHOLD,
@@ -17,10 +19,16 @@ from .config import (
     HORIZONTAL_LINE_MIN_LENGTH,
 )
 
+# 세그멘테이션 값 (0=도로, 1=장애물, 2=도로선)
+SEG_VALUES = (0, 1, 2)
+
 
 class AutonomousDriver:
     """Autonomous Driving Controller with Hybrid Decision Algorithm"""
 
+    # 수평선 검출 Hough 투표 임계값 (도로선 픽셀이 이보다 적으면 생략)
+    HOUGH_THRESHOLD = 50
+
     def __init__(self):
         """Initialize autonomous driver"""
         # 이전 명령 저장 (연속성 유지)
@@ -38,7 +46,11 @@ class AutonomousDriver:
         print("🚗 Autonomous Driver initialized")
 
     def decide_direction_hybrid(
-        self, seg_mask: np.ndarray, histogram: Dict[str, int], confidence: float
+        self,
+        seg_mask: np.ndarray,
+        histogram: Dict[str, int],
+        confidence: float,
+        stats: Optional[MaskStats] = None,
     ) -> Tuple[str, float, str]:
         """
         하이브리드 방향 결정 알고리즘
@@ -54,27 +66,27 @@ class AutonomousDriver:
             seg_mask: Segmentation mask (0=road, 1=obstacle, 2=lane)
             histogram: Histogram data {left, center, right}
             confidence: Current confidence value
+            stats: seg_mask 통계 (None이면 계산, 값 0/1/2 집계)
 
         Returns:
             (command, confidence, method_used)
         """
-        # 픽셀 카운트
-        lane_pixels = np.sum(seg_mask == 2)
-        obstacle_pixels = np.sum(seg_mask == 1)
-        total_pixels = seg_mask.size
+        # 마스크 통계 한 번 계산 (이후 판단은 모두 통계 조회)
+        if stats is None:
+            stats = MaskStats(seg_mask, SEG_VALUES)
 
         # 차선 비율
-        lane_ratio = lane_pixels / total_pixels
-        obstacle_ratio = obstacle_pixels / total_pixels
+        lane_ratio = stats.ratio(2)
+        obstacle_ratio = stats.ratio(1)
 
         # === 상황 1: 90도 도로선 감지 ===
-        if self._detect_horizontal_lane(seg_mask):
-            command = self._handle_horizontal_lane(seg_mask)
+        if self._detect_horizontal_lane(seg_mask, stats):
+            command = self._handle_horizontal_lane(stats)
             return command, 0.9, "horizontal_lane"
 
         # === 상황 2: 차선이 명확 (비율 > 5%) ===
         if lane_ratio > 0.05:
-            command, conf = self._lane_position_method(seg_mask)
+            command, conf = self._lane_position_method(stats)
             if command != "unknown":
                 return command, conf, "lane_position"
 
@@ -94,28 +106,21 @@ class AutonomousDriver:
         else:
             return "stop", 0.0, "uncertain_stop"
 
-    def _lane_position_method(self, seg_mask: np.ndarray) -> Tuple[str, float]:
+    def _lane_position_method(self, stats: MaskStats) -> Tuple[str, float]:
         """
         차선 위치 기반 방향 결정
 
         Args:
-            seg_mask: Segmentation mask
+            stats: Segmentation mask 통계
 
         Returns:
             (command, confidence)
         """
-        height, width = seg_mask.shape
-
-        # 도로선만 추출 (값=2)
-        lane_mask = (seg_mask == 2).astype(np.uint8)
+        width = stats.width
 
-        # 좌우로 나누기
-        left_half = lane_mask[:, : width // 2]
-        right_half = lane_mask[:, width // 2 :]
-
-        # 각 절반의 무게중심 계산
-        left_center = self._calculate_centroid_x(left_half)
-        right_center = self._calculate_centroid_x(right_half) + width // 2
+        # 좌우 절반의 도로선(값=2) 무게중심 계산
+        left_center = self._calculate_centroid_x(stats, 0, width // 2)
+        right_center = self._calculate_centroid_x(stats, width // 2, width)
 
         # 두 차선이 모두 있을 때만 처리
         if left_center is not None and right_center is not None:
@@ -198,16 +203,21 @@ class AutonomousDriver:
         else:
             return "right"  # 왼쪽에 장애물 적음 → 오른쪽으로
 
-    def _detect_horizontal_lane(self, seg_mask: np.ndarray) -> bool:
+    def _detect_horizontal_lane(self, seg_mask: np.ndarray, stats: MaskStats) -> bool:
         """
         90도 도로선 감지 (횡단보도, T자 교차로)
 
         Args:
             seg_mask: Segmentation mask
+            stats: Segmentation mask 통계
 
         Returns:
             True if horizontal lane detected
         """
+        # 도로선 픽셀이 Hough 투표 임계값보다 적으면 선이 나올 수 없음
+        if stats.total(2) < self.HOUGH_THRESHOLD:
+            return False
+
         # 도로선만 추출
         lane_mask = (seg_mask == 2).astype(np.uint8) * 255
 
@@ -216,7 +226,7 @@ class AutonomousDriver:
             lane_mask,
             rho=1,
             theta=np.pi / 180,
-            threshold=50,
+            threshold=self.HOUGH_THRESHOLD,
             minLineLength=HORIZONTAL_LINE_MIN_LENGTH,
             maxLineGap=10,
         )
@@ -238,21 +248,21 @@ class AutonomousDriver:
 
         return horizontal_ratio > HORIZONTAL_LINE_THRESHOLD
 
-    def _handle_horizontal_lane(self, seg_mask: np.ndarray) -> str:
+    def _handle_horizontal_lane(self, stats: MaskStats) -> str:
         """
         90도 도로선 특별 처리
 
         Args:
-            seg_mask: Segmentation mask
+            stats: Segmentation mask 통계
 
         Returns:
             Command string
         """
-        height, width = seg_mask.shape
+        width = stats.width
 
         # 좌우 열린 공간 계산
-        left_space = np.sum(seg_mask[:, : width // 3] == 0)
-        right_space = np.sum(seg_mask[:, 2 * width // 3 :] == 0)
+        left_space = stats.count(0, 0, width // 3)
+        right_space = stats.count(0, 2 * width // 3, width)
 
         # 더 넓은 쪽으로 회전
         if abs(left_space - right_space) < 1000:
@@ -262,21 +272,22 @@ class AutonomousDriver:
         else:
             return "right"
 
-    def _calculate_centroid_x(self, binary_mask: np.ndarray) -> Optional[int]:
+    def _calculate_centroid_x(
+        self, stats: MaskStats, x_start: int, x_end: int
+    ) -> Optional[int]:
         """
-        이진 마스크의 X축 무게중심 계산
+        열 범위 안 도로선(값=2)의 X축 무게중심 계산
 
         Args:
-            binary_mask: Binary mask
+            stats: Segmentation mask 통계
+            x_start: 시작 열
+            x_end: 끝 열 (포함 안 함)
 
         Returns:
             X coordinate of centroid or None
         """
-        moments = cv2.moments(binary_mask)
-        if moments["m00"] > 0:
-            cx = int(moments["m10"] / moments["m00"])
-            return cx
-        return None
+        cx = stats.centroid_x(2, x_start, x_end)
+        return int(cx) if cx is not None else None
 
     def send_motor_command(self, command: str, confidence: float) -> bool:
         """
@@ -4,26 +4,49 @@ ESP32-CAM 캡처 클라이언트
 /capture 엔드포인트를 사용한 이미지 캡처
 """
 
+import sys
 import time
 import requests
 import numpy as np
-import cv2
+from pathlib import Path
 from typing import Tuple, Optional
 
-from .config import CAPTURE_URL, CAPTURE_TIMEOUT, CHUNK_SIZE, ESP32_IP
+from .config import CAPTURE_URL, CAPTURE_TIMEOUT, ESP32_IP
+
+# 저장소 루트를 sys.path에 추가 (공용 frame_source 패키지 import용)
+_REPO_ROOT = str(Path(__file__).resolve().parents[2])
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+
+from frame_source import FrameRecorder, PollingFrameSource
 
 
 class CaptureClient:
     """ESP32-CAM capture client with control features"""
 
-    def __init__(self):
-        """Initialize"""
+    def __init__(self, recorder: Optional[FrameRecorder] = None):
+        """
+        Initialize
+
+        Args:
+            recorder: 캡처한 JPEG를 기록할 녹화기 (None이면 기록 안 함)
+        """
+        self.recorder = recorder
+
         # HTTP session (connection reuse)
         self.session = requests.Session()
         self.session.headers.update(
             {"Connection": "keep-alive", "Keep-Alive": "timeout=5, max=100"}
         )
 
+        # /capture 소스 (세션 공유, 녹화 포함)
+        self._source = PollingFrameSource(
+            CAPTURE_URL,
+            timeout=CAPTURE_TIMEOUT,
+            session=self.session,
+            recorder=recorder,
+        )
+
         # Statistics
         self.total_captures = 0
         self.failed_captures = 0
@@ -57,89 +80,18 @@ class CaptureClient:
         """
         start_time = time.time()
 
-        try:
-            # HTTP 요청
-            response = self.session.get(
-                CAPTURE_URL, timeout=CAPTURE_TIMEOUT, stream=True
-            )
-
-            # Early return: 응답 실패
-            if response.status_code != 200:
-                self.failed_captures += 1
-                return None, 0
-
-            # 청크 단위로 데이터 수신
-            content = self._read_response_chunks(response)
-
-            # Early return: 빈 데이터
-            if not content:
-                self.failed_captures += 1
-                return None, 0
-
-            # 이미지 디코딩
-            image = self._decode_image(content)
-
-            # Early return: 디코딩 실패
-            if image is None:
-                self.failed_captures += 1
-                return None, 0
-
-            # 성공
-            self.total_captures += 1
-            capture_time = (time.time() - start_time) * 1000  # ms
-            return image, capture_time
-
-        except requests.exceptions.Timeout:
-            print(f"⚠️ 캡처 타임아웃 (>{CAPTURE_TIMEOUT}초)")
-            self.failed_captures += 1
-            return None, 0
-
-        except requests.exceptions.RequestException as e:
-            print(f"⚠️ 캡처 실패: {e}")
-            self.failed_captures += 1
-            return None, 0
+        # 수신/녹화/디코딩은 공용 폴링 소스가 담당
+        image = self._source.read()
 
-        except Exception as e:
-            print(f"⚠️ 예상치 못한 오류: {e}")
+        # Early return: 캡처 또는 디코딩 실패
+        if image is None:
             self.failed_captures += 1
             return None, 0
 
-    def _read_response_chunks(self, response: requests.Response) -> bytes:
-        """
-        응답 청크 읽기
-
-        Args:
-            response: HTTP 응답 객체
-
-        Returns:
-            이미지 데이터 bytes
-        """
-        content = b""
-
-        for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
-            if chunk:
-                content += chunk
-
-        return content
-
-    def _decode_image(self, content: bytes) -> Optional[np.ndarray]:
-        """
-        JPEG 데이터를 이미지로 디코딩
-
-        Args:
-            content: JPEG 바이트 데이터
-
-        Returns:
-            이미지 ndarray (BGR) 또는 None
-        """
-        try:
-            nparr = np.frombuffer(content, np.uint8)
-            image = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
-            return image
-
-        except Exception as e:
-            print(f"⚠️ 이미지 디코딩 실패: {e}")
-            return None
+        # 성공
+        self.total_captures += 1
+        capture_time = (time.time() - start_time) * 1000  # ms
+        return image, capture_time
 
     def reset_session(self):
         """세션 재설정 (연결 문제 시)"""
@@ -147,6 +99,7 @@ class CaptureClient:
         self.session.headers.update(
             {"Connection": "keep-alive", "Keep-Alive": "timeout=5, max=100"}
         )
+        self._source.session = self.session
         print("🔄 HTTP 세션 재설정 완료")
 
     def get_statistics(self) -> dict:
@@ -12,8 +12,10 @@ ESP32-CAM 연결 및 분석 파라미터 설정
 - RED_S_MIN, RED_V_MIN: 낮출수록 어둡거나 연한 빨강 포함 (기본 80)
 """
 
-# ESP32-CAM 연결 설정
-ESP32_IP = "192.168.0.65"
+import os
+
+# ESP32-CAM 연결 설정 (환경변수로 덮어쓰기 가능, 예: 스탠드인 서버 127.0.0.1:8080)
+ESP32_IP = os.getenv("ESP32_IP", "192.168.0.65")
 ESP32_PORT = 80
 CAPTURE_URL = f"http://{ESP32_IP}/capture"
 
@@ -22,6 +24,13 @@ TARGET_FPS = 5  # 1초당 5 프레임 (전처리 최적화로 속도 향상)
 CAPTURE_TIMEOUT = 2  # 캡처 타임아웃 (초)
 CHUNK_SIZE = 8192  # 청크 크기 (bytes)
 
+# 움직임 게이트: 장면 변화가 없으면(정지/저속) 이전 분석/판단 재사용
+MOTION_GATE_ENABLED = True
+MOTION_GATE_MAX_REUSE_AGE = 2  # 연속 재사용 최대 프레임 수 (5fps 기준 0.4초)
+
+# 녹화 설정 (None이면 녹화 안 함, 디렉토리 지정 시 세션별 .esprec 파일 생성)
+RECORD_DIR = None
+
 # UI Settings
 WINDOW_NAME = "Autonomous Driving Analysis"
 
@@ -39,6 +48,9 @@ TRACKBAR_RANGES = {
     "min_pixels": (0, 5000),
 }
 
+# 색상 분류 룩업 테이블 양자화 비트 수 (채널당, 7 → 128단계, 테이블 2MB, 재생성 ~20ms)
+COLOR_LUT_BITS = 7
+
 # ROI 설정
 ROI_BOTTOM_RATIO = 0.75  # 하단 25% 사용
 
@@ -119,3 +131,9 @@ CONTRAST_BOOST = 1.2  # Contrast multiplier (1.3→1.2, 약하게)
 ENABLE_CLAHE = True  # Adaptive histogram equalization
 ENABLE_SHARPENING = False  # Edge sharpening filter (비활성화 - 속도 향상)
 ENABLE_DENOISING = False  # Noise reduction (비활성화 - 가장 느림!)
+
+# 전처리 단계 스케줄러 (위 ENABLE_* 플래그는 최대 품질, 끄면 항상 그대로 실행)
+# 프레임 예산(1000 / TARGET_FPS)을 넘으면 노이즈 제거 → 샤프닝 → 반사 제거 순으로
+# 낮추거나 생략하고, 예상 시간이 예산의 PREPROCESS_RESTORE_RATIO 이하일 때 복구
+ADAPTIVE_PREPROCESSING = True
+PREPROCESS_RESTORE_RATIO = 0.8
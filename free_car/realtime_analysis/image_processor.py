@@ -6,7 +6,9 @@ CLAHE, HSV 변환, 차선 마스크 생성
 
 import cv2
 import numpy as np
-from typing import Tuple
+from typing import Dict, Optional, Tuple
+
+from frame_pipeline import ColorLUT, FrameArena
 
 from .config import (
     ROI_BOTTOM_RATIO,
@@ -28,12 +30,34 @@ from .config import (
     ENABLE_CLAHE,
     ENABLE_SHARPENING,
     ENABLE_DENOISING,
+    COLOR_LUT_BITS,
+    TARGET_FPS,
+    ADAPTIVE_PREPROCESSING,
+    PREPROCESS_RESTORE_RATIO,
 )
+from .stage_scheduler import StageScheduler
+
+# 세그멘테이션 LUT 코드 비트 (검정 도로, 차선 색상)
+SEG_BLACK = 1
+SEG_LANE = 2
+
+# 코드 → 마스크/세그멘테이션 변환표 (cv2.LUT용)
+_LANE_BIT_TO_MASK = np.where(np.arange(256) & SEG_LANE, 255, 0).astype(np.uint8)
+_BLACK_BIT_TO_SEG = np.where(np.arange(256) & SEG_BLACK, 0, 1).astype(np.uint8)
 
 
 class ImageProcessor:
     """Image Processor with Advanced Preprocessing Pipeline"""
 
+    # 노이즈 제거 수준별 (templateWindowSize, searchWindowSize), fast는 약 7배 빠름
+    DENOISE_WINDOWS = {"full": (7, 21), "fast": (5, 11)}
+
+    # 반사 제거: 블러 커널 크기, 처리할 최소 반사 픽셀 수,
+    # 따로 블러할 최대 행 구간 수 (넘으면 반사 후보 행 전체를 한 영역으로)
+    SPECULAR_KERNEL = 5
+    SPECULAR_MIN_PIXELS = 50
+    SPECULAR_MAX_PATCHES = 4
+
     def __init__(self):
         """Initialize image processor"""
         # CLAHE 초기화 (각 채널별 적응형 히스토그램 평활화)
@@ -42,6 +66,41 @@ class ImageProcessor:
         # 이전 프레임 저장 (시간 필터링용)
         self.prev_frame = None
 
+        # 프레임 버퍼 아레나 (단계별 결과 버퍼를 프레임마다 재사용)
+        # 반환된 이미지/마스크는 다음 프레임 처리 전까지만 유효
+        self.arena = FrameArena()
+
+        # 색상 분류 룩업 테이블 (임계값이 바뀔 때만 재생성)
+        self.color_lut = ColorLUT(COLOR_LUT_BITS, arena=self.arena)
+
+        # 대비 조정 룩업 테이블 (배율 → 256칸 uint8, 배율이 바뀔 때만 생성)
+        self._contrast_luts: Dict[float, np.ndarray] = {}
+
+        # 노이즈 제거 커널 (한 번만 생성)
+        self.noise_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (5, 5))
+
+        # 전처리 단계 스케줄러 (정적 플래그 = 최대 품질, 예산 초과 시 선택 단계 축소)
+        # 우선순위 낮은 순으로 축소: 노이즈 제거 → 샤프닝 → 반사 제거
+        self.scheduler = StageScheduler(
+            1000 / TARGET_FPS,
+            restore_ratio=PREPROCESS_RESTORE_RATIO,
+            adaptive=ADAPTIVE_PREPROCESSING,
+        )
+        self.scheduler.add_stage(
+            "brightness", ["full"], required=True, enabled=BRIGHTNESS_BOOST > 0
+        )
+        self.scheduler.add_stage("clahe", ["full"], required=True, enabled=ENABLE_CLAHE)
+        self.scheduler.add_stage("specular", ["full"], priority=2)
+        self.scheduler.add_stage(
+            "denoise",
+            list(self.DENOISE_WINDOWS),
+            priority=0,
+            enabled=ENABLE_DENOISING,
+        )
+        self.scheduler.add_stage(
+            "sharpen", ["full"], priority=1, enabled=ENABLE_SHARPENING
+        )
+
     def preprocess_image(self, image: np.ndarray) -> np.ndarray:
         """
         Advanced preprocessing pipeline for ESP32-CAM images
@@ -53,6 +112,9 @@ class ImageProcessor:
         4. Noise reduction
         5. Sharpening (optional)
 
+        Optional stages (3-5) are downgraded or skipped by the stage scheduler
+        when the frame budget is exceeded; see scheduler.last_plan for what ran.
+
         Args:
             image: Input BGR image
 
@@ -62,29 +124,35 @@ class ImageProcessor:
         if not ENABLE_IMAGE_ENHANCEMENT:
             return image
 
-        enhanced = image.copy()
+        # 각 단계가 아레나 버퍼에 결과를 쓰므로 입력 복사 불필요
+        enhanced = image
+
+        # 이번 프레임 실행 계획 (단계 → 수준, 생략 단계는 None)
+        self.scheduler.plan()
+        run = self.scheduler.run
 
         # Step 1: 밝기 향상
-        if BRIGHTNESS_BOOST > 0:
-            enhanced = self._boost_brightness(enhanced, BRIGHTNESS_BOOST)
+        enhanced = run(
+            "brightness",
+            lambda img, level: self._boost_brightness(img, BRIGHTNESS_BOOST),
+            enhanced,
+        )
 
         # Step 2: CLAHE 적용 (대비 향상)
-        if ENABLE_CLAHE:
-            enhanced = self._apply_clahe_to_color(enhanced)
+        enhanced = run("clahe", self._apply_clahe_to_color, enhanced)
 
         # Step 3: 햇빛 반사 제거 (핵심!)
-        enhanced = self._suppress_specular_highlights(enhanced)
+        enhanced = run("specular", self._suppress_specular_highlights, enhanced)
 
         # Step 4: 노이즈 제거
-        if ENABLE_DENOISING:
-            enhanced = self._reduce_noise(enhanced)
+        enhanced = run("denoise", self._reduce_noise, enhanced)
 
         # Step 5: 샤프닝 (도로선 엣지 강조)
-        if ENABLE_SHARPENING:
-            enhanced = self._apply_sharpening(enhanced)
+        enhanced = run("sharpen", self._apply_sharpening, enhanced)
 
-        # 현재 프레임을 이전 프레임으로 저장
-        self.prev_frame = enhanced.copy()
+        # 현재 프레임을 이전 프레임으로 저장 (재사용 버퍼에 복사)
+        self.prev_frame = self.arena.like("prev_frame", enhanced)
+        np.copyto(self.prev_frame, enhanced)
 
         return enhanced
 
@@ -99,97 +167,187 @@ class ImageProcessor:
         Returns:
             Brightened image
         """
-        hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV).astype(np.float32)
-        hsv[:, :, 2] = np.clip(hsv[:, :, 2] + boost_value, 0, 255)
-        hsv = hsv.astype(np.uint8)
-        return cv2.cvtColor(hsv, cv2.COLOR_HSV2BGR)
+        hsv = self.arena.like("boost.hsv", image)
+        cv2.cvtColor(image, cv2.COLOR_BGR2HSV, dst=hsv)
+
+        # V 채널만 포화 덧셈 (uint8 그대로 0~255로 잘림, 룩업 테이블보다 빠름)
+        v_channel = self.arena.buffer("boost.v", image.shape[:2])
+        cv2.extractChannel(hsv, 2, dst=v_channel)
+        cv2.add(v_channel, boost_value, dst=v_channel)
+        cv2.insertChannel(v_channel, hsv, 2)
 
-    def _apply_clahe_to_color(self, image: np.ndarray) -> np.ndarray:
+        return cv2.cvtColor(
+            hsv, cv2.COLOR_HSV2BGR, dst=self.arena.like("boost.bgr", image)
+        )
+
+    def _apply_clahe_to_color(
+        self, image: np.ndarray, level: str = "full"
+    ) -> np.ndarray:
         """
         Apply CLAHE to color image (preserve color information)
 
         Args:
             image: Input BGR image
+            level: Scheduler level (only "full")
 
         Returns:
             CLAHE enhanced image
         """
         # LAB 색공간 변환 (휘도와 색상 분리)
-        lab = cv2.cvtColor(image, cv2.COLOR_BGR2LAB)
-        l_channel, a_channel, b_channel = cv2.split(lab)
+        shape = image.shape[:2]
+        lab = self.arena.like("clahe.lab", image)
+        cv2.cvtColor(image, cv2.COLOR_BGR2LAB, dst=lab)
+        l_channel = self.arena.buffer("clahe.l", shape)
+        cv2.extractChannel(lab, 0, dst=l_channel)
 
         # L 채널(휘도)에만 CLAHE 적용
-        l_channel = self.clahe.apply(l_channel)
+        enhanced_l = self.arena.buffer("clahe.enhanced_l", shape)
+        self.clahe.apply(l_channel, dst=enhanced_l)
 
-        # 대비 추가 조정
+        # 대비 추가 조정 (룩업 테이블, 실수 곱 → 0~255 자르기 → 소수점 버림과 동일)
         if CONTRAST_BOOST != 1.0:
-            l_channel = np.clip(l_channel * CONTRAST_BOOST, 0, 255).astype(np.uint8)
+            cv2.LUT(enhanced_l, self._contrast_lut(CONTRAST_BOOST), dst=enhanced_l)
+
+        # L 채널만 되돌려 넣기 (a, b 채널은 그대로)
+        cv2.insertChannel(enhanced_l, lab, 0)
+        return cv2.cvtColor(
+            lab, cv2.COLOR_LAB2BGR, dst=self.arena.like("clahe.bgr", image)
+        )
 
-        # 채널 재결합
-        enhanced_lab = cv2.merge([l_channel, a_channel, b_channel])
-        return cv2.cvtColor(enhanced_lab, cv2.COLOR_LAB2BGR)
+    def _contrast_lut(self, gain: float) -> np.ndarray:
+        """
+        대비 조정 룩업 테이블 (값 * gain → 0~255 자르기 → 소수점 버림)
+
+        Args:
+            gain: 대비 배율
 
-    def _suppress_specular_highlights(self, image: np.ndarray) -> np.ndarray:
+        Returns:
+            256칸 uint8 룩업 테이블 (cv2.LUT용, 같은 배율이면 재사용)
+        """
+        lut = self._contrast_luts.get(gain)
+        if lut is None:
+            values = np.arange(256, dtype=np.float64) * gain
+            lut = np.clip(values, 0, 255).astype(np.uint8)
+            self._contrast_luts[gain] = lut
+        return lut
+
+    def _suppress_specular_highlights(
+        self, image: np.ndarray, level: str = "full"
+    ) -> np.ndarray:
         """
-        Remove specular reflection (햇빛 반사) - FAST version
+        Remove specular reflection (햇빛 반사) - region-limited version
 
         Strategy:
-        1. Detect oversaturated bright regions (V > 250, S < 20)
-        2. Simple blur instead of inpainting (훨씬 빠름!)
+        1. Candidate rows: any channel > 250 (= HSV V > 250), skip if none
+        2. Highlight mask (V > 250, S < 20) from channel max/min, candidate rows only
+        3. Blur only each candidate row band's highlight box (padded by kernel radius)
 
         Args:
             image: Input BGR image
+            level: Scheduler level (only "full")
 
         Returns:
             Image with suppressed highlights
         """
-        hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
-        h, s, v = cv2.split(hsv)
+        height, width = image.shape[:2]
 
-        # 반사 영역 마스크 생성 (임계값을 더 엄격하게)
-        # 조건: 매우 밝고(V>250), 채도 매우 낮음(S<20) = 햇빛 반사
-        highlight_mask = ((v > 250) & (s < 20)).astype(np.uint8)
+        # 1. 반사 후보 행: 어느 채널이든 250 초과 (V = max(B, G, R) > 250과 동일)
+        # 후보가 없으면 바로 종료 (반사가 없는 대부분의 프레임)
+        rows = np.flatnonzero(image.reshape(height, width * 3).max(axis=1) > 250)
+        if len(rows) == 0:
+            return image
 
-        # 반사 영역이 있으면 간단히 블러 처리 (inpaint보다 10배 빠름)
-        if np.sum(highlight_mask) > 50:
-            # 반사 영역만 추출
-            result = image.copy()
-            # 작은 블러로 반사 억제
-            blurred = cv2.GaussianBlur(image, (5, 5), 0)
-            # 마스크 영역만 블러 적용
-            result[highlight_mask == 1] = blurred[highlight_mask == 1]
-            return result
+        # 2. 후보 행 구간만 반사 마스크 (전체 크기 버퍼의 같은 위치에 기록)
+        # 열까지 자르면 메모리가 연속이 아니어서 오히려 느려지므로 행만 자름
+        region = slice(rows[0], rows[-1] + 1)
+        shape = (height, width)
+        b, g, r = cv2.split(
+            image[region],
+            [self.arena.buffer(f"specular.{c}", shape)[region] for c in "bgr"],
+        )
 
-        return image
+        # 조건: 매우 밝고(V>250), 채도 매우 낮음(S<20) = 햇빛 반사
+        # 8비트 HSV에서 V = max(B, G, R)이고 V > 250이면 S < 20 ⇔ max - min <= 19
+        # (전체 BGR 색에서 HSV 변환 결과와 동일) → HSV 변환 없이 채널 최대/최소로 계산
+        brightest = self.arena.buffer("specular.max", shape)[region]
+        cv2.max(b, g, dst=brightest)
+        cv2.max(brightest, r, dst=brightest)
+        cv2.min(b, g, dst=b)
+        cv2.min(b, r, dst=b)
+        spread = cv2.subtract(brightest, b, dst=b)
+        cv2.threshold(brightest, 250, 255, cv2.THRESH_BINARY, dst=brightest)
+        cv2.threshold(spread, 19, 255, cv2.THRESH_BINARY_INV, dst=spread)
+        highlight_mask = self.arena.buffer("specular.mask", shape)
+        cv2.bitwise_and(brightest, spread, dst=highlight_mask[region])
+        if cv2.countNonZero(highlight_mask[region]) <= self.SPECULAR_MIN_PIXELS:
+            return image
 
-    def _reduce_noise(self, image: np.ndarray) -> np.ndarray:
+        # 3. 후보 행 구간별 반사 영역 (구간이 많으면 후보 행 전체 하나로)
+        breaks = np.flatnonzero(np.diff(rows) > self.SPECULAR_KERNEL) + 1
+        if len(breaks) >= self.SPECULAR_MAX_PATCHES:
+            bands = [rows]
+        else:
+            bands = np.split(rows, breaks)
+
+        # 4. 영역별로 커널 반경만큼 넓혀 블러 후 반사 픽셀만 덮어쓰기
+        # (넓힌 만큼 주변 픽셀을 읽으므로 전체 프레임 블러와 결과가 같음)
+        result = self.arena.like("specular.result", image)
+        np.copyto(result, image)
+        blurred = self.arena.like("specular.blurred", image)
+        pad = self.SPECULAR_KERNEL // 2
+        kernel = (self.SPECULAR_KERNEL, self.SPECULAR_KERNEL)
+        for band in bands:
+            band_y = int(band[0])
+            x, y, w, h = cv2.boundingRect(highlight_mask[band_y : band[-1] + 1])
+            if w == 0:
+                continue
+            y += band_y
+            box = (slice(y, y + h), slice(x, x + w))
+            padded = (
+                slice(max(y - pad, 0), min(y + h + pad, height)),
+                slice(max(x - pad, 0), min(x + w + pad, width)),
+            )
+            cv2.GaussianBlur(image[padded], kernel, 0, dst=blurred[padded])
+            cv2.copyTo(blurred[box], highlight_mask[box], result[box])
+        return result
+
+    def _reduce_noise(self, image: np.ndarray, level: str = "full") -> np.ndarray:
         """
         Apply non-local means denoising
 
         Args:
             image: Input BGR image
+            level: "full" (7x7 template, 21x21 search) or "fast" (5x5, 11x11)
 
         Returns:
             Denoised image
         """
         # Non-local Means Denoising: 고품질 노이즈 제거
         # h=10: 필터 강도 (높을수록 강력, 과하면 디테일 손실)
-        # templateWindowSize=7, searchWindowSize=21
-        return cv2.fastNlMeansDenoisingColored(image, None, 10, 10, 7, 21)
+        # 시간은 대략 (template x search)^2에 비례
+        template_window, search_window = self.DENOISE_WINDOWS[level]
+        denoised = self.arena.like("denoise.bgr", image)
+        return cv2.fastNlMeansDenoisingColored(
+            image, denoised, 10, 10, template_window, search_window
+        )
 
-    def _apply_sharpening(self, image: np.ndarray) -> np.ndarray:
+    def _apply_sharpening(self, image: np.ndarray, level: str = "full") -> np.ndarray:
         """
         Apply unsharp masking to enhance edges
 
         Args:
             image: Input BGR image
+            level: Scheduler level (only "full")
 
         Returns:
             Sharpened image
         """
         # Unsharp Masking: 원본 - 블러 = 엣지 강조
-        gaussian_blur = cv2.GaussianBlur(image, (0, 0), 2.0)
-        sharpened = cv2.addWeighted(image, 1.5, gaussian_blur, -0.5, 0)
+        gaussian_blur = cv2.GaussianBlur(
+            image, (0, 0), 2.0, dst=self.arena.like("sharpen.blur", image)
+        )
+        sharpened = self.arena.like("sharpen.bgr", image)
+        cv2.addWeighted(image, 1.5, gaussian_blur, -0.5, 0, dst=sharpened)
         return sharpened
 
     def extract_roi(self, image: np.ndarray) -> Tuple[np.ndarray, int]:
@@ -222,22 +380,18 @@ class ImageProcessor:
         Returns:
             차선 마스크 (이진 이미지)
         """
-        # HSV 변환
-        hsv = cv2.cvtColor(roi, cv2.COLOR_BGR2HSV)
-
-        # 흰색 차선 검출
-        lower_white = np.array([0, 0, white_v_min])
-        upper_white = np.array([180, white_s_max, 255])
-        mask_white = cv2.inRange(hsv, lower_white, upper_white)
-
-        # 빨간색 차선 검출 (보너스)
-        mask_red = self._detect_red_lanes(hsv)
-
-        # 통합 마스크
-        mask = cv2.bitwise_or(mask_white, mask_red)
+        shape = roi.shape[:2]
+
+        # 흰색 + 빨간색 차선 (룩업 테이블 한 번 조회)
+        mask = self.color_lut.apply(
+            roi,
+            ("lane", white_v_min, white_s_max),
+            lambda hsv: self._classify_lane(hsv, white_v_min, white_s_max),
+            dst=self.arena.buffer("lane.raw", shape),
+        )
 
         # 노이즈 제거
-        mask = self._remove_noise(mask)
+        mask = self._remove_noise(mask, dst=self.arena.buffer("lane.mask", shape))
 
         return mask
 
@@ -258,21 +412,79 @@ class ImageProcessor:
         Returns:
             세그멘테이션 마스크 (0, 1, 2 값)
         """
-        h, w = roi.shape[:2]
-        seg_mask = np.zeros((h, w), dtype=np.uint8)
+        shape = roi.shape[:2]
+
+        # 픽셀별 색상 코드 (SEG_BLACK | SEG_LANE, 룩업 테이블 한 번 조회)
+        codes = self.color_lut.apply(
+            roi,
+            ("segmentation", white_v_min, white_s_max),
+            lambda hsv: self._classify_segmentation(hsv, white_v_min, white_s_max),
+            dst=self.arena.buffer("segmentation.codes", shape),
+        )
+
+        # 1. 검정 = 0, 나머지 = 1 (장애물)
+        seg_mask = cv2.LUT(
+            codes, _BLACK_BIT_TO_SEG, dst=self.arena.buffer("segmentation.mask", shape)
+        )
+
+        # 2. 차선 (노이즈 제거 후) = 2
+        lane_raw = cv2.LUT(
+            codes, _LANE_BIT_TO_MASK, dst=self.arena.buffer("segmentation.lane", shape)
+        )
+        lane_mask = self._remove_noise(
+            lane_raw, dst=self.arena.buffer("segmentation.clean_lane", shape)
+        )
+        # 차선 255 → 2 후 최댓값 (0/1보다 항상 큼 = 차선 픽셀만 2로 덮어씀)
+        np.minimum(lane_mask, 2, out=lane_mask)
+        np.maximum(seg_mask, lane_mask, out=seg_mask)
+
+        return seg_mask
+
+    def _classify_lane(
+        self, hsv: np.ndarray, white_v_min: int, white_s_max: int
+    ) -> np.ndarray:
+        """
+        흰색 + 빨간색 차선 분류 (룩업 테이블 생성용)
+
+        Args:
+            hsv: HSV 이미지
+            white_v_min: 흰색 V 최소값
+            white_s_max: 흰색 S 최대값
+
+        Returns:
+            차선 마스크 (255: 차선)
+        """
+        lower_white = np.array([0, 0, white_v_min])
+        upper_white = np.array([180, white_s_max, 255])
+        mask_white = cv2.inRange(hsv, lower_white, upper_white)
+
+        # 빨간색 차선 검출 (보너스)
+        mask_red = self._detect_red_lanes(hsv)
+
+        return cv2.bitwise_or(mask_white, mask_red)
+
+    def _classify_segmentation(
+        self, hsv: np.ndarray, white_v_min: int, white_s_max: int
+    ) -> np.ndarray:
+        """
+        검정 도로 / 차선 색상 분류 (룩업 테이블 생성용)
 
-        # HSV 변환
-        hsv = cv2.cvtColor(roi, cv2.COLOR_BGR2HSV)
+        Args:
+            hsv: HSV 이미지
+            white_v_min: 흰색 V 최소값
+            white_s_max: 흰색 S 최대값
 
-        # 1. 검정색 도로 검출 (BLACK_V_MIN ~ BLACK_V_MAX, 낮은 채도)
+        Returns:
+            색상 코드 (SEG_BLACK, SEG_LANE 비트 조합)
+        """
+        # 1. 검정색 도로 (BLACK_V_MIN ~ BLACK_V_MAX, 낮은 채도)
         black_mask = cv2.inRange(
             hsv,
             np.array([0, 0, BLACK_V_MIN]),
             np.array([180, BLACK_S_MAX, BLACK_V_MAX]),
         )
-        seg_mask[black_mask == 255] = 0
 
-        # 2. 차선 검출 (흰색 + 회색 + 빨간색, 확장된 범위)
+        # 2. 차선 (흰색 + 회색 + 빨간색, 확장된 범위)
         # 2-1. 밝은 흰색
         white_mask = cv2.inRange(
             hsv, np.array([0, 0, white_v_min]), np.array([180, white_s_max, 255])
@@ -286,16 +498,10 @@ class ImageProcessor:
         # 2-3. 빨간색 (확장된 범위)
         red_mask = self._detect_red_lanes(hsv)
 
-        # 차선 통합 (흰색 + 회색 + 빨간색)
         lane_mask = cv2.bitwise_or(white_mask, gray_mask)
         lane_mask = cv2.bitwise_or(lane_mask, red_mask)
-        lane_mask = self._remove_noise(lane_mask)
-        seg_mask[lane_mask == 255] = 2
 
-        # 3. 나머지 (기타 색깔 = 장애물)
-        seg_mask[(black_mask == 0) & (lane_mask == 0)] = 1
-
-        return seg_mask
+        return (black_mask & SEG_BLACK) | (lane_mask & SEG_LANE)
 
     def create_non_black_mask(self, roi: np.ndarray) -> np.ndarray:
         """
@@ -307,17 +513,24 @@ class ImageProcessor:
         Returns:
             검정 이외 영역 마스크 (이진)
         """
-        hsv = cv2.cvtColor(roi, cv2.COLOR_BGR2HSV)
+        shape = roi.shape[:2]
+        hsv = cv2.cvtColor(
+            roi, cv2.COLOR_BGR2HSV, dst=self.arena.like("non_black.hsv", roi)
+        )
 
         # V가 낮으면 검정으로 간주 → 그 반대를 취함
         black_low = np.array([0, 0, 0])
         black_high = np.array([180, 255, BLACK_V_MAX])
-        black_mask = cv2.inRange(hsv, black_low, black_high)
+        black_mask = cv2.inRange(
+            hsv, black_low, black_high, dst=self.arena.buffer("non_black.black", shape)
+        )
 
-        non_black = cv2.bitwise_not(black_mask)
+        non_black = cv2.bitwise_not(black_mask, dst=black_mask)
 
         # 노이즈 제거 재사용
-        non_black = self._remove_noise(non_black)
+        non_black = self._remove_noise(
+            non_black, dst=self.arena.buffer("non_black.mask", shape)
+        )
 
         return non_black
 
@@ -346,22 +559,26 @@ class ImageProcessor:
 
         return mask_red
 
-    def _remove_noise(self, mask: np.ndarray) -> np.ndarray:
+    def _remove_noise(
+        self, mask: np.ndarray, dst: Optional[np.ndarray] = None
+    ) -> np.ndarray:
         """
         노이즈 제거 (모폴로지 연산)
 
         Args:
             mask: 이진 마스크
+            dst: 결과 버퍼 (None이면 새로 할당)
 
         Returns:
             노이즈 제거된 마스크
         """
-        kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (5, 5))
-
         # Closing: 작은 구멍 제거
-        mask = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, kernel)
+        closed = cv2.morphologyEx(
+            mask,
+            cv2.MORPH_CLOSE,
+            self.noise_kernel,
+            dst=self.arena.like("noise.closed", mask),
+        )
 
         # Opening: 작은 점 제거
-        mask = cv2.morphologyEx(mask, cv2.MORPH_OPEN, kernel)
-
-        return mask
+        return cv2.morphologyEx(closed, cv2.MORPH_OPEN, self.noise_kernel, dst=dst)
@@ -3,15 +3,97 @@ Lane Detection and Steering Decision Module
 차선 검출 및 조향 판단 모듈 (히스토그램 분석)
 """
 
+import cv2
 import numpy as np
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
+
+from frame_pipeline import MaskStats
 
 from .config import DEADZONE_RATIO, BIAS_RATIO
 
 
+class HistogramStats:
+    """
+    밴드(상/중/하) × 영역(좌/중/우) × 값별 픽셀 수 (프레임마다 재사용)
+
+    counts[band, region, field]
+    - band: 0=상단 40%, 1=중단 30%, 2=하단 30%
+    - region: 0=left, 1=center, 2=right
+    - field: FIELDS 순서 (값 1, 2, 255, 그 외 3~254)
+    """
+
+    BANDS = ("top", "middle", "bottom")
+    REGIONS = ("left", "center", "right")
+    FIELDS = (1, 2, 255)  # 마지막 필드(인덱스 3)는 그 외 값
+
+    def __init__(self):
+        """빈 통계 초기화"""
+        self.counts = np.zeros((3, 3, 4), dtype=np.int64)
+        self.block_pixels = np.zeros((3, 3), dtype=np.int64)  # 블록별 전체 픽셀 수
+        self.weighted = np.zeros(3, dtype=np.int64)  # 영역별 가중 합
+        self.is_segmentation = True  # 0,1,2 값만 있는 마스크인지
+
+    def count(
+        self, value: int, band: Optional[int] = None, region: Optional[int] = None
+    ) -> int:
+        """
+        값별 픽셀 수 조회
+
+        Args:
+            value: 픽셀 값 (세그멘테이션 0/1/2, 이진 0/255)
+            band: 밴드 번호 (None이면 전체)
+            region: 영역 번호 (None이면 전체)
+
+        Returns:
+            픽셀 수
+
+        Raises:
+            ValueError: 집계하지 않는 값
+        """
+        if value == 0:
+            # 0은 블록 전체에서 나머지 값을 뺀 수
+            counts = self.block_pixels - self.counts.sum(axis=-1)
+        elif value in self.FIELDS:
+            counts = self.counts[..., self.FIELDS.index(value)]
+        else:
+            raise ValueError(f"집계하지 않는 값: {value} (가능: 0, {self.FIELDS})")
+
+        if band is not None:
+            counts = counts[band : band + 1]
+        if region is not None:
+            counts = counts[:, region]
+        return int(counts.sum())
+
+    def as_dict(self) -> Dict[str, int]:
+        """
+        가중 히스토그램
+
+        Returns:
+            {left: int, center: int, right: int}
+        """
+        left, center, right = self.weighted.tolist()
+        return {"left": left, "center": center, "right": right}
+
+
 class LaneDetector:
     """Lane Detector with Multi-layer ROI Weighting"""
 
+    # 밴드 가중치 (상단 40% x1, 중단 30% x2, 하단 30% x3)
+    BAND_WEIGHTS = np.array([1, 2, 3], dtype=np.int64)
+
+    # 필드 가중치 (장애물 1 → x1, 도로선 2 → x5, 255 → x0)
+    FIELD_WEIGHTS = np.array([1, 5, 0], dtype=np.int64)
+
+    def __init__(self):
+        """Initialize lane detector"""
+        self.stats = HistogramStats()
+
+        # 마스크 크기별 밴드/영역 경계 캐시
+        self._layout_shape = None
+        self._bands = None
+        self._region_starts = None
+        self._block_pixels = None
+
     def calculate_histogram(self, mask: np.ndarray) -> Dict[str, int]:
         """
         Calculate histogram with multi-layer ROI weighting
@@ -26,6 +108,212 @@ class LaneDetector:
         - 1 (obstacles): weight x1
         - 2 (lane lines): weight x5 (도로선 강조!)
 
+        Args:
+            mask: Binary or segmentation mask (0,1,2)
+
+        Returns:
+            {left: int, center: int, right: int}
+        """
+        return self.calculate_histogram_stats(mask).as_dict()
+
+    def calculate_histogram_stats(
+        self, mask: np.ndarray, stats: Optional[HistogramStats] = None
+    ) -> HistogramStats:
+        """
+        밴드 × 영역 × 값 통계를 한 번에 계산
+
+        uint8 마스크 그대로 밴드별 열 합계(cv2.reduce, int32 누적)를 구해
+        좌/중/우 영역으로 합침 (float 임시 배열 없음).
+        값 구성은 cv2.minMaxLoc 한 번(0 아닌 픽셀 최솟값, 최댓값)으로 판단
+        - 0/1/2 세그멘테이션: 블록 합계(c1 + 2×c2)와 값 2 개수(임계값 1 초과)로 분리
+        - 0/255 이진 마스크: 블록 합계 / 255 = 255 픽셀 수 (빠른 경로)
+        - 그 외 값이 섞인 마스크: 값마다 따로 셈 (일반 마스크에서는 없음)
+
+        Args:
+            mask: 이진(0/255) 또는 세그멘테이션(0/1/2) 마스크 (uint8)
+            stats: 결과를 채울 통계 객체 (None이면 self.stats 재사용)
+
+        Returns:
+            채워진 HistogramStats
+        """
+        stats = stats if stats is not None else self.stats
+        self._update_layout(mask.shape)
+        stats.block_pixels[...] = self._block_pixels
+
+        # 마스크 자신을 마스크로 주면 최솟값은 0이 아닌 픽셀 중 최솟값
+        min_nonzero, max_value, _, _ = cv2.minMaxLoc(mask, mask)
+
+        # 값 2 이하면 세그멘테이션 마스크 (기존 mask.max() <= 2 판단과 동일)
+        stats.is_segmentation = max_value <= 2
+        if stats.is_segmentation:
+            block_sums = self._region_sums(self._column_sums(mask))
+            _, lane_mask = cv2.threshold(mask, 1, 1, cv2.THRESH_BINARY)  # 값 2 → 1
+            lanes = self._region_sums(self._column_sums(lane_mask))
+            stats.counts[..., 0] = block_sums - 2 * lanes
+            stats.counts[..., 1] = lanes
+            stats.counts[..., 2:] = 0
+
+            # 가중 합 = Σ 밴드 가중치 × 필드 가중치 × 픽셀 수
+            stats.weighted[:] = self.BAND_WEIGHTS @ (
+                stats.counts[..., :3] @ self.FIELD_WEIGHTS
+            )
+            return stats
+
+        if min_nonzero == 255:
+            # 0/255 이진 마스크: 블록 합계에서 바로 255 개수
+            stats.counts[...] = 0
+            stats.counts[..., 2] = self._region_sums(self._column_sums(mask)) // 255
+        else:
+            stats.counts[...] = self._count_values_separately(mask)
+
+        # 이진 마스크: 255 픽셀 수 (가중치 없음)
+        stats.weighted[:] = stats.counts[..., 2].sum(axis=0)
+        return stats
+
+    def calculate_mask_stats(
+        self, mask: np.ndarray, values: Tuple[int, ...] = (0, 1, 2)
+    ) -> MaskStats:
+        """
+        히스토그램 밴드(상/중/하)로 나눈 마스크 통계 (한 번 계산해 함께 사용)
+
+        Args:
+            mask: uint8 마스크
+            values: 셀 픽셀 값들 (히스토그램에는 0, 1, 2 필요)
+
+        Returns:
+            row_bands가 히스토그램 밴드인 MaskStats
+        """
+        self._update_layout(mask.shape)
+        return MaskStats(mask, values, row_bands=self._bands)
+
+    def histogram_stats_from_mask_stats(
+        self, mask_stats: MaskStats, stats: Optional[HistogramStats] = None
+    ) -> HistogramStats:
+        """
+        마스크 통계에서 밴드 × 영역 통계 계산 (마스크 재스캔 없음)
+
+        세그멘테이션(0/1/2) 마스크의 밴드별 열 개수로 블록 개수를 구함.
+        통계가 히스토그램 밴드/값과 맞지 않거나 0/1/2 외 값이 있으면
+        마스크를 다시 세는 calculate_histogram_stats로 처리
+
+        Args:
+            mask_stats: calculate_mask_stats로 만든 통계
+            stats: 결과를 채울 통계 객체 (None이면 self.stats 재사용)
+
+        Returns:
+            채워진 HistogramStats
+        """
+        self._update_layout(mask_stats.mask.shape)
+        if mask_stats.row_bands != self._bands or not {0, 1, 2} <= set(
+            mask_stats.values
+        ):
+            return self.calculate_histogram_stats(mask_stats.mask, stats)
+        segmentation_pixels = sum(mask_stats.total(value) for value in (0, 1, 2))
+        if segmentation_pixels != mask_stats.size:
+            return self.calculate_histogram_stats(mask_stats.mask, stats)
+
+        stats = stats if stats is not None else self.stats
+        stats.block_pixels[...] = self._block_pixels
+        for field, value in enumerate(HistogramStats.FIELDS[:2]):
+            stats.counts[..., field] = mask_stats.block_counts(
+                value, self._region_bounds
+            )
+        stats.counts[..., 2:] = 0
+        stats.is_segmentation = True
+        stats.weighted[:] = self.BAND_WEIGHTS @ (
+            stats.counts[..., :3] @ self.FIELD_WEIGHTS
+        )
+        return stats
+
+    def _count_values_separately(self, mask: np.ndarray) -> np.ndarray:
+        """
+        값 1, 2, 255, 그 외를 값마다 따로 센 블록별 개수
+
+        Args:
+            mask: uint8 마스크
+
+        Returns:
+            (3, 3, 4) int64 개수
+        """
+        counts = np.zeros((3, 3, 4), dtype=np.int64)
+        for field, value in enumerate((0,) + HistogramStats.FIELDS):
+            hits = (mask == value).view(np.uint8)  # 0/1
+            block = self._region_sums(self._column_sums(hits))
+            if field == 0:
+                zeros = block
+            else:
+                counts[..., field - 1] = block
+        counts[..., 3] = self._block_pixels - zeros - counts[..., :3].sum(axis=-1)
+        return counts
+
+    def _column_sums(self, mask: np.ndarray) -> np.ndarray:
+        """
+        밴드별 열 합계 (uint8 → int32 누적)
+
+        Args:
+            mask: uint8 마스크
+
+        Returns:
+            (3, 너비) int64 열 합계
+        """
+        column_sums = np.zeros((3, mask.shape[1]), dtype=np.int64)
+        for band, (start, end) in enumerate(self._bands):
+            if end > start:  # 빈 밴드는 cv2.reduce 결과가 정의되지 않음
+                column_sums[band] = cv2.reduce(
+                    mask[start:end], 0, cv2.REDUCE_SUM, dtype=cv2.CV_32S
+                ).ravel()
+        return column_sums
+
+    def _region_sums(self, column_sums: np.ndarray) -> np.ndarray:
+        """
+        열 합계를 좌/중/우 영역별로 합침
+
+        Args:
+            column_sums: (3, 너비, ...) 열 합계
+
+        Returns:
+            (3, 3, ...) 블록 합계
+        """
+        if self._region_starts is not None:
+            return np.add.reduceat(column_sums, self._region_starts, axis=1)
+
+        # 너비가 3 미만이면 빈 영역이 생기므로 누적합 차이로 계산
+        cumulative = np.zeros(
+            (3, column_sums.shape[1] + 1) + column_sums.shape[2:], column_sums.dtype
+        )
+        np.cumsum(column_sums, axis=1, out=cumulative[:, 1:])
+        bounds = self._region_bounds
+        return cumulative[:, bounds[1:]] - cumulative[:, bounds[:-1]]
+
+    def _update_layout(self, shape: Tuple[int, int]):
+        """
+        마스크 크기에 맞는 밴드/영역 경계 계산 (크기가 바뀔 때만)
+
+        Args:
+            shape: 마스크 (높이, 너비)
+        """
+        if shape == self._layout_shape:
+            return
+
+        height, width = shape
+        third_width = width // 3
+        bottom_30 = int(height * 0.7)  # 하단 30% 시작점
+        middle_30 = int(height * 0.4)  # 중단 30% 시작점
+
+        self._bands = ((0, middle_30), (middle_30, bottom_30), (bottom_30, height))
+        self._region_bounds = np.array([0, third_width, third_width * 2, width])
+        band_rows = np.array([end - start for start, end in self._bands])
+        self._block_pixels = np.outer(band_rows, np.diff(self._region_bounds))
+
+        # reduceat은 영역이 모두 비어 있지 않을 때만 사용
+        self._region_starts = self._region_bounds[:3] if third_width > 0 else None
+        self._layout_shape = shape
+
+    @staticmethod
+    def calculate_histogram_reference(mask: np.ndarray) -> Dict[str, int]:
+        """
+        블록별 비교 방식 히스토그램 (기존 구현, 검증/벤치마크용)
+
         Args:
             mask: Binary or segmentation mask (0,1,2)
 
@@ -0,0 +1,271 @@
+"""
+단계 스케줄러 모듈
+
+전처리 단계별 처리 시간을 실행 중에 측정(지수 이동 평균)하고,
+프레임 예산(1000 / TARGET_FPS)을 넘으면 우선순위가 낮은 선택 단계부터
+저품질 버전으로 낮추거나 건너뜁니다. 여유가 생기면 한 단계씩 복구합니다.
+실행하지 않는 수준의 예상 시간은 조금씩 줄여, 일시적으로 느렸던 단계도
+나중에 다시 시도(측정)되도록 합니다.
+
+프레임 예산 중 전처리에 쓸 수 있는 시간 = 프레임 예산 - (캡처, 분석, 표시 등 나머지 시간)
+"""
+
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+
+class StageScheduler:
+    """프레임 예산 기반 선택 단계 실행 계획"""
+
+    def __init__(
+        self,
+        frame_budget_ms: float,
+        restore_ratio: float = 0.8,
+        smoothing: float = 0.2,
+        probe_decay: float = 0.98,
+        adaptive: bool = True,
+    ):
+        """
+        스케줄러 초기화
+
+        Args:
+            frame_budget_ms: 프레임당 시간 예산 (ms, 1000 / TARGET_FPS)
+            restore_ratio: 복구 조건 (예측 시간이 예산의 이 비율 이하일 때만 복구)
+            smoothing: 처리 시간 감소 이동 평균 계수 (0~1, 클수록 최근 값 반영)
+            probe_decay: 실행하지 않는 수준의 예상 시간 프레임당 감소율
+                (0.98 → 약 40프레임 후 절반, 재측정 기회)
+            adaptive: False면 항상 모든 활성 단계를 최고 품질로 실행
+        """
+        self.frame_budget_ms = frame_budget_ms
+        self.restore_ratio = restore_ratio
+        self.smoothing = smoothing
+        self.probe_decay = probe_decay
+        self.adaptive = adaptive
+
+        self._stages: Dict[str, Dict[str, Any]] = {}  # 실행 순서대로
+        self.overhead_ms = 0.0  # 전처리 외 프레임 시간 (이동 평균)
+
+        self.last_plan: Dict[str, Optional[str]] = {}  # 단계 → 실행 수준 (None: 생략)
+        self.plan_changed = False  # 직전 프레임과 계획이 다른지
+        self.last_times: Dict[str, float] = {}  # 단계 → 처리 시간 (ms)
+        self.stats = {"frames": 0, "degraded_frames": 0}
+
+    def add_stage(
+        self,
+        name: str,
+        levels: List[str],
+        priority: int = 0,
+        required: bool = False,
+        enabled: bool = True,
+    ):
+        """
+        단계 등록 (등록 순서 = 실행 순서)
+
+        Args:
+            name: 단계 이름
+            levels: 실행 수준 (품질 높은 순, 예: ["full", "fast"])
+            priority: 우선순위 (낮을수록 먼저 낮추거나 생략)
+            required: 필수 단계 (생략하지 않음, 수준만 낮춤)
+            enabled: 정적 설정으로 활성화 여부 (False면 실행 안 함)
+        """
+        self._stages[name] = {
+            "levels": list(levels),
+            "priority": priority,
+            "required": required,
+            "enabled": enabled,
+            "index": 0 if enabled else len(levels),  # 현재 수준 (len = 생략)
+            "cost": {},  # 수준 → 처리 시간 이동 평균 (ms)
+            "runs": {level: 0 for level in levels},
+            "skipped": 0,
+        }
+
+    @property
+    def budget_ms(self) -> float:
+        """전처리에 쓸 수 있는 시간 (ms)"""
+        return max(self.frame_budget_ms - self.overhead_ms, 0.0)
+
+    def plan(self) -> Dict[str, Optional[str]]:
+        """
+        이번 프레임 실행 계획
+
+        예상 시간이 예산을 넘으면 우선순위 낮은 단계부터 한 수준씩 낮추고,
+        예산의 restore_ratio 이하로 여유가 있으면 우선순위 높은 단계부터
+        한 프레임에 한 수준만 복구합니다 (진동 방지).
+
+        Returns:
+            단계 이름 → 실행 수준 (None: 생략)
+        """
+        if self.adaptive:
+            # 낮추거나 생략한 수준의 오래된 예상 시간 감소 (재시도 유도)
+            for stage in self._stages.values():
+                for level in stage["levels"][: stage["index"]]:
+                    if level in stage["cost"]:
+                        stage["cost"][level] *= self.probe_decay
+
+            budget = self.budget_ms
+            predicted = sum(self._cost(stage) for stage in self._stages.values())
+
+            if predicted > budget:
+                for stage in self._by_priority():
+                    while predicted > budget and self._can_degrade(stage):
+                        predicted -= self._cost(stage)
+                        stage["index"] += 1
+                        predicted += self._cost(stage)
+            else:
+                for stage in reversed(self._by_priority()):
+                    if stage["index"] <= 0 or not stage["enabled"]:
+                        continue
+                    upgraded = self._cost(stage, stage["index"] - 1)
+                    if (
+                        predicted - self._cost(stage) + upgraded
+                        <= budget * self.restore_ratio
+                    ):
+                        stage["index"] -= 1
+                    break
+
+        plan = {name: self._level(stage) for name, stage in self._stages.items()}
+        self.plan_changed = plan != self.last_plan
+        self.last_plan = plan
+        self.last_times = {}
+        self.stats["frames"] += 1
+        if any(
+            stage["enabled"] and stage["index"] > 0 for stage in self._stages.values()
+        ):
+            self.stats["degraded_frames"] += 1
+        return self.last_plan
+
+    def record(self, name: str, level: Optional[str], elapsed_ms: float):
+        """
+        단계 처리 시간 기록
+
+        Args:
+            name: 단계 이름
+            level: 실행한 수준 (None: 생략)
+            elapsed_ms: 처리 시간 (ms)
+        """
+        stage = self._stages[name]
+        if level is None:
+            if stage["enabled"]:
+                stage["skipped"] += 1
+            return
+
+        stage["runs"][level] += 1
+        self.last_times[name] = elapsed_ms
+
+        # 첫 실행은 초기화 비용이 섞이므로 두 번째 측정값으로 평균을 새로 시작
+        # 이후 증가는 즉시 반영, 감소는 이동 평균 (예산 초과를 늦게 알아채지 않도록)
+        previous = stage["cost"].get(level)
+        if stage["runs"][level] <= 2 or elapsed_ms > previous:
+            stage["cost"][level] = elapsed_ms
+        else:
+            stage["cost"][level] = previous + self.smoothing * (elapsed_ms - previous)
+
+    def run(
+        self,
+        name: str,
+        func: Callable[[np.ndarray, str], np.ndarray],
+        image: np.ndarray,
+    ) -> np.ndarray:
+        """
+        이번 계획대로 단계 실행 + 처리 시간 기록
+
+        Args:
+            name: 단계 이름
+            func: 단계 함수 (func(image, level))
+            image: 입력 이미지
+
+        Returns:
+            단계 결과 (생략 시 입력 이미지 그대로)
+        """
+        level = self.last_plan.get(name)
+        if level is None:
+            self.record(name, None, 0.0)
+            return image
+
+        start = time.perf_counter()
+        result = func(image, level)
+        self.record(name, level, (time.perf_counter() - start) * 1000)
+        return result
+
+    def end_frame(self, frame_ms: float):
+        """
+        프레임 전체 시간 기록 (전처리 외 시간 추정, 다음 프레임 예산에 반영)
+
+        Args:
+            frame_ms: 이번 프레임 전체 처리 시간 (캡처 ~ 표시, ms)
+        """
+        overhead = max(frame_ms - sum(self.last_times.values()), 0.0)
+        self.overhead_ms += self.smoothing * (overhead - self.overhead_ms)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        통계 조회
+
+        Returns:
+            {"frames", "degraded_frames", "budget_ms", "overhead_ms", "stages": {...}}
+        """
+        return {
+            "frames": self.stats["frames"],
+            "degraded_frames": self.stats["degraded_frames"],
+            "budget_ms": round(self.budget_ms, 1),
+            "overhead_ms": round(self.overhead_ms, 1),
+            "stages": {
+                name: {
+                    "level": self._level(stage),
+                    "cost_ms": {
+                        level: round(cost, 2) for level, cost in stage["cost"].items()
+                    },
+                    "runs": dict(stage["runs"]),
+                    "skipped": stage["skipped"],
+                }
+                for name, stage in self._stages.items()
+            },
+        }
+
+    def describe(self) -> str:
+        """
+        이번 프레임 실행 단계 요약 (로그용)
+
+        Returns:
+            예: "brightness clahe specular denoise:fast -sharpen"
+            (첫 수준이 아니면 ":수준", 생략은 "-", 정적으로 꺼진 단계는 표시 안 함)
+        """
+        parts = []
+        for name, level in self.last_plan.items():
+            stage = self._stages[name]
+            if not stage["enabled"]:
+                continue
+            if level is None:
+                parts.append(f"-{name}")
+            elif level != stage["levels"][0]:
+                parts.append(f"{name}:{level}")
+            else:
+                parts.append(name)
+        return " ".join(parts)
+
+    # ----- 내부 구현 -----
+    def _by_priority(self) -> List[Dict[str, Any]]:
+        """우선순위 낮은 순 단계 목록"""
+        return sorted(self._stages.values(), key=lambda stage: stage["priority"])
+
+    def _can_degrade(self, stage: Dict[str, Any]) -> bool:
+        """한 수준 더 낮출 수 있는지 (필수 단계는 마지막 수준까지만)"""
+        if not stage["enabled"]:
+            return False
+        lowest = len(stage["levels"]) - (1 if stage["required"] else 0)
+        return stage["index"] < lowest
+
+    def _cost(self, stage: Dict[str, Any], index: Optional[int] = None) -> float:
+        """수준별 예상 처리 시간 (측정 전이면 0, 생략이면 0)"""
+        index = stage["index"] if index is None else index
+        if index >= len(stage["levels"]):
+            return 0.0
+        return stage["cost"].get(stage["levels"][index], 0.0)
+
+    @staticmethod
+    def _level(stage: Dict[str, Any]) -> Optional[str]:
+        """현재 실행 수준 (생략이면 None)"""
+        index = stage["index"]
+        return stage["levels"][index] if index < len(stage["levels"]) else None
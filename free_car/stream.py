@@ -1,38 +1,24 @@
 import cv2
+import sys
+from pathlib import Path
 
-# 1) ESP32-CAM 스트림 주소 (본인 보드 IP로 교체)
-URL = "http://192.168.0.65/stream"
+# 저장소 루트를 sys.path에 추가 (공용 frame_source 패키지 import용)
+sys.path.append(str(Path(__file__).resolve().parent.parent))
 
-# 2) 스트림 열기
-cap = cv2.VideoCapture(URL)
+from frame_source import MJPEGStreamFrameSource
 
-# ✅ 버퍼 크기를 1로 설정하여 최신 프레임만 가져오기 (지연 해결)
-cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+# 1) ESP32-CAM 스트림 주소 (본인 보드 IP로 교체)
+URL = "http://192.168.0.65/stream"
 
-if not cap.isOpened():
-    raise RuntimeError(
-        "스트림을 열 수 없습니다.\n"
-        "👉 브라우저에서 URL (예: http://192.168.0.65/stream) 이 열리는지 먼저 확인하세요."
-    )
+# 2) 스트림 열기 (✅ 파서 버퍼 없이 최신 프레임만 처리, 끊기면 자동 재연결)
+source = MJPEGStreamFrameSource(URL)
 
 print("[INFO] 스트림 시작 - 'q' 키를 누르면 종료됩니다.")
 print("[INFO] 버퍼 최적화 적용: 최신 프레임만 처리")
 
 frame_count = 0
-skip_count = 0
-
-while True:
-    ok, frame = cap.read()
-    if not ok:
-        print("⚠️ 프레임을 불러오지 못했습니다. 연결 상태를 확인하세요.")
-        skip_count += 1
-        # ✅ 연속으로 10번 실패하면 종료 (일시적 끊김은 무시)
-        if skip_count > 10:
-            print("❌ 스트림 연결이 끊어졌습니다.")
-            break
-        continue
 
-    skip_count = 0  # 성공하면 카운트 리셋
+for frame in source:
     frame_count += 1
 
     # 3) 그레이스케일 변환 (BGR → GRAY)
@@ -70,11 +56,8 @@ while True:
     # ✅ 'r' 키로 스트림 재연결
     elif key == ord("r"):
         print("[INFO] 스트림 재연결 중...")
-        cap.release()
-        cap = cv2.VideoCapture(URL)
-        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
-        print("[INFO] 재연결 완료")
+        source.restart()
 
 # 8) 자원 해제
-cap.release()
+source.close()
 cv2.destroyAllWindows()
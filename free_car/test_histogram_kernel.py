@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+히스토그램 커널 벤치마크 스크립트
+
+LaneDetector.calculate_histogram (uint8 밴드별 열 합계 커널)과
+기존 블록별 비교 구현(calculate_histogram_reference)의 결과와 속도를 비교합니다.
+마스크 통계(MaskStats)에서 구한 히스토그램도 같은 결과인지 확인합니다.
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from realtime_analysis.lane_detector import LaneDetector
+
+SHAPES = [(60, 320), (120, 640)]
+REPEATS = 2000
+
+
+def make_masks(shape, rng):
+    """세그멘테이션(0/1/2) 마스크와 이진(0/255) 마스크 생성"""
+    segmentation = rng.choice([0, 1, 2], size=shape, p=[0.6, 0.3, 0.1])
+    binary = rng.choice([0, 255], size=shape, p=[0.8, 0.2])
+    return {
+        "segmentation": segmentation.astype(np.uint8),
+        "binary": binary.astype(np.uint8),
+    }
+
+
+def measure_us(func, mask):
+    """호출당 평균 시간 (마이크로초)"""
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        func(mask)
+    return (time.perf_counter() - start) / REPEATS * 1e6
+
+
+def main():
+    detector = LaneDetector()
+    rng = np.random.default_rng(0)
+    failed = 0
+
+    print("=" * 60)
+    print("🔍 Histogram Kernel Benchmark")
+    print("=" * 60)
+    print(f"{'mask':<24}{'reference':>12}{'kernel':>12}{'speedup':>10}")
+
+    for shape in SHAPES:
+        for kind, mask in make_masks(shape, rng).items():
+            expected = detector.calculate_histogram_reference(mask)
+            actual = detector.calculate_histogram(mask)
+            if actual != expected:
+                print(f"❌ {kind} {shape}: {actual} != {expected}")
+                failed += 1
+                continue
+            mask_stats = detector.calculate_mask_stats(mask)
+            from_stats = detector.histogram_stats_from_mask_stats(mask_stats).as_dict()
+            if from_stats != expected:
+                print(f"❌ {kind} {shape} (mask stats): {from_stats} != {expected}")
+                failed += 1
+                continue
+
+            reference_us = measure_us(detector.calculate_histogram_reference, mask)
+            kernel_us = measure_us(detector.calculate_histogram, mask)
+            label = f"{kind} {shape[1]}x{shape[0]}"
+            print(
+                f"{label:<24}{reference_us:>10.1f}us{kernel_us:>10.1f}us"
+                f"{reference_us / kernel_us:>9.1f}x"
+            )
+
+    print("=" * 60)
+    if failed:
+        print(f"❌ {failed}개 결과 불일치")
+        return 1
+    print("✅ 모든 결과 일치")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
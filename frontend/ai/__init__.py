@@ -2,3 +2,11 @@
 AI 분석 패키지
 YOLO 모델을 활용한 객체 감지 및 이미지 분석 기능
 """
+
+import sys
+from pathlib import Path
+
+# Add repo root to sys.path (shared frame_pipeline package)
+_REPO_ROOT = str(Path(__file__).resolve().parents[2])
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
@@ -3,5 +3,13 @@
 """
 
 from ai.core.autonomous_lane_tracker import AutonomousLaneTrackerV2
+from ai.core.frame_context import DebugImages, FrameContext
+from ai.core.stage_graph import GraphRun, StageGraph
 
-__all__ = ["AutonomousLaneTrackerV2"]
+__all__ = [
+    "AutonomousLaneTrackerV2",
+    "DebugImages",
+    "FrameContext",
+    "GraphRun",
+    "StageGraph",
+]
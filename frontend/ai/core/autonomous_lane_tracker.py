@@ -6,8 +6,10 @@
 
 import cv2
 import numpy as np
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import logging
+import threading
+import time
 
 from ai.filters.image_preprocessor import ImagePreprocessor
 from ai.filters.lane_mask_generator import LaneMaskGenerator
@@ -15,6 +17,10 @@ from ai.filters.noise_filter import NoiseFilter
 from ai.detectors.steering_judge import SteeringJudge
 from ai.detectors.corner_detector import CornerDetector
 from ai.visualization.visualization import Visualization
+from frame_pipeline import FrameArena, MaskStats, MotionGate
+from ai.utils.geometry_cache import GeometryCache, scale_roi
+from ai.core.frame_context import FrameContext
+from ai.core.stage_graph import GraphRun, StageGraph
 
 logger = logging.getLogger(__name__)
 
@@ -22,9 +28,19 @@ logger = logging.getLogger(__name__)
 class AutonomousLaneTrackerV2:
     """자율주행 차선 추적 클래스 V2 (모듈화)"""
 
-    # ROI 설정 (320x240 기준)
+    # ROI 설정 (320x240 기준, 실제 해상도에 맞춰 비례 변환)
     ROI_BOTTOM = {"y_start": 180, "y_end": 240, "x_start": 0, "x_end": 320}
     ROI_CENTER = {"y_start": 120, "y_end": 180, "x_start": 0, "x_end": 320}
+    REFERENCE_SIZE = (320, 240)
+
+    # 디버그 이미지 키 → 단계 그래프 노드
+    DEBUG_NODES = {
+        "1_clahe": "clahe",
+        "2_blurred": "blurred",
+        "3_roi_bottom": "roi_bottom",
+        "5_mask": "mask",
+        "6_clean_mask": "clean_mask",
+    }
 
     def __init__(
         self,
@@ -32,6 +48,10 @@ class AutonomousLaneTrackerV2:
         use_adaptive: bool = True,
         min_noise_area: int = 100,
         min_aspect_ratio: float = 2.0,
+        roi_first: bool = False,
+        motion_gate: bool = False,
+        max_reuse_age: int = 3,
+        shape_filter: bool = True,
     ):
         """
         자율주행 차선 추적기 초기화
@@ -41,20 +61,60 @@ class AutonomousLaneTrackerV2:
             use_adaptive: 적응형 HSV 사용 여부
             min_noise_area: 최소 노이즈 면적
             min_aspect_ratio: 최소 종횡비
+            roi_first: 분석 영역(ROI 합집합)만 잘라 그레이스케일로 처리
+                (False면 전체 프레임 CLAHE/블러 후 색상 룩업 테이블)
+            motion_gate: 장면 변화가 없으면 이전 판단 재사용
+            max_reuse_age: 연속 재사용 최대 프레임 수
+            shape_filter: 노이즈 제거 시 연결 요소 형태 필터 (면적 + 선형) 적용
+                (False면 Opening만)
         """
+        # 프레임 버퍼 아레나 (단계별 결과 버퍼를 프레임마다 재사용)
+        self.arena = FrameArena()
+
         # 컴포넌트 초기화
-        self.preprocessor = ImagePreprocessor()
-        self.mask_generator = LaneMaskGenerator(brightness_threshold)
-        self.noise_filter = NoiseFilter(min_noise_area, min_aspect_ratio)
+        self.preprocessor = ImagePreprocessor(arena=self.arena)
+        self.mask_generator = LaneMaskGenerator(brightness_threshold, self.arena)
+        self.noise_filter = NoiseFilter(
+            min_noise_area, min_aspect_ratio, shape_filter, arena=self.arena
+        )
         self.steering_judge = SteeringJudge()
         self.corner_detector = CornerDetector()
         self.visualizer = Visualization()
 
+        # ROI 우선 모드: 분석 영역만 처리, CLAHE 타일 높이는 전체 프레임 기준 유지
+        self.roi_first = roi_first
+
+        # 해상도별 ROI 좌표/분석 영역/CLAHE 타일 (해상도가 바뀔 때만 다시 계산)
+        self.geometry = GeometryCache(self._build_geometry)
+
         self.use_adaptive = use_adaptive
+
+        # 처리 단계 그래프 (처리 경로별, 프레임마다 필요한 단계만 한 번씩 실행)
+        self.stage_graphs = {
+            False: self._build_stage_graph(roi_first=False),
+            True: self._build_stage_graph(roi_first=True),
+        }
+        self.stage_times: Dict[str, float] = {}  # 마지막 프레임 단계별 처리 시간 (ms)
+
+        # 소비자(스레드)별 마지막 전체 분석 결과/중간 결과
+        # 중간 결과는 그 스레드의 아레나 버퍼를 가리키므로 스레드끼리 공유하지 않음
+        # (자율주행 루프와 요청 스레드가 같은 추적기를 써도 서로의 판단을 재사용하지 않음)
+        self._consumer = threading.local()
+
+        # 움직임 게이트: 마지막 분석 프레임과 거의 같으면 전체 분석 생략
+        # (기준 프레임은 게이트가 스레드별로 보관)
+        self.motion_gate = (
+            MotionGate(max_reuse_age=max_reuse_age) if motion_gate else None
+        )
         self.state = "NORMAL_DRIVING"  # NORMAL_DRIVING, CORNER_DETECTED, TURNING
 
         logger.info("자율주행 차선 추적기 V2 초기화 완료 (모듈화)")
 
+    @property
+    def last_context(self) -> Optional[FrameContext]:
+        """현재 스레드의 마지막 프레임 중간 결과"""
+        return getattr(self._consumer, "context", None)
+
     def process_frame(self, image: np.ndarray, debug: bool = False) -> Dict[str, Any]:
         """
         프레임 처리 및 조향 판단 (전체 파이프라인)
@@ -69,47 +129,38 @@ class AutonomousLaneTrackerV2:
                 "state": str,
                 "histogram": dict,
                 "confidence": float,
-                "debug_images": dict  # debug=True일 때만
+                "timings": dict,  # 단계 그룹별 처리 시간 (ms)
+                "node_timings": dict,  # 그래프 단계별 처리 시간 (ms, 실행된 단계만)
+                "reused": bool,  # 이전 판단 재사용 여부 (움직임 게이트)
+                "debug_images": Mapping  # debug=True일 때만 (지연 생성)
             }
         """
         try:
-            debug_images = {}
-
-            # 1단계: CLAHE 전처리
-            enhanced = self.preprocessor.apply_clahe(image)
-            if debug:
-                debug_images["1_clahe"] = enhanced
-
-            # 2단계: 가우시안 블러
-            blurred = self.preprocessor.apply_gaussian_blur(enhanced)
-            if debug:
-                debug_images["2_blurred"] = blurred
-
-            # 3단계: ROI 추출 (하단)
-            roi_bottom = self.preprocessor.extract_roi(blurred, self.ROI_BOTTOM)
-            if debug:
-                debug_images["3_roi_bottom"] = roi_bottom
-
-            # 4단계: HSV 변환
-            hsv = cv2.cvtColor(roi_bottom, cv2.COLOR_BGR2HSV)
-
-            # 5단계: 차선 마스크 생성
-            if self.use_adaptive:
-                mask = self.mask_generator.create_adaptive_mask(hsv, roi_bottom)
-            else:
-                mask = self.mask_generator.create_lane_mask(hsv, is_dark=False)
-
-            if debug:
-                debug_images["5_mask"] = mask
-
-            # 6단계: 노이즈 제거
-            clean_mask = self.noise_filter.remove_noise(mask)
-            if debug:
-                debug_images["6_clean_mask"] = clean_mask
-
-            # 7단계: 조향 판단
-            command, histogram, confidence = self.steering_judge.judge_steering(
-                clean_mask
+            timings = {}
+            frame_start = time.perf_counter()
+
+            # 0단계: 움직임 게이트 (장면 변화 없으면 이전 판단 재사용)
+            if self.motion_gate is not None:
+                reuse = self.motion_gate.should_reuse(image)
+                timings["motion"] = (time.perf_counter() - frame_start) * 1000
+                last_result = getattr(self._consumer, "last_result", None)
+                if reuse and last_result is not None:
+                    return self._reuse_last_result(last_result, image, timings, debug)
+
+            # 중간 결과는 컨텍스트에 참조로만 보관 (last_context로 조회 가능)
+            # 아레나 버퍼이므로 다음 프레임 처리 전까지만 유효
+            geometry = self.geometry.get_for(
+                image, roi_bottom=self.ROI_BOTTOM, roi_center=self.ROI_CENTER
+            )
+            context = FrameContext(image, self.visualizer, geometry["roi_bottom"])
+            self._consumer.context = context
+
+            # 1~7단계: 전처리 + 마스크 + 노이즈 제거 + 조향 판단 (필요한 단계만 실행)
+            run = self.stage_graphs[self.roi_first].run(image=image, geometry=geometry)
+            command, histogram, confidence = (
+                run["command"],
+                run["histogram"],
+                run["confidence"],
             )
 
             # Ensure command is not None or empty - default to CENTER
@@ -117,17 +168,26 @@ class AutonomousLaneTrackerV2:
                 command = "CENTER"
                 confidence = max(confidence, 0.5)  # Ensure minimum confidence
 
-            # 8단계: 90도 코너 감지
-            if self.corner_detector.is_corner_detected(clean_mask, histogram):
-                self.state = "CORNER_DETECTED"
+            # 8단계: 90도 코너 감지 (코너일 때만 중앙 ROI 마스크/방향 단계 실행)
+            if run["is_corner"]:
+                state = "CORNER_DETECTED"
 
                 # LookAhead ROI로 방향 판단
-                corner_command = self._judge_corner_direction(blurred)
+                corner_command = self._judge_corner_direction(run)
                 if corner_command:
                     command = corner_command
-                    self.state = "TURNING"
+                    state = "TURNING"
             else:
-                self.state = "NORMAL_DRIVING"
+                state = "NORMAL_DRIVING"
+            self.state = state
+
+            # 중간 결과 참조 보관 (디버그 이미지는 요청 시에만 사용)
+            for key, node in self.DEBUG_NODES.items():
+                context.keep(key, run[node])
+
+            timings.update(run.group_timings())
+            timings["total"] = (time.perf_counter() - frame_start) * 1000
+            self.stage_times = timings
 
             # Add direction text for overlay
             direction_text = {
@@ -140,23 +200,29 @@ class AutonomousLaneTrackerV2:
             # 결과 구성
             result = {
                 "command": command,
-                "state": self.state,
+                "state": state,
                 "histogram": histogram,
                 "confidence": confidence,
                 "direction_text": direction_text,
+                "timings": timings,
+                "node_timings": run.timings,
+                "reused": False,
             }
+            self._consumer.last_result = dict(result)
 
-            # 디버그: 시각화
+            # 디버그: 시각화 (오버레이는 "7_final"을 조회할 때 생성)
+            context.set_decision(command, state, histogram)
             if debug:
-                debug_images["7_final"] = self.visualizer.draw_analysis_overlay(
-                    image, command, self.state, histogram
-                )
-                result["debug_images"] = debug_images
+                result["debug_images"] = context.debug_images
 
             return result
 
         except Exception as e:
             logger.error(f"프레임 처리 실패: {e}")
+            # 실패한 프레임은 재사용 기준이 되지 않도록 게이트 초기화
+            self._consumer.last_result = None
+            if self.motion_gate is not None:
+                self.motion_gate.reset()
             return {
                 "command": "CENTER",  # Changed from STOP to CENTER - keep moving forward
                 "state": "ERROR",
@@ -164,27 +230,258 @@ class AutonomousLaneTrackerV2:
                 "confidence": 0.5,  # Give moderate confidence to continue moving
             }
 
-    def _judge_corner_direction(self, image: np.ndarray) -> str:
+    def _reuse_last_result(
+        self,
+        last: Dict[str, Any],
+        image: np.ndarray,
+        timings: Dict[str, float],
+        debug: bool,
+    ) -> Dict[str, Any]:
+        """
+        현재 스레드의 마지막 전체 분석 결과 재사용 (내부 메서드)
+
+        중간 결과(이 스레드의 아레나 버퍼)는 그 뒤로 덮어쓰이지 않았으므로
+        그대로 보여주고, 오버레이만 현재 이미지 위에 그립니다.
+
+        Args:
+            last: 현재 스레드의 마지막 전체 분석 결과
+            image: 현재 이미지 (BGR)
+            timings: 움직임 게이트 처리 시간이 담긴 단계별 시간 (ms)
+            debug: 디버그 모드
+
+        Returns:
+            process_frame과 같은 형식 ("reused": True)
+        """
+        result = dict(last)
+        timings["total"] = timings["motion"]
+        self.stage_times = timings
+        result["timings"] = timings
+        result["reused"] = True
+        result["reuse_age"] = self.motion_gate.reuse_age
+
+        previous = self.last_context
+        context = FrameContext(image, self.visualizer)
+        if previous is not None:
+            context.stages = previous.stages
+            context.roi_bottom = previous.roi_bottom
+        context.set_decision(last["command"], last["state"], last["histogram"])
+        self._consumer.context = context
+        if debug:
+            result["debug_images"] = context.debug_images
+        return result
+
+    def _build_geometry(
+        self,
+        width: int,
+        height: int,
+        roi_bottom: Dict[str, int],
+        roi_center: Dict[str, int],
+    ) -> Dict[str, Any]:
+        """
+        해상도별 기하 정보 계산 (GeometryCache builder, 내부 메서드)
+
+        Args:
+            width: 프레임 너비
+            height: 프레임 높이
+            roi_bottom: 기준 해상도 하단 ROI
+            roi_center: 기준 해상도 중앙 ROI
+
+        Returns:
+            {
+                "roi_bottom", "roi_center": 실제 해상도 ROI,
+                "analysis_roi": ROI 합집합 (ROI 우선 모드 처리 영역),
+                "band_roi_bottom", "band_roi_center": 분석 영역 기준 ROI,
+                "roi_preprocessor": 분석 영역용 전처리기 (CLAHE 타일 높이 맞춤)
+            }
+        """
+        size = (width, height)
+        roi_bottom = scale_roi(roi_bottom, self.REFERENCE_SIZE, size)
+        roi_center = scale_roi(roi_center, self.REFERENCE_SIZE, size)
+        analysis_roi = ImagePreprocessor.roi_union(roi_bottom, roi_center)
+
+        # 분석 영역 CLAHE 타일 높이를 전체 프레임(8x8 타일)과 같게 맞춤
+        band_height = analysis_roi["y_end"] - analysis_roi["y_start"]
+        tile_rows = max(1, round(8 * band_height / height))
+
+        logger.info(f"ROI 기하 정보 계산: {width}x{height}")
+        return {
+            "roi_bottom": roi_bottom,
+            "roi_center": roi_center,
+            "analysis_roi": analysis_roi,
+            "band_roi_bottom": ImagePreprocessor.relative_roi(roi_bottom, analysis_roi),
+            "band_roi_center": ImagePreprocessor.relative_roi(roi_center, analysis_roi),
+            "roi_preprocessor": ImagePreprocessor(
+                tile_grid_size=(8, tile_rows), arena=self.arena
+            ),
+        }
+
+    def _build_stage_graph(self, roi_first: bool) -> StageGraph:
+        """
+        처리 단계 그래프 선언 (내부 메서드)
+
+        입력 노드: image (BGR), geometry (해상도별 기하 정보)
+
+        Args:
+            roi_first: True면 분석 영역만 그레이스케일로 처리,
+                False면 전체 프레임 CLAHE/블러 후 색상 룩업 테이블
+
+        Returns:
+            단계 그래프
+        """
+        graph = StageGraph(sources=("image", "geometry"))
+        arena = self.arena
+
+        # 1~2단계: CLAHE + 가우시안 블러
+        if roi_first:
+            # CLAHE 타일 높이를 전체 프레임과 같게 맞추므로 밝기 차이는
+            # 분석 영역 위쪽 경계(반 타일)를 제외하면 ±1 이내
+            roi_keys = ("band_roi_bottom", "band_roi_center")
+            graph.add_stage(
+                "gray", self._stage_band_gray, ("image", "geometry"), group="preprocess"
+            )
+            graph.add_stage(
+                "clahe",
+                lambda gray, geometry: geometry["roi_preprocessor"].apply_clahe_gray(
+                    gray, dst=arena.like("roi.clahe", gray)
+                ),
+                ("gray", "geometry"),
+                group="preprocess",
+            )
+            blurred_name = "roi.blurred"
+        else:
+            roi_keys = ("roi_bottom", "roi_center")
+            graph.add_stage(
+                "clahe",
+                lambda image: self.preprocessor.apply_clahe(
+                    image, dst=arena.like("full.clahe", image)
+                ),
+                ("image",),
+                group="preprocess",
+            )
+            blurred_name = "full.blurred"
+        graph.add_stage(
+            "blurred",
+            lambda enhanced: self.preprocessor.apply_gaussian_blur(
+                enhanced, dst=arena.like(blurred_name, enhanced)
+            ),
+            ("clahe",),
+            group="preprocess",
+        )
+
+        # 3단계: ROI 추출 (하단)
+        bottom_key, center_key = roi_keys
+        graph.add_stage(
+            "roi_bottom",
+            lambda blurred, geometry: self.preprocessor.extract_roi(
+                blurred, geometry[bottom_key]
+            ),
+            ("blurred", "geometry"),
+            group="preprocess",
+        )
+
+        # 4~5단계: 밝기 판단 + 차선 마스크 (그레이스케일이면 밝기 임계값, BGR이면 룩업 테이블)
+        graph.add_stage("is_dark", self._stage_is_dark, ("roi_bottom",), group="mask")
+        graph.add_stage(
+            "mask",
+            lambda roi, is_dark: self._stage_lane_mask(roi, is_dark, "bottom.mask"),
+            ("roi_bottom", "is_dark"),
+            group="mask",
+        )
+
+        # 6단계: 노이즈 제거
+        graph.add_stage(
+            "clean_mask",
+            lambda mask: self.noise_filter.remove_noise(
+                mask, dst=arena.like("bottom.clean_mask", mask)
+            ),
+            ("mask",),
+            group="noise",
+        )
+
+        # 7단계: 조향 판단 (마스크 통계 한 번 계산 후 조향/코너 판단이 공유)
+        graph.add_stage("mask_stats", MaskStats, ("clean_mask",), group="steering")
+        graph.add_stage(
+            "steering",
+            self.steering_judge.judge_steering,
+            ("clean_mask", "mask_stats"),
+            outputs=("command", "histogram", "confidence"),
+            group="steering",
+        )
+
+        # 8단계: 90도 코너 감지 + LookAhead(중앙) ROI 방향 판단
+        graph.add_stage(
+            "is_corner",
+            self.corner_detector.is_corner_detected,
+            ("clean_mask", "histogram", "mask_stats"),
+            group="corner",
+        )
+        graph.add_stage(
+            "roi_center",
+            lambda blurred, geometry: self.preprocessor.extract_roi(
+                blurred, geometry[center_key]
+            ),
+            ("blurred", "geometry"),
+            group="corner",
+        )
+        graph.add_stage(
+            "corner_mask", self._stage_corner_mask, ("roi_center",), group="corner"
+        )
+        graph.add_stage(
+            "corner_direction",
+            self.corner_detector.judge_corner_direction,
+            ("corner_mask",),
+            group="corner",
+        )
+        return graph
+
+    def _stage_band_gray(
+        self, image: np.ndarray, geometry: Dict[str, Any]
+    ) -> np.ndarray:
+        """분석 영역만 잘라 그레이스케일 변환 (ROI 우선 경로 단계)"""
+        band = self.preprocessor.extract_roi(image, geometry["analysis_roi"])
+        gray = self.arena.buffer("roi.gray", band.shape[:2])
+        return cv2.cvtColor(band, cv2.COLOR_BGR2GRAY, dst=gray)
+
+    def _stage_is_dark(self, roi: np.ndarray) -> bool:
+        """어두운 환경 여부 (적응형이 아니면 항상 밝은 환경)"""
+        if not self.use_adaptive:
+            return False
+        if roi.ndim == 2:
+            return self.mask_generator.is_dark_gray(roi)
+        return self.mask_generator.is_dark_bgr(roi)
+
+    def _stage_lane_mask(
+        self, roi: np.ndarray, is_dark: bool, buffer_name: str
+    ) -> np.ndarray:
+        """차선 마스크 (그레이스케일이면 밝기 임계값, BGR이면 룩업 테이블)"""
+        dst = self.arena.buffer(buffer_name, roi.shape[:2])
+        if roi.ndim == 2:
+            return self.mask_generator.create_gray_lane_mask(roi, is_dark, dst=dst)
+        return self.mask_generator.create_lane_mask_bgr(roi, is_dark, dst=dst)
+
+    def _stage_corner_mask(self, roi_center: np.ndarray) -> np.ndarray:
+        """중앙 ROI 적응형 마스크 + 노이즈 제거 (코너 방향 판단용)"""
+        if roi_center.ndim == 2:
+            is_dark = self.mask_generator.is_dark_gray(roi_center)
+        else:
+            is_dark = self.mask_generator.is_dark_bgr(roi_center)
+        mask = self._stage_lane_mask(roi_center, is_dark, "corner.mask")
+        return self.noise_filter.remove_noise(
+            mask, dst=self.arena.like("corner.clean_mask", mask)
+        )
+
+    def _judge_corner_direction(self, run: GraphRun) -> str:
         """
         90도 코너 방향 판단 (내부 메서드)
 
         Args:
-            image: 전처리된 이미지
+            run: 이번 프레임 단계 그래프 실행 (중앙 ROI 단계는 여기서 처음 실행)
 
         Returns:
             "LEFT" | "RIGHT" | None
         """
         try:
-            # 중앙 ROI 추출
-            roi_center = self.preprocessor.extract_roi(image, self.ROI_CENTER)
-
-            # HSV 변환 및 마스크 생성
-            hsv = cv2.cvtColor(roi_center, cv2.COLOR_BGR2HSV)
-            mask = self.mask_generator.create_adaptive_mask(hsv, roi_center)
-            clean_mask = self.noise_filter.remove_noise(mask)
-
-            # 방향 판단
-            return self.corner_detector.judge_corner_direction(clean_mask)
+            return run["corner_direction"]
 
         except Exception as e:
             logger.error(f"코너 방향 판단 실패: {e}")
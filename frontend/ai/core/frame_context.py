@@ -0,0 +1,116 @@
+"""
+프레임 처리 컨텍스트 모듈
+
+추적기가 한 프레임을 처리하며 만든 중간 결과를 복사 없이 참조로 보관하고,
+디버그 이미지(오버레이 포함)는 실제로 요청될 때만 생성합니다.
+디버그 이미지를 얻기 위해 같은 프레임을 다시 분석할 필요가 없습니다.
+"""
+
+from collections.abc import Mapping
+from typing import Dict, Iterator, Optional
+
+import numpy as np
+
+
+class FrameContext:
+    """한 프레임의 중간 결과 + 판단 결과"""
+
+    def __init__(
+        self,
+        image: np.ndarray,
+        visualizer,
+        roi_bottom: Optional[Dict[str, int]] = None,
+    ):
+        """
+        컨텍스트 초기화
+
+        Args:
+            image: 원본 이미지 (BGR, 참조)
+            visualizer: 오버레이를 그릴 Visualization
+            roi_bottom: 이 프레임 해상도의 하단 ROI (오버레이 경계선 위치)
+        """
+        self.image = image
+        self.visualizer = visualizer
+        self.roi_bottom = roi_bottom
+        self.stages: Dict[str, np.ndarray] = {}  # 단계 이름 → 중간 결과 (참조)
+
+        self.command: Optional[str] = None
+        self.state: Optional[str] = None
+        self.histogram: Optional[Dict[str, int]] = None
+
+        self._debug_images: Optional["DebugImages"] = None
+
+    def keep(self, name: str, array: np.ndarray):
+        """
+        중간 결과 보관 (복사 없음)
+
+        Args:
+            name: 디버그 이미지 키 (예: "1_clahe")
+            array: 중간 결과 배열
+        """
+        self.stages[name] = array
+
+    def set_decision(self, command: str, state: str, histogram: Dict[str, int]):
+        """
+        판단 결과 기록 (오버레이용)
+
+        Args:
+            command: 조향 명령
+            state: 주행 상태
+            histogram: 히스토그램
+        """
+        self.command = command
+        self.state = state
+        self.histogram = histogram
+
+    def render_overlay(self) -> np.ndarray:
+        """
+        분석 결과 오버레이 생성
+
+        Returns:
+            오버레이가 그려진 이미지 (새 배열)
+        """
+        roi_y = self.roi_bottom["y_start"] if self.roi_bottom else None
+        return self.visualizer.draw_analysis_overlay(
+            self.image, self.command, self.state, self.histogram, roi_y
+        )
+
+    @property
+    def debug_images(self) -> "DebugImages":
+        """디버그 이미지 매핑 (지연 생성)"""
+        if self._debug_images is None:
+            self._debug_images = DebugImages(self)
+        return self._debug_images
+
+
+class DebugImages(Mapping):
+    """
+    디버그 이미지 지연 매핑
+
+    중간 결과 키는 보관된 배열을 그대로 돌려주고,
+    "7_final" 오버레이는 처음 조회할 때 한 번만 그립니다.
+    """
+
+    FINAL_KEY = "7_final"
+
+    def __init__(self, context: FrameContext):
+        """
+        Args:
+            context: 프레임 컨텍스트
+        """
+        self._context = context
+        self._final: Optional[np.ndarray] = None
+
+    def __getitem__(self, key: str) -> np.ndarray:
+        if key == self.FINAL_KEY:
+            if self._final is None:
+                self._final = self._context.render_overlay()
+            return self._final
+        return self._context.stages[key]
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._context.stages
+        yield self.FINAL_KEY
+
+    def __len__(self) -> int:
+        return len(self._context.stages) + 1
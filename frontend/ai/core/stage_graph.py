@@ -0,0 +1,156 @@
+"""
+단계 그래프 모듈
+
+프레임 처리 단계를 (이름, 입력 노드, 출력 노드)로 선언해 두고,
+요청한 출력에 필요한 단계만 한 번씩 실행합니다.
+
+- 중간 결과는 프레임(GraphRun)마다 메모이제이션 (같은 노드를 두 번 계산하지 않음)
+- 요청하지 않은 출력의 단계는 실행하지 않음 (예: 코너가 아니면 코너 방향 단계 생략)
+- 단계별 처리 시간(입력 계산 시간 제외)과 그룹별 합계 기록
+"""
+
+import time
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+
+class StageGraph:
+    """선언형 단계 그래프 (입력 노드 → 단계 → 출력 노드)"""
+
+    def __init__(self, sources: Iterable[str] = ()):
+        """
+        그래프 초기화
+
+        Args:
+            sources: 외부에서 넣어 주는 입력 노드 이름 (예: "image")
+        """
+        self.sources: Tuple[str, ...] = tuple(sources)
+        self._stages: Dict[str, Dict[str, Any]] = {}  # 단계 이름 → 단계 (선언 순서)
+        self._producers: Dict[str, str] = {}  # 출력 노드 → 단계 이름
+
+    def add_stage(
+        self,
+        name: str,
+        func: Callable[..., Any],
+        inputs: Iterable[str] = (),
+        outputs: Optional[Iterable[str]] = None,
+        group: Optional[str] = None,
+    ):
+        """
+        단계 선언
+
+        입력 노드는 먼저 선언된 단계의 출력이나 입력 노드여야 하므로
+        순환이 생기지 않습니다.
+
+        Args:
+            name: 단계 이름 (처리 시간 키)
+            func: 단계 함수 (func(*입력 값)), 출력이 여러 개면 튜플 반환
+            inputs: 입력 노드 이름들
+            outputs: 출력 노드 이름들 (None이면 단계 이름 하나)
+            group: 처리 시간 합계 그룹 (None이면 단계 이름)
+
+        Raises:
+            ValueError: 중복 단계/출력 또는 선언되지 않은 입력
+        """
+        inputs = tuple(inputs)
+        outputs = (name,) if outputs is None else tuple(outputs)
+        if name in self._stages:
+            raise ValueError(f"이미 선언된 단계: {name}")
+        for node in inputs:
+            if node not in self._producers and node not in self.sources:
+                raise ValueError(f"선언되지 않은 입력 노드: {node} (단계: {name})")
+        for node in outputs:
+            if node in self._producers or node in self.sources:
+                raise ValueError(f"이미 선언된 출력 노드: {node} (단계: {name})")
+
+        self._stages[name] = {
+            "func": func,
+            "inputs": inputs,
+            "outputs": outputs,
+            "group": group or name,
+        }
+        for node in outputs:
+            self._producers[node] = name
+
+    def run(self, **sources) -> "GraphRun":
+        """
+        한 프레임 실행 시작 (단계는 노드를 조회할 때 실행)
+
+        Args:
+            sources: 입력 노드 값
+
+        Returns:
+            프레임 실행 객체
+
+        Raises:
+            ValueError: 입력 노드 값 누락
+        """
+        missing = [name for name in self.sources if name not in sources]
+        if missing:
+            raise ValueError(f"입력 노드 값 누락: {missing}")
+        return GraphRun(self, sources)
+
+
+class GraphRun:
+    """한 프레임의 단계 그래프 실행 (노드 값 메모이제이션 + 처리 시간)"""
+
+    def __init__(self, graph: StageGraph, sources: Dict[str, Any]):
+        """
+        Args:
+            graph: 단계 그래프
+            sources: 입력 노드 값
+        """
+        self.graph = graph
+        self.values: Dict[str, Any] = dict(sources)  # 노드 → 값 (계산된 것만)
+        self.timings: Dict[str, float] = {}  # 단계 → 처리 시간 (ms, 실행 순서)
+
+    def get(self, node: str) -> Any:
+        """
+        노드 값 조회 (처음 조회할 때 필요한 단계만 실행)
+
+        Args:
+            node: 노드 이름
+
+        Returns:
+            노드 값
+
+        Raises:
+            KeyError: 선언되지 않은 노드
+        """
+        if node in self.values:
+            return self.values[node]
+
+        stage_name = self.graph._producers.get(node)
+        if stage_name is None:
+            raise KeyError(f"선언되지 않은 노드: {node}")
+        stage = self.graph._stages[stage_name]
+
+        args = [self.get(name) for name in stage["inputs"]]
+        start = time.perf_counter()
+        result = stage["func"](*args)
+        self.timings[stage_name] = (time.perf_counter() - start) * 1000
+
+        if len(stage["outputs"]) == 1:
+            self.values[stage["outputs"][0]] = result
+        else:
+            self.values.update(zip(stage["outputs"], result))
+        return self.values[node]
+
+    def __getitem__(self, node: str) -> Any:
+        return self.get(node)
+
+    def __contains__(self, node: str) -> bool:
+        """이미 계산된 노드인지"""
+        return node in self.values
+
+    def group_timings(self) -> Dict[str, float]:
+        """
+        그룹별 처리 시간 합계
+
+        Returns:
+            그룹 → 처리 시간 (ms, 실행된 단계만)
+        """
+        groups: Dict[str, float] = {}
+        for stage_name, elapsed in self.timings.items():
+            group = self.graph._stages[stage_name]["group"]
+            groups[group] = groups.get(group, 0.0) + elapsed
+        return groups
@@ -3,8 +3,15 @@
 """
 
 from ai.detectors.lane_detector import LaneDetector
+from ai.detectors.birds_eye_lane_detector import BirdsEyeLaneDetector
 from ai.detectors.yolo_detector import YOLODetector
 from ai.detectors.corner_detector import CornerDetector
 from ai.detectors.steering_judge import SteeringJudge
 
-__all__ = ["LaneDetector", "YOLODetector", "CornerDetector", "SteeringJudge"]
+__all__ = [
+    "LaneDetector",
+    "BirdsEyeLaneDetector",
+    "YOLODetector",
+    "CornerDetector",
+    "SteeringJudge",
+]
@@ -0,0 +1,456 @@
+"""
+버드아이뷰 차선 감지 모듈
+
+카메라 보정값(원근 사다리꼴)으로 역원근 변환 맵을 한 번만 계산해 두고
+(cv2.remap, 해상도별 캐시) 위에서 내려다본 이진 마스크에서 차선을 2차 곡선으로 맞춥니다.
+
+- 잠금 전: 하단 히스토그램 봉우리에서 시작해 슬라이딩 윈도우로 차선 픽셀 수집
+- 잠금 후: 이전 곡선 주변 margin 안의 픽셀만 사용 (윈도우 탐색 생략)
+- 결과: 연속적인 횡방향 오프셋(픽셀/미터)과 곡률
+
+LaneDetector와 같은 detect_lanes / draw_lanes / calculate_center_offset 인터페이스를
+제공하므로 그대로 바꿔 쓸 수 있습니다.
+"""
+
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+import logging
+
+from ai.filters.lane_mask_generator import LaneMaskGenerator
+from frame_pipeline import FrameArena
+from ai.utils.geometry_cache import GeometryCache
+
+logger = logging.getLogger(__name__)
+
+
+class BirdsEyeLaneDetector:
+    """역원근 변환 + 슬라이딩 윈도우 2차 곡선 차선 검출 클래스"""
+
+    # 원근 사다리꼴 (이미지 비율 x, y): 좌하단, 좌상단, 우상단, 우하단
+    DEFAULT_SOURCE = ((0.0, 1.0), (0.3, 0.55), (0.7, 0.55), (1.0, 1.0))
+
+    def __init__(
+        self,
+        source_points: Sequence[Tuple[float, float]] = DEFAULT_SOURCE,
+        warp_size: Tuple[int, int] = (160, 160),
+        lane_margin_ratio: float = 0.2,
+        n_windows: int = 8,
+        window_margin: int = 16,
+        min_window_pixels: int = 20,
+        min_fit_pixels: int = 60,
+        max_lost_frames: int = 3,
+        xm_per_pix: float = 0.002,
+        ym_per_pix: float = 0.003,
+        brightness_threshold: int = 80,
+    ):
+        """
+        버드아이뷰 차선 감지기 초기화
+
+        Args:
+            source_points: 노면 위 직사각형이 보이는 원근 사다리꼴 (이미지 비율 x, y,
+                좌하단/좌상단/우상단/우하단 순서, 카메라 보정값)
+            warp_size: 버드아이뷰 크기 (가로, 세로)
+            lane_margin_ratio: 버드아이뷰에서 사다리꼴 좌우 끝의 여백 (너비 비율)
+            n_windows: 슬라이딩 윈도우 개수 (세로 분할)
+            window_margin: 윈도우/잠금 탐색 좌우 폭 (버드아이뷰 픽셀)
+            min_window_pixels: 윈도우 중심을 옮길 최소 픽셀 수
+            min_fit_pixels: 곡선을 맞출 최소 차선 픽셀 수
+            max_lost_frames: 잠금 탐색 연속 실패 허용 프레임 수 (이후 윈도우 탐색)
+            xm_per_pix: 버드아이뷰 가로 픽셀당 거리 (m, 보정값)
+            ym_per_pix: 버드아이뷰 세로 픽셀당 거리 (m, 보정값)
+            brightness_threshold: 밝기 임계값 (어두운 환경 판단)
+        """
+        self.source_points = tuple(tuple(point) for point in source_points)
+        self.warp_size = tuple(warp_size)
+        self.lane_margin_ratio = lane_margin_ratio
+        self.n_windows = n_windows
+        self.window_margin = window_margin
+        self.min_window_pixels = min_window_pixels
+        self.min_fit_pixels = min_fit_pixels
+        self.max_lost_frames = max_lost_frames
+        self.xm_per_pix = xm_per_pix
+        self.ym_per_pix = ym_per_pix
+
+        self.arena = FrameArena()
+        self.mask_generator = LaneMaskGenerator(brightness_threshold, self.arena)
+
+        # 해상도별 변환 맵/행렬 (보정값이 같으면 한 번만 계산)
+        self.geometry = GeometryCache(self._build_geometry)
+
+        # 잠금 상태 (이전 프레임 곡선)
+        self._fits: Dict[str, Optional[np.ndarray]] = {"left": None, "right": None}
+        self._lost: Dict[str, int] = {"left": 0, "right": 0}
+        self._lane_width: Optional[float] = None  # 마지막 차선 간격 (버드아이뷰 픽셀)
+        self._lock = threading.Lock()  # 잠금 상태 공유 (여러 라우트 동시 호출 대비)
+
+        self.last_model: Optional[Dict[str, Any]] = None  # 마지막 곡선/오프셋/곡률
+        self.stats = {"frames": 0, "window_searches": 0, "locked_searches": 0}
+
+        logger.info("버드아이뷰 차선 감지기 초기화 완료")
+
+    def detect(self, image: np.ndarray) -> Dict[str, Any]:
+        """
+        차선 곡선 검출
+
+        Args:
+            image: OpenCV 이미지 (BGR)
+
+        Returns:
+            {
+                "lanes": detect_lanes() 형식 차선 리스트,
+                "fits": {"left", "right"}: 버드아이뷰 x = a*y^2 + b*y + c 계수 또는 None,
+                "search": "window" | "locked",
+                "offset_px": 차선 중심 - 화면 중심 (버드아이뷰 픽셀, 양수: 오른쪽),
+                "offset_m": 같은 값 (m),
+                "curvature": 부호 있는 곡률 (1/m, 양수: 오른쪽으로 휨),
+                "radius_m": 곡률 반경 (m, 직선이면 None)
+            }
+        """
+        height, width = image.shape[:2]
+        geometry = self.geometry.get(
+            width,
+            height,
+            source_points=self.source_points,
+            warp_size=self.warp_size,
+            lane_margin_ratio=self.lane_margin_ratio,
+        )
+
+        # 1. 그레이스케일 → 버드아이뷰 (고정소수점 맵으로 remap)
+        gray = self.arena.buffer("birds_eye.gray", (height, width))
+        cv2.cvtColor(image, cv2.COLOR_BGR2GRAY, dst=gray)
+        warped = self.arena.buffer("birds_eye.warped", geometry["warped_shape"])
+        cv2.remap(
+            gray,
+            geometry["map1"],
+            geometry["map2"],
+            cv2.INTER_LINEAR,
+            dst=warped,
+            borderMode=cv2.BORDER_CONSTANT,
+        )
+
+        # 2. 차선 마스크 + 차선 픽셀 좌표
+        mask = self.mask_generator.create_adaptive_gray_mask(
+            warped, dst=self.arena.like("birds_eye.mask", warped)
+        )
+        points = cv2.findNonZero(mask)
+        if points is None:
+            xs = ys = np.empty(0, dtype=np.int32)
+        else:
+            points = points.reshape(-1, 2)
+            xs, ys = points[:, 0], points[:, 1]
+
+        # 3. 곡선 맞춤 (잠금 상태면 이전 곡선 주변만)
+        with self._lock:
+            self.stats["frames"] += 1
+            if any(fit is not None for fit in self._fits.values()):
+                search = "locked"
+                self.stats["locked_searches"] += 1
+                fits = self._search_around_fits(xs, ys)
+            else:
+                search = "window"
+                self.stats["window_searches"] += 1
+                fits = self._sliding_window(mask, xs, ys)
+
+            self._update_lock(fits)
+            model = self._build_model(fits, geometry, search)
+            self.last_model = model
+
+        return model
+
+    def detect_lanes(self, image: np.ndarray) -> List[Dict[str, Any]]:
+        """
+        이미지에서 차선 감지 (LaneDetector와 같은 형식)
+
+        Args:
+            image: OpenCV 이미지 (numpy array)
+
+        Returns:
+            감지된 차선 리스트
+            예: [
+                {
+                    "side": "left",
+                    "line": {"x1": 100, "y1": 400, "x2": 200, "y2": 300},
+                    "points": [[x, y], ...]  # 원본 이미지 기준 곡선
+                }
+            ]
+        """
+        try:
+            return self.detect(image)["lanes"]
+        except Exception as e:
+            logger.error(f"버드아이뷰 차선 감지 실패: {e}")
+            return []
+
+    def calculate_center_offset(
+        self, lanes: List[Dict[str, Any]], image_width: int
+    ) -> Optional[int]:
+        """
+        차선 중심과 이미지 중심의 오프셋 계산 (원본 이미지 하단 기준)
+
+        Args:
+            lanes: detect_lanes() 결과
+            image_width: 이미지 너비
+
+        Returns:
+            오프셋 (픽셀) - 양수: 오른쪽, 음수: 왼쪽, None: 계산 불가
+        """
+        sides = {lane["side"]: lane for lane in lanes}
+        if "left" not in sides or "right" not in sides:
+            return None
+
+        lane_center = (sides["left"]["line"]["x1"] + sides["right"]["line"]["x1"]) // 2
+        return lane_center - image_width // 2
+
+    def draw_lanes(self, image: np.ndarray, lanes: List[Dict[str, Any]]) -> np.ndarray:
+        """
+        이미지에 차선 곡선 그리기
+
+        Args:
+            image: 원본 이미지
+            lanes: detect_lanes() 결과
+
+        Returns:
+            차선이 그려진 이미지
+        """
+        result_image = image.copy()
+
+        for lane in lanes:
+            color = (0, 255, 0) if lane["side"] == "left" else (0, 0, 255)
+            points = np.array(lane["points"], dtype=np.int32).reshape(-1, 1, 2)
+            cv2.polylines(result_image, [points], False, color, 3)
+
+        model = self.last_model
+        if model is not None and model["offset_m"] is not None:
+            radius = f"{model['radius_m']:.1f}m" if model["radius_m"] else "straight"
+            cv2.putText(
+                result_image,
+                f"offset {model['offset_m'] * 100:+.1f}cm  R {radius}",
+                (10, 20),
+                cv2.FONT_HERSHEY_SIMPLEX,
+                0.5,
+                (255, 255, 255),
+                1,
+            )
+
+        return result_image
+
+    def reset(self):
+        """잠금 해제 (다음 프레임은 슬라이딩 윈도우 탐색)"""
+        with self._lock:
+            self._fits = {"left": None, "right": None}
+            self._lost = {"left": 0, "right": 0}
+            self._lane_width = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        통계 조회
+
+        Returns:
+            {"frames", "window_searches", "locked_searches", "locked"}
+        """
+        return {
+            **self.stats,
+            "locked": [side for side, fit in self._fits.items() if fit is not None],
+        }
+
+    # ----- 내부 구현 -----
+    @staticmethod
+    def _build_geometry(
+        width: int,
+        height: int,
+        source_points: Tuple[Tuple[float, float], ...],
+        warp_size: Tuple[int, int],
+        lane_margin_ratio: float,
+    ) -> Dict[str, Any]:
+        """
+        역원근 변환 맵 계산 (GeometryCache builder)
+
+        Returns:
+            {"map1", "map2": cv2.remap 고정소수점 맵,
+             "to_image": 버드아이뷰 → 원본 변환 행렬, "warped_shape": (높이, 너비)}
+        """
+        warp_width, warp_height = warp_size
+        source = np.float32([(x * width, y * height) for x, y in source_points])
+        left = warp_width * lane_margin_ratio
+        right = warp_width * (1 - lane_margin_ratio)
+        target = np.float32(
+            [(left, warp_height), (left, 0), (right, 0), (right, warp_height)]
+        )
+        to_image = cv2.getPerspectiveTransform(target, source)
+
+        # 버드아이뷰 각 픽셀의 원본 좌표 (remap 맵)
+        grid_x, grid_y = np.meshgrid(
+            np.arange(warp_width, dtype=np.float32),
+            np.arange(warp_height, dtype=np.float32),
+        )
+        grid = np.stack([grid_x, grid_y], axis=-1).reshape(-1, 1, 2)
+        mapped = cv2.perspectiveTransform(grid, to_image).reshape(
+            warp_height, warp_width, 2
+        )
+        map1, map2 = cv2.convertMaps(
+            mapped[..., 0].copy(), mapped[..., 1].copy(), cv2.CV_16SC2
+        )
+
+        logger.info(f"버드아이뷰 변환 맵 계산: {width}x{height} → {warp_size}")
+        return {
+            "map1": map1,
+            "map2": map2,
+            "to_image": to_image,
+            "warped_shape": (warp_height, warp_width),
+        }
+
+    def _sliding_window(
+        self, mask: np.ndarray, xs: np.ndarray, ys: np.ndarray
+    ) -> Dict[str, Optional[np.ndarray]]:
+        """하단 히스토그램 봉우리에서 시작하는 슬라이딩 윈도우 탐색"""
+        height, width = mask.shape
+        histogram = cv2.reduce(
+            mask[height // 2 :], 0, cv2.REDUCE_SUM, dtype=cv2.CV_32S
+        ).ravel()
+        midpoint = width // 2
+        bases = {
+            "left": int(np.argmax(histogram[:midpoint])),
+            "right": midpoint + int(np.argmax(histogram[midpoint:])),
+        }
+
+        window_height = height // self.n_windows
+        fits = {}
+        for side, base in bases.items():
+            if histogram[base] == 0:
+                fits[side] = None
+                continue
+
+            current = base
+            selected = []
+            for window in range(self.n_windows):
+                y_high = height - window * window_height
+                y_low = y_high - window_height
+                inside = np.flatnonzero(
+                    (ys >= y_low)
+                    & (ys < y_high)
+                    & (xs >= current - self.window_margin)
+                    & (xs < current + self.window_margin)
+                )
+                selected.append(inside)
+                if len(inside) >= self.min_window_pixels:
+                    current = int(xs[inside].mean())
+
+            fits[side] = self._fit(xs, ys, np.concatenate(selected))
+        return fits
+
+    def _search_around_fits(
+        self, xs: np.ndarray, ys: np.ndarray
+    ) -> Dict[str, Optional[np.ndarray]]:
+        """이전 곡선 주변 margin 안의 픽셀로 다시 맞춤 (잠금 탐색)"""
+        fits = {}
+        for side, previous in self._fits.items():
+            if previous is None:
+                fits[side] = None
+                continue
+            predicted = np.polyval(previous, ys)
+            inside = np.flatnonzero(np.abs(xs - predicted) < self.window_margin)
+            fits[side] = self._fit(xs, ys, inside)
+        return fits
+
+    def _fit(
+        self, xs: np.ndarray, ys: np.ndarray, selected: np.ndarray
+    ) -> Optional[np.ndarray]:
+        """선택 픽셀로 x = a*y^2 + b*y + c 맞춤 (픽셀 부족하면 None)"""
+        if len(selected) < self.min_fit_pixels:
+            return None
+        return np.polyfit(ys[selected].astype(np.float64), xs[selected], 2)
+
+    def _update_lock(self, fits: Dict[str, Optional[np.ndarray]]):
+        """잠금 상태 갱신 (실패 시 max_lost_frames까지 이전 곡선 유지)"""
+        for side, fit in fits.items():
+            if fit is not None:
+                self._fits[side] = fit
+                self._lost[side] = 0
+            elif self._fits[side] is not None:
+                self._lost[side] += 1
+                if self._lost[side] > self.max_lost_frames:
+                    self._fits[side] = None
+
+    def _build_model(
+        self,
+        fits: Dict[str, Optional[np.ndarray]],
+        geometry: Dict[str, Any],
+        search: str,
+    ) -> Dict[str, Any]:
+        """곡선 → 차선 리스트/오프셋/곡률"""
+        warp_height, warp_width = geometry["warped_shape"]
+        y_eval = warp_height - 1
+        plot_y = np.linspace(0, y_eval, 12)
+
+        lanes = []
+        bottoms = {}
+        for side, fit in fits.items():
+            if fit is None:
+                continue
+            bottoms[side] = float(np.polyval(fit, y_eval))
+            warped_points = np.stack([np.polyval(fit, plot_y), plot_y], axis=-1)
+            image_points = cv2.perspectiveTransform(
+                warped_points.reshape(-1, 1, 2), geometry["to_image"]
+            ).reshape(-1, 2)
+            points = np.rint(image_points).astype(int)
+            lanes.append(
+                {
+                    "side": side,
+                    "line": {
+                        "x1": int(points[-1, 0]),
+                        "y1": int(points[-1, 1]),
+                        "x2": int(points[0, 0]),
+                        "y2": int(points[0, 1]),
+                    },
+                    "points": points.tolist(),
+                }
+            )
+
+        # 한쪽만 보이면 마지막 차선 간격으로 반대쪽 추정
+        if len(bottoms) == 2:
+            self._lane_width = bottoms["right"] - bottoms["left"]
+        elif bottoms and self._lane_width is not None:
+            if "left" in bottoms:
+                bottoms["right"] = bottoms["left"] + self._lane_width
+            else:
+                bottoms["left"] = bottoms["right"] - self._lane_width
+
+        model = {
+            "lanes": lanes,
+            "fits": {
+                side: None if fit is None else fit.tolist()
+                for side, fit in fits.items()
+            },
+            "search": search,
+            "offset_px": None,
+            "offset_m": None,
+            "curvature": None,
+            "radius_m": None,
+        }
+        if len(bottoms) == 2:
+            offset_px = (bottoms["left"] + bottoms["right"]) / 2 - warp_width / 2
+            model["offset_px"] = round(offset_px, 1)
+            model["offset_m"] = round(offset_px * self.xm_per_pix, 4)
+
+        valid = [fit for fit in fits.values() if fit is not None]
+        if valid:
+            model["curvature"], model["radius_m"] = self._curvature(
+                np.mean(valid, axis=0), y_eval
+            )
+        return model
+
+    def _curvature(
+        self, fit: np.ndarray, y_eval: float
+    ) -> Tuple[float, Optional[float]]:
+        """버드아이뷰 픽셀 곡선 → 미터 단위 부호 있는 곡률 / 곡률 반경"""
+        # x = a*y^2 + b*y + c (픽셀) → 미터 단위 계수
+        a = fit[0] * self.xm_per_pix / self.ym_per_pix**2
+        b = fit[1] * self.xm_per_pix / self.ym_per_pix
+        y = y_eval * self.ym_per_pix
+
+        # a > 0: 위쪽(진행 방향)으로 갈수록 x 증가 = 오른쪽으로 휨
+        curvature = 2 * a / (1 + (2 * a * y + b) ** 2) ** 1.5
+        radius = 1 / abs(curvature) if abs(curvature) > 1e-6 else None
+        return round(float(curvature), 4), None if radius is None else round(radius, 2)
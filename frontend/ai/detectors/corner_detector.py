@@ -8,6 +8,8 @@ import numpy as np
 from typing import Dict, Optional
 import logging
 
+from frame_pipeline import MaskStats
+
 logger = logging.getLogger(__name__)
 
 
@@ -32,20 +34,27 @@ class CornerDetector:
         self.threshold_corner_balance = threshold_corner_balance
         self.threshold_direction_ratio = threshold_direction_ratio
 
-    def is_corner_detected(self, mask: np.ndarray, histogram: Dict[str, int]) -> bool:
+    def is_corner_detected(
+        self,
+        mask: np.ndarray,
+        histogram: Dict[str, int],
+        stats: Optional[MaskStats] = None,
+    ) -> bool:
         """
         90도 코너 감지
 
         Args:
             mask: 차선 마스크
             histogram: 히스토그램 {"left", "center", "right"}
+            stats: 마스크 통계 (None이면 계산)
 
         Returns:
             True: 90도 코너 감지됨
         """
-        height, width = mask.shape
-        total_pixels = width * height
-        lane_pixels = np.sum(mask == 255)
+        if stats is None:
+            stats = MaskStats(mask)
+        total_pixels = stats.size
+        lane_pixels = stats.total(255)
 
         # 조건 1: 차선 픽셀이 78% 이상
         if lane_pixels < total_pixels * self.threshold_corner_ratio:
@@ -77,24 +86,26 @@ class CornerDetector:
         # 편차가 20% 미만이면 균등 = 가로선
         return std_dev < self.threshold_corner_balance
 
-    def judge_corner_direction(self, lookahead_mask: np.ndarray) -> Optional[str]:
+    def judge_corner_direction(
+        self, lookahead_mask: np.ndarray, stats: Optional[MaskStats] = None
+    ) -> Optional[str]:
         """
         코너 방향 판단 (LookAhead ROI 분석)
 
         Args:
             lookahead_mask: 중앙 ROI 마스크
+            stats: lookahead_mask 통계 (None이면 계산)
 
         Returns:
             "LEFT" | "RIGHT" | None (판단 불가)
         """
-        # 좌우 분할 (중앙 기준)
-        height, width = lookahead_mask.shape
-        center_left = lookahead_mask[:, : width // 2]
-        center_right = lookahead_mask[:, width // 2 :]
-
-        # 픽셀 카운트
-        left_pixels = np.sum(center_left == 255)
-        right_pixels = np.sum(center_right == 255)
+        if stats is None:
+            stats = MaskStats(lookahead_mask)
+
+        # 좌우 분할 (중앙 기준) 픽셀 카운트
+        half = stats.width // 2
+        left_pixels = stats.count(255, 0, half)
+        right_pixels = stats.count(255, half)
 
         # 방향 판단 (비율 2.0 이상 = 명확한 방향)
         if left_pixels > right_pixels * self.threshold_direction_ratio:
@@ -8,6 +8,8 @@ import numpy as np
 from typing import List, Dict, Any, Optional, Tuple
 import logging
 
+from ai.utils.geometry_cache import GeometryCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -32,6 +34,9 @@ class LaneDetector:
         self.canny_low = canny_low
         self.canny_high = canny_high
 
+        # 해상도별 ROI 마스크 (프레임마다 fillPoly 하지 않음)
+        self.roi_masks = GeometryCache(self._build_roi_mask)
+
     def detect_lanes(self, image: np.ndarray) -> List[Dict[str, Any]]:
         """
         이미지에서 차선 감지
@@ -61,7 +66,7 @@ class LaneDetector:
             # 4. ROI(관심 영역) 설정
             height, width = image.shape[:2]
             roi_mask = self._create_roi_mask(height, width)
-            masked_edges = cv2.bitwise_and(edges, roi_mask)
+            masked_edges = cv2.bitwise_and(edges, roi_mask, dst=edges)
 
             # 5. Hough 변환으로 직선 검출
             lines = cv2.HoughLinesP(
@@ -84,19 +89,34 @@ class LaneDetector:
 
     def _create_roi_mask(self, height: int, width: int) -> np.ndarray:
         """
-        ROI(관심 영역) 마스크 생성
+        ROI(관심 영역) 마스크 조회 (해상도/ROI 비율별로 한 번만 생성)
 
         Args:
             height: 이미지 높이
             width: 이미지 너비
 
+        Returns:
+            ROI 마스크 (numpy array, 캐시 공유이므로 수정 금지)
+        """
+        return self.roi_masks.get(width, height, roi_top_ratio=self.roi_top_ratio)
+
+    @staticmethod
+    def _build_roi_mask(width: int, height: int, roi_top_ratio: float) -> np.ndarray:
+        """
+        ROI(관심 영역) 마스크 생성 (GeometryCache builder)
+
+        Args:
+            width: 이미지 너비
+            height: 이미지 높이
+            roi_top_ratio: ROI 상단 비율
+
         Returns:
             ROI 마스크 (numpy array)
         """
         mask = np.zeros((height, width), dtype=np.uint8)
 
         # 사다리꼴 ROI 영역 정의
-        roi_top = int(height * self.roi_top_ratio)
+        roi_top = int(height * roi_top_ratio)
         roi_points = np.array(
             [
                 [
@@ -116,69 +136,52 @@ class LaneDetector:
         self, lines: Optional[np.ndarray], image_width: int
     ) -> List[Dict[str, Any]]:
         """
-        검출된 직선을 왼쪽/오른쪽 차선으로 분류
+        검출된 직선을 왼쪽/오른쪽 차선으로 분류 (배열 연산, 선분 길이 가중 평균)
 
         Args:
-            lines: Hough 변환 결과
+            lines: Hough 변환 결과 ((N, 1, 4) 또는 (N, 4))
             image_width: 이미지 너비
 
         Returns:
             분류된 차선 리스트
         """
-        if lines is None:
+        if lines is None or len(lines) == 0:
             return []
 
-        left_lines = []
-        right_lines = []
-        center_x = image_width // 2
+        segments = lines.reshape(-1, 4).astype(np.float64)
+        x1, y1, x2, y2 = segments.T
+        dx = x2 - x1
+        dy = y2 - y1
 
-        for line in lines:
-            x1, y1, x2, y2 = line[0]
+        # 기울기 계산 (수직선은 제외)
+        not_vertical = dx != 0
+        slope = np.divide(dy, dx, out=np.zeros_like(dy), where=not_vertical)
 
-            # 기울기 계산
-            if x2 == x1:
-                continue
-            slope = (y2 - y1) / (x2 - x1)
+        # 너무 수평인 선 제외
+        steep = not_vertical & (np.abs(slope) >= 0.5)
 
-            # 너무 수평인 선 제외
-            if abs(slope) < 0.5:
-                continue
-
-            # 왼쪽 차선 (음의 기울기)
-            if slope < 0 and x1 < center_x and x2 < center_x:
-                left_lines.append((x1, y1, x2, y2))
-            # 오른쪽 차선 (양의 기울기)
-            elif slope > 0 and x1 > center_x and x2 > center_x:
-                right_lines.append((x1, y1, x2, y2))
+        # 왼쪽 차선 (음의 기울기), 오른쪽 차선 (양의 기울기)
+        center_x = image_width // 2
+        sides = {
+            "left": steep & (slope < 0) & (x1 < center_x) & (x2 < center_x),
+            "right": steep & (slope > 0) & (x1 > center_x) & (x2 > center_x),
+        }
+        lengths = np.hypot(dx, dy)
 
+        # 차선별 대표선 계산 (긴 선분일수록 큰 가중치)
         detected_lanes = []
-
-        # 왼쪽 차선 대표선 계산
-        if left_lines:
-            left_line = self._average_line(left_lines)
-            detected_lanes.append(
-                {
-                    "side": "left",
-                    "line": {
-                        "x1": left_line[0],
-                        "y1": left_line[1],
-                        "x2": left_line[2],
-                        "y2": left_line[3],
-                    },
-                }
-            )
-
-        # 오른쪽 차선 대표선 계산
-        if right_lines:
-            right_line = self._average_line(right_lines)
+        for side, selected in sides.items():
+            if not selected.any():
+                continue
+            line = self._average_line(segments[selected], lengths[selected])
             detected_lanes.append(
                 {
-                    "side": "right",
+                    "side": side,
                     "line": {
-                        "x1": right_line[0],
-                        "y1": right_line[1],
-                        "x2": right_line[2],
-                        "y2": right_line[3],
+                        "x1": line[0],
+                        "y1": line[1],
+                        "x2": line[2],
+                        "y2": line[3],
                     },
                 }
             )
@@ -186,23 +189,27 @@ class LaneDetector:
         return detected_lanes
 
     def _average_line(
-        self, lines: List[Tuple[int, int, int, int]]
+        self, lines: np.ndarray, weights: Optional[np.ndarray] = None
     ) -> Tuple[int, int, int, int]:
         """
         여러 직선의 평균 직선 계산
 
         Args:
-            lines: 직선 리스트
+            lines: 직선 배열 (N, 4) 또는 (x1, y1, x2, y2) 리스트
+            weights: 직선별 가중치 (None이면 단순 평균, 예: 선분 길이)
 
         Returns:
             평균 직선 (x1, y1, x2, y2)
         """
-        x1_avg = int(np.mean([line[0] for line in lines]))
-        y1_avg = int(np.mean([line[1] for line in lines]))
-        x2_avg = int(np.mean([line[2] for line in lines]))
-        y2_avg = int(np.mean([line[3] for line in lines]))
-
-        return (x1_avg, y1_avg, x2_avg, y2_avg)
+        lines = np.asarray(lines, dtype=np.float64).reshape(-1, 4)
+        total = 0.0 if weights is None else weights.sum()
+        if total > 0:
+            x1_avg, y1_avg, x2_avg, y2_avg = weights @ lines / total
+        else:
+            # 가중치가 없거나 길이 0인 선분만 있으면 단순 평균
+            x1_avg, y1_avg, x2_avg, y2_avg = lines.mean(axis=0)
+
+        return (int(x1_avg), int(y1_avg), int(x2_avg), int(y2_avg))
 
     def calculate_center_offset(
         self, lanes: List[Dict[str, Any]], image_width: int
@@ -5,9 +5,11 @@
 """
 
 import numpy as np
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
 import logging
 
+from frame_pipeline import MaskStats
+
 logger = logging.getLogger(__name__)
 
 
@@ -35,12 +37,15 @@ class SteeringJudge:
         self.threshold_min_pixels = threshold_min_pixels
         self.threshold_min_side = threshold_min_side
 
-    def judge_steering(self, mask: np.ndarray) -> Tuple[str, Dict[str, int], float]:
+    def judge_steering(
+        self, mask: np.ndarray, stats: Optional[MaskStats] = None
+    ) -> Tuple[str, Dict[str, int], float]:
         """
         히스토그램 기반 조향 판단
 
         Args:
             mask: 차선 마스크
+            stats: 마스크 통계 (None이면 계산)
 
         Returns:
             (command, histogram, confidence)
@@ -49,7 +54,7 @@ class SteeringJudge:
             - confidence: 0.0 ~ 1.0
         """
         # 히스토그램 계산
-        histogram = self._calculate_histogram(mask)
+        histogram = self._calculate_histogram(mask, stats)
         left_count = histogram["left"]
         center_count = histogram["center"]
         right_count = histogram["right"]
@@ -86,28 +91,27 @@ class SteeringJudge:
             # 애매하면 직진
             return "CENTER", histogram, 0.5
 
-    def _calculate_histogram(self, mask: np.ndarray) -> Dict[str, int]:
+    def _calculate_histogram(
+        self, mask: np.ndarray, stats: Optional[MaskStats] = None
+    ) -> Dict[str, int]:
         """
         히스토그램 계산 (좌/중/우 3분할)
 
         Args:
             mask: 차선 마스크
+            stats: 마스크 통계 (None이면 계산)
 
         Returns:
             {"left": int, "center": int, "right": int}
         """
-        height, width = mask.shape
-
-        # 이미지 3분할
-        third = width // 3
-        left_region = mask[:, 0:third]
-        center_region = mask[:, third : 2 * third]
-        right_region = mask[:, 2 * third :]
-
-        # 각 영역 픽셀 카운트
-        left_count = int(np.sum(left_region == 255))
-        center_count = int(np.sum(center_region == 255))
-        right_count = int(np.sum(right_region == 255))
+        if stats is None:
+            stats = MaskStats(mask)
+
+        # 이미지 3분할, 각 영역 픽셀 카운트 (열 누적합 조회)
+        third = stats.width // 3
+        left_count = stats.count(255, 0, third)
+        center_count = stats.count(255, third, 2 * third)
+        right_count = stats.count(255, 2 * third)
 
         return {
             "left": left_count,
@@ -6,39 +6,76 @@ CLAHE, 가우시안 블러, ROI 추출 등 이미지 전처리 기능 제공
 
 import cv2
 import numpy as np
-from typing import Dict
+from typing import Dict, Optional
 import logging
 
+from frame_pipeline import FrameArena
+
 logger = logging.getLogger(__name__)
 
 
 class ImagePreprocessor:
     """이미지 전처리 클래스"""
 
-    def __init__(self):
-        """전처리기 초기화 - CLAHE 객체를 미리 생성하여 재사용"""
-        self.clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
+    def __init__(
+        self,
+        clip_limit: float = 2.0,
+        tile_grid_size: tuple = (8, 8),
+        arena: Optional[FrameArena] = None,
+    ):
+        """
+        전처리기 초기화 - CLAHE 객체를 미리 생성하여 재사용
+
+        Args:
+            clip_limit: CLAHE 대비 제한
+            tile_grid_size: CLAHE 타일 개수 (가로, 세로)
+            arena: 중간 버퍼 아레나 (None이면 자체 생성)
+        """
+        self.clahe = cv2.createCLAHE(clipLimit=clip_limit, tileGridSize=tile_grid_size)
+        self.arena = arena if arena is not None else FrameArena()
 
-    def apply_clahe(self, image: np.ndarray) -> np.ndarray:
+    def apply_clahe(
+        self, image: np.ndarray, dst: Optional[np.ndarray] = None
+    ) -> np.ndarray:
         """
         CLAHE (대비 제한 적응 히스토그램 평활화) 적용 - 최적화 버전
 
         Args:
             image: 원본 BGR 이미지
+            dst: 결과 버퍼 (BGR, None이면 새로 할당)
 
         Returns:
             선명도가 개선된 이미지
         """
         # 그레이스케일로 변환하여 처리 속도 향상 (컬러 변환 생략)
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-        enhanced_gray = self.clahe.apply(gray)
+        shape = image.shape[:2]
+        gray = self.arena.buffer("preprocessor.gray", shape)
+        cv2.cvtColor(image, cv2.COLOR_BGR2GRAY, dst=gray)
+        enhanced_gray = self.arena.buffer("preprocessor.clahe", shape)
+        self.clahe.apply(gray, dst=enhanced_gray)
         # 그레이스케일을 BGR로 변환
-        enhanced = cv2.cvtColor(enhanced_gray, cv2.COLOR_GRAY2BGR)
-        return enhanced
+        return cv2.cvtColor(enhanced_gray, cv2.COLOR_GRAY2BGR, dst=dst)
+
+    def apply_clahe_gray(
+        self, gray: np.ndarray, dst: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        그레이스케일 이미지에 CLAHE 적용 (BGR 재변환 없음)
+
+        Args:
+            gray: 그레이스케일 이미지
+            dst: 결과 버퍼 (None이면 새로 할당)
+
+        Returns:
+            선명도가 개선된 그레이스케일 이미지
+        """
+        return self.clahe.apply(gray, dst=dst)
 
     @staticmethod
     def apply_gaussian_blur(
-        image: np.ndarray, kernel_size: tuple = (3, 3)
+        image: np.ndarray,
+        kernel_size: tuple = (3, 3),
+        dst: Optional[np.ndarray] = None,
     ) -> np.ndarray:
         """
         가우시안 블러 적용 (노이즈 제거) - 최적화: 커널 크기 축소
@@ -46,11 +83,12 @@ class ImagePreprocessor:
         Args:
             image: 원본 이미지
             kernel_size: 커널 크기 (기본: 3x3, 속도 향상)
+            dst: 결과 버퍼 (None이면 새로 할당)
 
         Returns:
             블러 처리된 이미지
         """
-        return cv2.GaussianBlur(image, kernel_size, 0)
+        return cv2.GaussianBlur(image, kernel_size, 0, dst=dst)
 
     @staticmethod
     def extract_roi(image: np.ndarray, roi: Dict[str, int]) -> np.ndarray:
@@ -66,6 +104,43 @@ class ImagePreprocessor:
         """
         return image[roi["y_start"] : roi["y_end"], roi["x_start"] : roi["x_end"]]
 
+    @staticmethod
+    def roi_union(*rois: Dict[str, int]) -> Dict[str, int]:
+        """
+        여러 ROI를 모두 포함하는 최소 영역 계산
+
+        Args:
+            rois: ROI 좌표들
+
+        Returns:
+            합집합 ROI 좌표
+        """
+        return {
+            "y_start": min(roi["y_start"] for roi in rois),
+            "y_end": max(roi["y_end"] for roi in rois),
+            "x_start": min(roi["x_start"] for roi in rois),
+            "x_end": max(roi["x_end"] for roi in rois),
+        }
+
+    @staticmethod
+    def relative_roi(roi: Dict[str, int], origin: Dict[str, int]) -> Dict[str, int]:
+        """
+        ROI 좌표를 다른 ROI(origin) 기준 좌표로 변환
+
+        Args:
+            roi: 변환할 ROI 좌표
+            origin: 기준 ROI 좌표 (잘라낸 영역)
+
+        Returns:
+            origin 영역 안에서의 ROI 좌표
+        """
+        return {
+            "y_start": roi["y_start"] - origin["y_start"],
+            "y_end": roi["y_end"] - origin["y_start"],
+            "x_start": roi["x_start"] - origin["x_start"],
+            "x_end": roi["x_end"] - origin["x_start"],
+        }
+
     @staticmethod
     def get_average_brightness(image: np.ndarray) -> float:
         """
@@ -6,9 +6,11 @@ HSV 색상 기반 차선 검출 (흰색 + 빨간색)
 
 import cv2
 import numpy as np
-from typing import Tuple
+from typing import Optional, Tuple
 import logging
 
+from frame_pipeline import ColorLUT, FrameArena
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,14 +26,21 @@ class LaneMaskGenerator:
     HSV_RED_1 = {"lower": np.array([0, 100, 100]), "upper": np.array([10, 255, 255])}
     HSV_RED_2 = {"lower": np.array([170, 100, 100]), "upper": np.array([180, 255, 255])}
 
-    def __init__(self, brightness_threshold: int = 80):
+    def __init__(
+        self, brightness_threshold: int = 80, arena: Optional[FrameArena] = None
+    ):
         """
         차선 마스크 생성기 초기화
 
         Args:
             brightness_threshold: 밝기 임계값 (이하면 어두운 환경)
+            arena: 중간 버퍼 아레나 (None이면 자체 생성)
         """
         self.brightness_threshold = brightness_threshold
+        self.arena = arena if arena is not None else FrameArena()
+
+        # BGR → 차선 마스크 룩업 테이블 (밝은/어두운 환경별로 한 번만 생성)
+        self.color_lut = ColorLUT(arena=self.arena)
 
     def create_lane_mask(self, hsv: np.ndarray, is_dark: bool = False) -> np.ndarray:
         """
@@ -83,3 +92,85 @@ class LaneMaskGenerator:
         is_dark = avg_brightness < self.brightness_threshold
 
         return self.create_lane_mask(hsv, is_dark)
+
+    def create_lane_mask_bgr(
+        self, bgr: np.ndarray, is_dark: bool = False, dst: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        BGR 이미지로 차선 마스크 생성 (HSV 변환/inRange 대신 룩업 테이블 한 번 조회)
+
+        Args:
+            bgr: BGR 이미지
+            is_dark: 어두운 환경 여부
+            dst: 결과 버퍼 (None이면 새로 할당)
+
+        Returns:
+            이진 마스크 (255: 차선, 0: 도로)
+        """
+        return self.color_lut.apply(
+            bgr, is_dark, lambda hsv: self.create_lane_mask(hsv, is_dark), dst=dst
+        )
+
+    def create_gray_lane_mask(
+        self, gray: np.ndarray, is_dark: bool = False, dst: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        그레이스케일 이미지로 차선 마스크 생성 (HSV 변환 생략)
+
+        CLAHE 결과(회색 BGR)의 HSV는 H=S=0, V=gray이므로
+        흰색 범위는 V 하한 비교와 같고 빨간색(S 100 이상)은 검출되지 않음.
+        create_lane_mask(HSV(GRAY2BGR(gray)))와 같은 결과
+
+        Args:
+            gray: 그레이스케일 이미지
+            is_dark: 어두운 환경 여부
+            dst: 결과 버퍼 (None이면 새로 할당)
+
+        Returns:
+            이진 마스크 (255: 차선, 0: 도로)
+        """
+        white_range = self.HSV_WHITE_DARK if is_dark else self.HSV_WHITE_BRIGHT
+        v_lower = int(white_range["lower"][2])
+        _, mask = cv2.threshold(gray, v_lower - 1, 255, cv2.THRESH_BINARY, dst=dst)
+        return mask
+
+    def create_adaptive_gray_mask(
+        self, gray: np.ndarray, dst: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        그레이스케일 이미지로 적응형 차선 마스크 생성 (밝기 자동 판단)
+
+        Args:
+            gray: 그레이스케일 이미지
+            dst: 결과 버퍼 (None이면 새로 할당)
+
+        Returns:
+            이진 마스크
+        """
+        return self.create_gray_lane_mask(gray, self.is_dark_gray(gray), dst=dst)
+
+    def is_dark_bgr(self, bgr: np.ndarray) -> bool:
+        """
+        BGR 이미지의 어두운 환경 여부 (그레이스케일 평균 밝기)
+
+        Args:
+            bgr: BGR 이미지
+
+        Returns:
+            평균 밝기가 brightness_threshold 미만이면 True
+        """
+        gray = self.arena.buffer("mask_generator.gray", bgr.shape[:2])
+        cv2.cvtColor(bgr, cv2.COLOR_BGR2GRAY, dst=gray)
+        return self.is_dark_gray(gray)
+
+    def is_dark_gray(self, gray: np.ndarray) -> bool:
+        """
+        그레이스케일 이미지의 어두운 환경 여부
+
+        Args:
+            gray: 그레이스케일 이미지
+
+        Returns:
+            평균 밝기가 brightness_threshold 미만이면 True
+        """
+        return bool(np.mean(gray) < self.brightness_threshold)
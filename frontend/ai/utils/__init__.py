@@ -2,4 +2,15 @@
 유틸리티 모듈
 """
 
-# 향후 공통 유틸리티 함수들이 추가될 예정
+from frame_pipeline import ColorLUT, FrameArena, MaskStats, MotionGate
+
+from ai.utils.geometry_cache import GeometryCache, scale_roi
+
+__all__ = [
+    "ColorLUT",
+    "FrameArena",
+    "GeometryCache",
+    "MaskStats",
+    "MotionGate",
+    "scale_roi",
+]
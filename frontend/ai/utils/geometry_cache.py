@@ -0,0 +1,140 @@
+"""
+기하 정보 캐시 모듈
+
+ROI 마스크, 다각형, 슬라이스 경계, 밴드 경계, 3분할 위치처럼
+해상도(너비, 높이)와 설정에만 의존하는 값을 (너비, 높이, 설정 해시)별로
+한 번만 계산해 두고 재사용합니다.
+카메라 framesize가 바뀌면 새 키로 다시 계산하므로 좌표가 어긋나지 않습니다.
+
+주의: 캐시된 값(마스크 배열, ROI 사전)은 여러 프레임이 공유하므로 수정하면 안 됩니다.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+import numpy as np
+
+
+class GeometryCache:
+    """해상도/설정별 기하 정보 캐시"""
+
+    def __init__(self, builder: Callable[..., Any], max_entries: int = 8):
+        """
+        캐시 초기화
+
+        Args:
+            builder: 기하 정보 생성 함수 (builder(width, height, **config))
+            max_entries: 보관할 최대 해상도/설정 조합 수 (오래된 것부터 삭제)
+        """
+        self.builder = builder
+        self.max_entries = max_entries
+
+        self._entries: "OrderedDict[Tuple, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0}
+
+    def get(self, width: int, height: int, **config) -> Any:
+        """
+        기하 정보 조회 (없으면 생성)
+
+        Args:
+            width: 프레임 너비
+            height: 프레임 높이
+            config: 기하 정보에 영향을 주는 설정 값 (해시 가능한 값으로 변환)
+
+        Returns:
+            builder 결과 (캐시 공유, 수정 금지)
+        """
+        key = (width, height, self.config_key(config))
+        with self._lock:
+            geometry = self._entries.get(key)
+            if geometry is not None:
+                self._entries.move_to_end(key)
+                self.stats["hits"] += 1
+                return geometry
+
+            self.stats["misses"] += 1
+            geometry = self.builder(width, height, **config)
+            self._entries[key] = geometry
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            return geometry
+
+    def get_for(self, image: np.ndarray, **config) -> Any:
+        """
+        이미지 크기 기준 기하 정보 조회
+
+        Args:
+            image: 이미지 (높이, 너비[, 채널])
+            config: 설정 값
+
+        Returns:
+            builder 결과
+        """
+        height, width = image.shape[:2]
+        return self.get(width, height, **config)
+
+    def clear(self):
+        """캐시 비우기"""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        통계 조회
+
+        Returns:
+            {"entries", "hits", "misses"}
+        """
+        return {
+            "entries": len(self._entries),
+            "hits": self.stats["hits"],
+            "misses": self.stats["misses"],
+        }
+
+    @staticmethod
+    def config_key(config: Dict[str, Any]) -> int:
+        """
+        설정 해시 (사전/리스트는 정렬된 튜플로 변환)
+
+        Args:
+            config: 설정 값
+
+        Returns:
+            해시 값
+        """
+        return hash(_freeze(config))
+
+
+def scale_roi(
+    roi: Dict[str, int], reference_size: Tuple[int, int], size: Tuple[int, int]
+) -> Dict[str, int]:
+    """
+    기준 해상도의 ROI 좌표를 다른 해상도로 변환
+
+    Args:
+        roi: 기준 해상도 ROI 좌표 {"y_start", "y_end", "x_start", "x_end"}
+        reference_size: 기준 해상도 (너비, 높이)
+        size: 실제 해상도 (너비, 높이)
+
+    Returns:
+        실제 해상도 ROI 좌표 (같은 해상도면 그대로)
+    """
+    ref_width, ref_height = reference_size
+    width, height = size
+    return {
+        "y_start": round(roi["y_start"] * height / ref_height),
+        "y_end": round(roi["y_end"] * height / ref_height),
+        "x_start": round(roi["x_start"] * width / ref_width),
+        "x_end": round(roi["x_end"] * width / ref_width),
+    }
+
+
+def _freeze(value: Any) -> Hashable:
+    """설정 값 → 해시 가능한 값"""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
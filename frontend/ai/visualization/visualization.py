@@ -6,21 +6,28 @@
 
 import cv2
 import numpy as np
-from typing import Dict
+from typing import Any, Dict, Optional
 import logging
 
+from ai.utils.geometry_cache import GeometryCache
+
 logger = logging.getLogger(__name__)
 
 
 class Visualization:
     """시각화 클래스"""
 
-    # ROI 설정 (320x240 기준)
+    # 레이아웃 설정 (320x240 기준, 실제 해상도에 맞춰 비례 변환)
     ROI_BOTTOM_Y = 180
+    PANEL_HEIGHT = 70
+    BAR_HEIGHT = 80
+    ARROW_SIZE = 50
+    REFERENCE_HEIGHT = 240
 
     def __init__(self):
         """시각화 초기화"""
-        pass
+        # 해상도별 레이아웃 (3분할 위치, 패널/바 높이 등)
+        self.layout = GeometryCache(self._build_layout)
 
     def draw_analysis_overlay(
         self,
@@ -28,6 +35,7 @@ class Visualization:
         command: str,
         state: str,
         histogram: Dict[str, int],
+        roi_y: Optional[int] = None,
     ) -> np.ndarray:
         """
         분석 결과 오버레이 (통합)
@@ -37,32 +45,47 @@ class Visualization:
             command: 조향 명령
             state: 주행 상태
             histogram: 히스토그램
+            roi_y: 하단 ROI 시작 Y (추적기 기하 정보, None이면 기준 비율)
 
         Returns:
             오버레이가 그려진 이미지
         """
         result = image.copy()
+        layout = self.layout.get_for(image)
 
         # 1. 상단 정보 패널
-        result = self._draw_info_panel(result, command, state)
+        result = self._draw_info_panel(result, command, state, layout)
 
         # 2. 하단 히스토그램
-        result = self._draw_histogram_bars(result, histogram)
+        result = self._draw_histogram_bars(result, histogram, layout)
 
         # 3. ROI 경계선
-        result = self._draw_roi_boundary(result)
+        result = self._draw_roi_boundary(result, layout, roi_y)
 
         # 4. 방향 화살표
-        result = self._draw_direction_arrow(result, command)
+        result = self._draw_direction_arrow(result, command, layout)
 
         return result
 
+    def _build_layout(self, width: int, height: int) -> Dict[str, Any]:
+        """해상도별 레이아웃 계산 (GeometryCache builder)"""
+        scale = height / self.REFERENCE_HEIGHT
+        return {
+            "panel_height": round(self.PANEL_HEIGHT * scale),
+            "bar_height": round(self.BAR_HEIGHT * scale),
+            "bar_y": height - round(self.BAR_HEIGHT * scale),
+            "thirds": (width // 3, 2 * width // 3),
+            "roi_y": int(height * (self.ROI_BOTTOM_Y / self.REFERENCE_HEIGHT)),
+            "center": (width // 2, height // 2),
+            "arrow_size": round(self.ARROW_SIZE * scale),
+        }
+
     def _draw_info_panel(
-        self, image: np.ndarray, command: str, state: str
+        self, image: np.ndarray, command: str, state: str, layout: Dict[str, Any]
     ) -> np.ndarray:
         """상단 정보 패널 그리기"""
         height, width = image.shape[:2]
-        panel_height = 70  # 패널 높이 감소
+        panel_height = layout["panel_height"]
 
         # 반투명 배경
         overlay = image.copy()
@@ -107,12 +130,13 @@ class Visualization:
         return image
 
     def _draw_histogram_bars(
-        self, image: np.ndarray, histogram: Dict[str, int]
+        self, image: np.ndarray, histogram: Dict[str, int], layout: Dict[str, Any]
     ) -> np.ndarray:
         """하단 히스토그램 바 그리기"""
         height, width = image.shape[:2]
-        bar_height = 80
-        bar_y = height - bar_height
+        bar_height = layout["bar_height"]
+        bar_y = layout["bar_y"]
+        third, two_thirds = layout["thirds"]
         max_count = max(histogram.values()) or 1
 
         # 반투명 배경
@@ -126,7 +150,7 @@ class Visualization:
             cv2.rectangle(
                 image,
                 (5, bar_y + (bar_height - left_bar_h - 5)),
-                (width // 3 - 5, height - 5),
+                (third - 5, height - 5),
                 (0, 0, 255),
                 -1,
             )
@@ -145,15 +169,15 @@ class Visualization:
         if center_bar_h > 0:
             cv2.rectangle(
                 image,
-                (width // 3 + 5, bar_y + (bar_height - center_bar_h - 5)),
-                (2 * width // 3 - 5, height - 5),
+                (third + 5, bar_y + (bar_height - center_bar_h - 5)),
+                (two_thirds - 5, height - 5),
                 (0, 255, 0),
                 -1,
             )
         cv2.putText(
             image,
             f"C: {histogram['center']}",
-            (width // 3 + 10, height - 10),
+            (third + 10, height - 10),
             cv2.FONT_HERSHEY_SIMPLEX,
             0.6,
             (255, 255, 255),
@@ -165,7 +189,7 @@ class Visualization:
         if right_bar_h > 0:
             cv2.rectangle(
                 image,
-                (2 * width // 3 + 5, bar_y + (bar_height - right_bar_h - 5)),
+                (two_thirds + 5, bar_y + (bar_height - right_bar_h - 5)),
                 (width - 5, height - 5),
                 (255, 0, 0),
                 -1,
@@ -173,7 +197,7 @@ class Visualization:
         cv2.putText(
             image,
             f"R: {histogram['right']}",
-            (2 * width // 3 + 10, height - 10),
+            (two_thirds + 10, height - 10),
             cv2.FONT_HERSHEY_SIMPLEX,
             0.6,
             (255, 255, 255),
@@ -182,10 +206,13 @@ class Visualization:
 
         return image
 
-    def _draw_roi_boundary(self, image: np.ndarray) -> np.ndarray:
+    def _draw_roi_boundary(
+        self, image: np.ndarray, layout: Dict[str, Any], roi_y: Optional[int] = None
+    ) -> np.ndarray:
         """ROI 경계선 그리기"""
-        height, width = image.shape[:2]
-        roi_y = int(height * (self.ROI_BOTTOM_Y / 240))
+        width = image.shape[1]
+        if roi_y is None:
+            roi_y = layout["roi_y"]
 
         cv2.line(image, (0, roi_y), (width, roi_y), (0, 255, 255), 2)
         cv2.putText(
@@ -200,18 +227,19 @@ class Visualization:
 
         return image
 
-    def _draw_direction_arrow(self, image: np.ndarray, command: str) -> np.ndarray:
+    def _draw_direction_arrow(
+        self, image: np.ndarray, command: str, layout: Dict[str, Any]
+    ) -> np.ndarray:
         """방향 화살표 그리기"""
-        height, width = image.shape[:2]
-        arrow_y = height // 2
-        arrow_size = 50
+        center_x, arrow_y = layout["center"]
+        arrow_size = layout["arrow_size"]
 
         if command == "LEFT":
             # 왼쪽 화살표
             cv2.arrowedLine(
                 image,
-                (width // 2 + arrow_size, arrow_y),
-                (width // 2 - arrow_size, arrow_y),
+                (center_x + arrow_size, arrow_y),
+                (center_x - arrow_size, arrow_y),
                 (0, 165, 255),
                 8,
                 tipLength=0.4,
@@ -220,8 +248,8 @@ class Visualization:
             # 오른쪽 화살표
             cv2.arrowedLine(
                 image,
-                (width // 2 - arrow_size, arrow_y),
-                (width // 2 + arrow_size, arrow_y),
+                (center_x - arrow_size, arrow_y),
+                (center_x + arrow_size, arrow_y),
                 (255, 0, 255),
                 8,
                 tipLength=0.4,
@@ -230,8 +258,8 @@ class Visualization:
             # 위쪽 화살표
             cv2.arrowedLine(
                 image,
-                (width // 2, arrow_y + arrow_size),
-                (width // 2, arrow_y - arrow_size),
+                (center_x, arrow_y + arrow_size),
+                (center_x, arrow_y - arrow_size),
                 (0, 255, 0),
                 8,
                 tipLength=0.4,
@@ -17,6 +17,55 @@ DEBUG_MODE = True
 REQUEST_TIMEOUT = 2
 STREAM_TIMEOUT = 10
 
+# Keep-alive 연결 풀 크기 (제어/캡처 트래픽 분리)
+CONTROL_POOL_SIZE = 2  # /control, /led, /speed, /camera, /status
+CAPTURE_POOL_SIZE = 1  # /capture (프레임 그래버 전용)
+
+
+# ==================== 프레임 그래버 설정 ====================
+
+# 모든 라우트/자율주행 루프가 하나의 /capture 수집기를 공유 (ESP32 부하 일정)
+FRAME_GRABBER_FPS = 15  # 최대 캡처 속도 (FPS)
+FRAME_GRABBER_TIMEOUT = 1.5  # 캡처 요청 타임아웃 (초)
+FRAME_GRABBER_IDLE_TIMEOUT = 5.0  # 이 시간 동안 요청이 없으면 캡처 일시 중지 (초)
+FRAME_GRABBER_PIPELINED = True  # 분석 중 다음 프레임 미리 요청 (최대 1장 대기)
+FRAME_GRABBER_STALE_AGE = 0.3  # 파이프라인 모드: 소비되지 않은 프레임 재요청 기준 (초)
+FRAME_MAX_AGE = 0.5  # 라우트가 재사용할 수 있는 최대 프레임 나이 (초)
+
+# 자율주행 세션 녹화 디렉토리 (None이면 녹화 안 함, 환경변수 FRAME_RECORD_DIR 우선)
+FRAME_RECORD_DIR = None
+
+
+# ==================== 명령 디스패처 설정 ====================
+
+# 자율주행 모터 명령은 전용 스레드가 전송 (최신 명령 우선, 정지 명령 우선 처리)
+COMMAND_TIMEOUT = 1.0  # 명령 요청 타임아웃 (초)
+COMMAND_MIN_INTERVAL = 0.05  # 조향 명령 최소 간격 (초)
+STOP_REPEATS = 3  # 정지 명령 반복 전송 횟수
+
+
+# ==================== 차선 추적 설정 ====================
+
+# 분석 영역(하단+중앙 ROI)만 잘라 그레이스케일로 처리 (False면 전체 프레임 처리)
+LANE_TRACKER_ROI_FIRST = True
+
+# 장면 변화가 없으면(정지/저속) 이전 판단 재사용, 연속 재사용은 최대 N프레임
+LANE_TRACKER_MOTION_GATE = True
+LANE_TRACKER_MAX_REUSE_AGE = 3
+
+# 노이즈 제거: Opening 후 연결 요소 형태 필터 (작은 덩어리/원형 빛 반사 제거)
+LANE_TRACKER_SHAPE_FILTER = True
+
+# 데모 차선 감지 방식: "hough" (직선 평균) | "birds_eye" (역원근 변환 + 2차 곡선)
+LANE_DETECTOR_MODE = "hough"
+
+# 버드아이뷰 보정값: 노면 위 직사각형이 보이는 사다리꼴 (이미지 비율 x, y)
+# 좌하단, 좌상단, 우상단, 우하단 순서 (카메라 각도가 바뀌면 다시 측정)
+BIRDS_EYE_SOURCE = ((0.0, 1.0), (0.3, 0.55), (0.7, 0.55), (1.0, 1.0))
+BIRDS_EYE_SIZE = (160, 160)  # 버드아이뷰 크기 (가로, 세로)
+BIRDS_EYE_XM_PER_PIX = 0.002  # 버드아이뷰 가로 픽셀당 거리 (m)
+BIRDS_EYE_YM_PER_PIX = 0.003  # 버드아이뷰 세로 픽셀당 거리 (m)
+
 
 # ==================== API 엔드포인트 ====================
 
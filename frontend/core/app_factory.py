@@ -8,9 +8,12 @@ import os
 import logging
 import config
 from services.esp32_communication_service import ESP32CommunicationService
+from services.frame_grabber_service import FrameGrabberService
+from services.command_dispatcher import CommandDispatcher
 from core.logger_config import setup_logger
 from ai.detectors.yolo_detector import YOLODetector
 from ai.detectors.lane_detector import LaneDetector
+from ai.detectors.birds_eye_lane_detector import BirdsEyeLaneDetector
 from ai.core.autonomous_lane_tracker import AutonomousLaneTrackerV2
 from services.autonomous_driving_service import AutonomousDrivingService
 
@@ -55,10 +58,35 @@ def create_app():
 
     # ESP32 통신 서비스 초기화
     esp32_service = ESP32CommunicationService(
-        base_url=esp32_base_url, timeout=config.REQUEST_TIMEOUT
+        base_url=esp32_base_url,
+        timeout=config.REQUEST_TIMEOUT,
+        control_pool_size=config.CONTROL_POOL_SIZE,
+        capture_pool_size=config.CAPTURE_POOL_SIZE,
     )
     app.config["ESP32_SERVICE"] = esp32_service
 
+    # 공유 프레임 그래버 초기화 (/capture 단일 생산자, 모든 소비자가 공유)
+    frame_grabber = FrameGrabberService(
+        capture_url=esp32_service.get_capture_url(),
+        target_fps=config.FRAME_GRABBER_FPS,
+        timeout=config.FRAME_GRABBER_TIMEOUT,
+        idle_timeout=config.FRAME_GRABBER_IDLE_TIMEOUT,
+        pipelined=config.FRAME_GRABBER_PIPELINED,
+        stale_age=config.FRAME_GRABBER_STALE_AGE,
+        session=esp32_service.capture_session,
+    )
+    frame_grabber.start()
+    app.config["FRAME_GRABBER"] = frame_grabber
+
+    # 모터 명령 디스패처 초기화 (분석 루프가 네트워크 대기로 막히지 않도록)
+    command_dispatcher = CommandDispatcher(
+        base_url=esp32_base_url,
+        timeout=config.COMMAND_TIMEOUT,
+        min_interval=config.COMMAND_MIN_INTERVAL,
+        stop_repeats=config.STOP_REPEATS,
+    )
+    app.config["COMMAND_DISPATCHER"] = command_dispatcher
+
     # AI 서비스 초기화 (YOLO 객체 감지)
     try:
         yolo_detector = YOLODetector(confidence_threshold=0.5)
@@ -69,7 +97,15 @@ def create_app():
         app.config["YOLO_DETECTOR"] = None
 
     # 차선 감지기 초기화 (기본, 데모용)
-    lane_detector = LaneDetector()
+    if config.LANE_DETECTOR_MODE == "birds_eye":
+        lane_detector = BirdsEyeLaneDetector(
+            source_points=config.BIRDS_EYE_SOURCE,
+            warp_size=config.BIRDS_EYE_SIZE,
+            xm_per_pix=config.BIRDS_EYE_XM_PER_PIX,
+            ym_per_pix=config.BIRDS_EYE_YM_PER_PIX,
+        )
+    else:
+        lane_detector = LaneDetector()
     app.config["LANE_DETECTOR"] = lane_detector
 
     # 자율주행 차선 추적기 초기화 (prod.md 기반, 모듈화)
@@ -78,12 +114,20 @@ def create_app():
         use_adaptive=True,
         min_noise_area=100,
         min_aspect_ratio=2.0,
+        roi_first=config.LANE_TRACKER_ROI_FIRST,
+        motion_gate=config.LANE_TRACKER_MOTION_GATE,
+        max_reuse_age=config.LANE_TRACKER_MAX_REUSE_AGE,
+        shape_filter=config.LANE_TRACKER_SHAPE_FILTER,
     )
     app.config["AUTONOMOUS_TRACKER"] = autonomous_tracker
 
     # 자율주행 서비스 초기화
     autonomous_service = AutonomousDrivingService(
-        esp32_service=esp32_service, lane_tracker=autonomous_tracker
+        esp32_service=esp32_service,
+        lane_tracker=autonomous_tracker,
+        frame_grabber=frame_grabber,
+        command_dispatcher=command_dispatcher,
+        record_dir=os.environ.get("FRAME_RECORD_DIR") or config.FRAME_RECORD_DIR,
     )
     app.config["AUTONOMOUS_SERVICE"] = autonomous_service
 
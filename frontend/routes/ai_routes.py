@@ -4,9 +4,7 @@ YOLO 객체 감지 및 차선 인식 API
 """
 
 from flask import Blueprint, jsonify, request, Response, current_app
-import requests
 import cv2
-import numpy as np
 import logging
 import config
 
@@ -16,6 +14,19 @@ logger = logging.getLogger(__name__)
 ai_bp = Blueprint("ai", __name__, url_prefix="/api/ai")
 
 
+def _get_latest_frame():
+    """
+    공유 프레임 그래버에서 최신 프레임 가져오기
+
+    Returns:
+        GrabbedFrame 또는 None (캡처 실패/타임아웃)
+    """
+    frame_grabber = current_app.config.get("FRAME_GRABBER")
+    return frame_grabber.get_latest(
+        max_age=config.FRAME_MAX_AGE, timeout=config.REQUEST_TIMEOUT
+    )
+
+
 @ai_bp.route("/detect")
 def detect_objects():
     """
@@ -59,32 +70,25 @@ def detect_objects():
                 503,
             )
 
-        # ESP32에서 이미지 가져오기
-        esp32_service = current_app.config.get("ESP32_SERVICE")
-        capture_url = esp32_service.get_capture_url()
-
-        response = requests.get(capture_url, timeout=config.REQUEST_TIMEOUT)
+        # 공유 프레임 그래버에서 최신 이미지 가져오기 (이미 디코딩됨)
+        frame = _get_latest_frame()
 
-        if response.status_code != 200:
+        if frame is None:
             return (
                 jsonify({"success": False, "error": "ESP32-CAM 이미지 캡처 실패"}),
                 503,
             )
 
-        # 이미지 바이트 데이터
-        image_bytes = response.content
+        image = frame.image
 
         # YOLO 객체 감지
-        detections = yolo_detector.detect_from_bytes(image_bytes)
+        detections = yolo_detector.detect_objects(image)
 
         # draw 파라미터 확인
         draw = request.args.get("draw", "false").lower() == "true"
 
         if draw:
             # 이미지에 Bounding Box 그리기
-            nparr = np.frombuffer(image_bytes, np.uint8)
-            image = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
-
             result_image = yolo_detector.draw_detections(image, detections)
 
             # JPEG로 인코딩
@@ -126,7 +130,15 @@ def detect_lanes():
                 "line": {"x1": 400, "y1": 400, "x2": 300, "y2": 300}
             }
         ],
-        "center_offset": 15
+        "center_offset": 15,
+        "lane_model": {  # LANE_DETECTOR_MODE = "birds_eye"일 때만
+            "fits": {"left": [a, b, c], "right": [a, b, c]},
+            "search": "locked",
+            "offset_px": -0.6,
+            "offset_m": -0.0013,
+            "curvature": 0.1045,
+            "radius_m": 9.57
+        }
     }
     """
     try:
@@ -141,24 +153,16 @@ def detect_lanes():
                 503,
             )
 
-        # ESP32에서 이미지 가져오기
-        esp32_service = current_app.config.get("ESP32_SERVICE")
-        capture_url = esp32_service.get_capture_url()
+        # 공유 프레임 그래버에서 최신 이미지 가져오기
+        frame = _get_latest_frame()
 
-        response = requests.get(capture_url, timeout=config.REQUEST_TIMEOUT)
-
-        if response.status_code != 200:
+        if frame is None:
             return (
                 jsonify({"success": False, "error": "ESP32-CAM 이미지 캡처 실패"}),
                 503,
             )
 
-        # 이미지 디코딩
-        nparr = np.frombuffer(response.content, np.uint8)
-        image = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
-
-        if image is None:
-            return jsonify({"success": False, "error": "이미지 디코딩 실패"}), 500
+        image = frame.image
 
         # 차선 감지
         lanes = lane_detector.detect_lanes(image)
@@ -179,10 +183,14 @@ def detect_lanes():
         height, width = image.shape[:2]
         center_offset = lane_detector.calculate_center_offset(lanes, width)
 
-        # JSON 응답
-        return jsonify(
-            {"success": True, "lanes": lanes, "center_offset": center_offset}
-        )
+        # JSON 응답 (버드아이뷰 모드는 곡선 계수/횡방향 오프셋/곡률 포함)
+        response = {"success": True, "lanes": lanes, "center_offset": center_offset}
+        lane_model = getattr(lane_detector, "last_model", None)
+        if lane_model is not None:
+            response["lane_model"] = {
+                key: value for key, value in lane_model.items() if key != "lanes"
+            }
+        return jsonify(response)
 
     except Exception as e:
         logger.error(f"차선 감지 오류: {e}")
@@ -203,30 +211,23 @@ def analyze_full():
     try:
         yolo_detector = current_app.config.get("YOLO_DETECTOR")
         lane_detector = current_app.config.get("LANE_DETECTOR")
-        esp32_service = current_app.config.get("ESP32_SERVICE")
 
-        # 이미지 캡처
-        capture_url = esp32_service.get_capture_url()
-        response = requests.get(capture_url, timeout=config.REQUEST_TIMEOUT)
+        # 이미지 캡처 (공유 프레임 그래버)
+        frame = _get_latest_frame()
 
-        if response.status_code != 200:
+        if frame is None:
             return (
                 jsonify({"success": False, "error": "ESP32-CAM 이미지 캡처 실패"}),
                 503,
             )
 
-        # 이미지 디코딩
-        nparr = np.frombuffer(response.content, np.uint8)
-        image = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
-
-        if image is None:
-            return jsonify({"success": False, "error": "이미지 디코딩 실패"}), 500
+        image = frame.image
 
         result_data = {"success": True}
 
         # YOLO 객체 감지 (모델이 로드된 경우만)
         if yolo_detector and yolo_detector.is_ready():
-            detections = yolo_detector.detect_from_bytes(response.content)
+            detections = yolo_detector.detect_objects(image)
             result_data["objects"] = detections
             result_data["object_summary"] = yolo_detector.get_detection_summary(
                 detections
@@ -25,11 +25,23 @@ def get_status():
     status = esp32_service.get_status()
 
     if not status:
-        return jsonify({"error": "ESP32-CAM 연결 실패", "connected": False}), 503
+        return (
+            jsonify(
+                {
+                    "error": "ESP32-CAM 연결 실패",
+                    "connected": False,
+                    "connections": esp32_service.get_connection_stats(),
+                }
+            ),
+            503,
+        )
 
     # 현재 시간 추가
     status["timestamp"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
+    # 연결 재사용 카운터 (제어/캡처 풀별)
+    status["connections"] = esp32_service.get_connection_stats()
+
     return jsonify(status)
 
 
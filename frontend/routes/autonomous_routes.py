@@ -11,6 +11,7 @@ import requests
 import cv2
 import numpy as np
 import base64
+import config
 
 autonomous_bp = Blueprint("autonomous", __name__, url_prefix="/api/autonomous")
 logger = logging.getLogger(__name__)
@@ -52,7 +53,9 @@ def start_autonomous():
 
         # Verify ESP32 connection before starting (with extended timeout)
         try:
-            response = requests.get(f"{esp32_service.base_url}/status", timeout=5)
+            response = esp32_service.control_session.get(
+                f"{esp32_service.base_url}/status", timeout=5
+            )
             if response.status_code != 200:
                 return (
                     jsonify(
@@ -78,15 +81,14 @@ def start_autonomous():
         # This prevents timeout issues
         result = auto_service.start()
 
-        # Try to get initial frame asynchronously (non-blocking)
+        # Try to get initial frame from the shared grabber (non-critical)
         try:
-            capture_url = esp32_service.get_capture_url()
-            response = requests.get(capture_url, timeout=3)
+            frame = auto_service.frame_grabber.get_latest(
+                max_age=config.FRAME_MAX_AGE, timeout=3
+            )
 
-            if response.status_code == 200:
-                # Decode image
-                nparr = np.frombuffer(response.content, np.uint8)
-                image = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
+            if frame is not None:
+                image = frame.image
 
                 if image is not None:
                     # Analyze initial frame
@@ -157,12 +159,13 @@ def stop_autonomous():
         # Stop autonomous service (this will send stop command)
         result = auto_service.stop()
 
-        # Double-check with emergency stop to ensure motors are stopped
-        logger.info("Executing emergency stop verification")
-        try:
-            esp32_service.send_command("control", {"cmd": "stop"})
-        except Exception as e:
-            logger.warning(f"Emergency stop verification failed: {e}")
+        # Fall back to a direct stop if the dispatcher could not finish it
+        if not result.get("stop_acked", True):
+            logger.info("Executing emergency stop fallback")
+            try:
+                esp32_service.send_command("control", {"cmd": "stop"})
+            except Exception as e:
+                logger.warning(f"Emergency stop fallback failed: {e}")
 
         return jsonify(result)
 
@@ -261,17 +264,14 @@ def analyze_frame():
 
         # Method 3: Direct capture from ESP32-CAM
         else:
-            esp32_service = current_app.config.get("ESP32_SERVICE")
-            if esp32_service:
-                capture_url = esp32_service.get_capture_url()
-                logger.info(f"Capturing image from: {capture_url}")
-                response = requests.get(capture_url, timeout=10)
-                if response.status_code == 200:
-                    nparr = np.frombuffer(response.content, np.uint8)
-                    image = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
-                    logger.info("Image captured successfully")
-                else:
-                    logger.error(f"Image capture failed: HTTP {response.status_code}")
+            frame = auto_service.frame_grabber.get_latest(
+                max_age=config.FRAME_MAX_AGE, timeout=10
+            )
+            if frame is not None:
+                image = frame.image
+                logger.info(f"Image captured successfully (seq={frame.seq})")
+            else:
+                logger.error("Image capture failed: no frame from grabber")
 
         if image is None:
             return (
@@ -329,14 +329,16 @@ def autonomous_stream():
             return
 
         try:
-            capture_url = esp32_service.get_capture_url()
-            logger.info(f"Connecting to stream: {capture_url}")
+            frame_grabber = auto_service.frame_grabber
+            frame_grabber.start()
+            logger.info("Streaming from shared frame grabber")
 
             # Frame rate control
             TARGET_FPS = 5
             FRAME_INTERVAL = 1.0 / TARGET_FPS  # 0.2 seconds
             frame_count = 0
             last_frame_time = 0
+            last_seq = 0
 
             while True:
                 try:
@@ -346,10 +348,10 @@ def autonomous_stream():
                         time.sleep(0.01)  # Small sleep to prevent CPU overuse
                         continue
 
-                    # Get image from ESP32-CAM
-                    response = requests.get(capture_url, timeout=5)
-                    if response.status_code != 200:
-                        logger.error(f"Failed to get image: {response.status_code}")
+                    # Wait for a frame newer than the last one streamed
+                    grabbed = frame_grabber.wait_for_frame(last_seq, timeout=5)
+                    if grabbed is None:
+                        logger.error("Failed to get image from frame grabber")
                         message = "Failed to get image from ESP32-CAM"
                         yield b"--frame\r\nContent-Type: text/plain\r\n\r\n" + message.encode(
                             "utf-8"
@@ -357,12 +359,8 @@ def autonomous_stream():
                         time.sleep(1)  # Wait before retry
                         continue
 
-                    # Decode image
-                    nparr = np.frombuffer(response.content, np.uint8)
-                    image = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
-                    if image is None or image.size == 0:
-                        logger.warning("Invalid image data")
-                        continue
+                    last_seq = grabbed.seq
+                    image = grabbed.image
 
                     # Process lane tracking
                     result = auto_service.process_frame(
@@ -423,7 +421,9 @@ def check_camera():
         # 1. Basic connection check
         base_url = esp32_service.base_url
         try:
-            response = requests.get(f"{base_url}/status", timeout=5)
+            response = esp32_service.control_session.get(
+                f"{base_url}/status", timeout=5
+            )
             if response.status_code != 200:
                 return (
                     jsonify(
@@ -6,8 +6,17 @@
 from flask import Blueprint, Response, current_app
 import requests
 import logging
+import sys
+from pathlib import Path
 import config
 
+# 저장소 루트를 sys.path에 추가 (공용 frame_source 패키지 import용)
+_REPO_ROOT = str(Path(__file__).resolve().parents[2])
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+
+from frame_source import MJPEGParser
+
 logger = logging.getLogger(__name__)
 
 # 블루프린트 생성
@@ -22,22 +31,19 @@ def capture_image():
     Returns:
         이미지 바이너리 데이터 또는 에러 응답
     """
-    try:
-        esp32_service = current_app.config.get("ESP32_SERVICE")
-        capture_url = esp32_service.get_capture_url()
-
-        response = requests.get(capture_url, timeout=config.REQUEST_TIMEOUT)
-
-        if response.status_code != 200:
-            logger.error(f"이미지 캡처 실패: {response.status_code}")
-            return Response(status=503)
+    frame_grabber = current_app.config.get("FRAME_GRABBER")
 
-        return Response(response.content, mimetype="image/jpeg")
+    # 공유 프레임 그래버의 최신 JPEG 재사용 (ESP32 추가 요청 없음)
+    frame = frame_grabber.get_latest(
+        max_age=config.FRAME_MAX_AGE, timeout=config.REQUEST_TIMEOUT
+    )
 
-    except requests.exceptions.RequestException as e:
-        logger.error(f"이미지 캡처 오류: {e}")
+    if frame is None:
+        logger.error("이미지 캡처 실패: 프레임 그래버 응답 없음")
         return Response(status=503)
 
+    return Response(frame.jpeg, mimetype="image/jpeg")
+
 
 @camera_bp.route("/stream")
 def stream_video():
@@ -62,10 +68,21 @@ def stream_video():
                 stream_url, stream=True, timeout=config.STREAM_TIMEOUT
             )
 
-            # 청크 단위로 데이터 전달
-            for chunk in response.iter_content(chunk_size=1024):
-                if chunk:
-                    yield chunk
+            # JPEG 프레임 단위로 다시 감싸서 전달 (ESP32 boundary와 무관하게
+            # 항상 boundary=frame + Content-Length 형식 유지)
+            parser = MJPEGParser(
+                MJPEGParser.boundary_from_content_type(
+                    response.headers.get("Content-Type")
+                )
+            )
+            for jpg in parser.iter_frames(response.iter_content(chunk_size=4096)):
+                yield (
+                    b"--frame\r\nContent-Type: image/jpeg\r\n"
+                    b"Content-Length: %d\r\n\r\n" % len(jpg)
+                )
+                # WSGI 서버에는 bytes 전달 (memoryview는 다음 청크에서 재사용됨)
+                yield jpg.tobytes()
+                yield b"\r\n"
 
         except Exception as e:
             logger.error(f"스트림 오류: {e}")
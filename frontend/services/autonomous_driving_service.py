@@ -6,14 +6,24 @@ Processes lane tracking results and converts them into ESP32-CAM motor commands.
 
 import logging
 from typing import Dict, Any, Optional
+import sys
 import time
 import threading
-import requests
+from pathlib import Path
 from services.esp32_communication_service import ESP32CommunicationService
+from services.frame_grabber_service import FrameGrabberService, GrabberFrameSource
+from services.command_dispatcher import CommandDispatcher
 from ai.core.autonomous_lane_tracker import AutonomousLaneTrackerV2
 import cv2
 import numpy as np
 
+# Add repo root to sys.path (shared frame_source package)
+_REPO_ROOT = str(Path(__file__).resolve().parents[2])
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+
+from frame_source import FrameRecorder, FrameSource
+
 logger = logging.getLogger(__name__)
 
 
@@ -31,10 +41,16 @@ class AutonomousDrivingService:
     # Default command when no lane is detected
     DEFAULT_COMMAND = "CENTER"  # Default to moving forward
 
+    # Max wait for the dispatcher to finish the stop sequence (seconds)
+    STOP_ACK_TIMEOUT = 2.0
+
     def __init__(
         self,
         esp32_service: ESP32CommunicationService,
         lane_tracker: Optional[AutonomousLaneTrackerV2] = None,
+        frame_grabber: Optional[FrameGrabberService] = None,
+        command_dispatcher: Optional[CommandDispatcher] = None,
+        record_dir: Optional[str] = None,
     ):
         """
         Initialize autonomous driving service
@@ -42,9 +58,21 @@ class AutonomousDrivingService:
         Args:
             esp32_service: ESP32 communication service
             lane_tracker: Lane tracker (creates default if None)
+            frame_grabber: Shared frame grabber (creates private one if None)
+            command_dispatcher: Motor command dispatcher (creates one if None)
+            record_dir: Record each driving session to this directory
+                        (None disables recording)
         """
         self.esp32_service = esp32_service
         self.lane_tracker = lane_tracker or AutonomousLaneTrackerV2()
+        self.frame_grabber = frame_grabber or FrameGrabberService(
+            esp32_service.get_capture_url(), pipelined=True
+        )
+        self.command_dispatcher = command_dispatcher or CommandDispatcher(
+            esp32_service.base_url
+        )
+        self.record_dir = record_dir
+        self.recorder: Optional[FrameRecorder] = None
         self.is_running = False
         self.last_command = None
         self.command_history = []  # Keep last 10 commands
@@ -57,20 +85,33 @@ class AutonomousDrivingService:
         }
         self._polling_thread = None
         self._stop_polling = False
+        self.frame_source: Optional[FrameSource] = None
+        self._own_source = False
+        self.offline = False  # Offline source: analyze only, never drive the car
         self.latest_processed_image = None  # Store latest processed image for display
         self.last_image_update_time = 0  # Track last update time
         logger.info("Autonomous driving service initialized")
 
-    def start(self) -> Dict[str, Any]:
+    def start(self, frame_source: Optional[FrameSource] = None) -> Dict[str, Any]:
         """
         Start autonomous driving (background /capture polling)
 
+        Args:
+            frame_source: Read frames from this source instead of the grabber
+                          (offline sources such as replays send no commands)
+
         Returns:
             {"success": bool, "message": str}
         """
         if self.is_running:
             return {"success": False, "message": "Autonomous driving already running"}
 
+        # Frames come from the shared grabber unless a source is given
+        # (a given source stays owned by the caller)
+        self._own_source = frame_source is None
+        self.frame_source = frame_source or GrabberFrameSource(self.frame_grabber)
+        self.offline = not self.frame_source.is_live
+
         self.is_running = True
         self.stats["start_time"] = time.time()
         self.stats["frames_processed"] = 0
@@ -79,6 +120,11 @@ class AutonomousDrivingService:
         self.command_history = []
         self._stop_polling = False
 
+        # One recording file per driving session
+        if self.record_dir and not self.offline:
+            self.recorder = FrameRecorder.create_in(self.record_dir)
+            logger.info(f"Recording session to {self.recorder.path}")
+
         # Start background thread
         self._polling_thread = threading.Thread(target=self._polling_loop, daemon=True)
         self._polling_thread.start()
@@ -98,33 +144,33 @@ class AutonomousDrivingService:
 
         # Stop polling thread first
         self._stop_polling = True
+        if self._own_source:
+            # Wakes the loop out of the grabber wait
+            self.frame_source.close()
         if self._polling_thread and self._polling_thread.is_alive():
             self._polling_thread.join(timeout=2.0)
 
-        # Send stop command immediately
-        try:
+        self.last_command = "STOP"
+        if self.offline:
+            # Offline run never moved the car
+            stop_acked = True
+        else:
+            # Send stop command via the priority lane (preempts pending steering)
             logger.info("🛑 Sending STOP command to ESP32")
+            self.command_dispatcher.start()
+            self.command_dispatcher.submit_stop()
 
-            # Send stop command directly
-            stop_response = self.esp32_service.send_command("control", {"cmd": "stop"})
-            if stop_response.get("success"):
-                logger.info("✓ STOP command sent successfully")
-                self.last_command = "STOP"
-            else:
-                logger.error(f"✗ Failed to send stop command: {stop_response}")
-
-            # Verify the stop command
-            time.sleep(0.1)  # Brief wait for command to take effect
-            verify_response = self.esp32_service.send_command("status")
-            if verify_response.get("success"):
-                logger.info("✓ Stop command verified")
+            # Stop is repeated and verified by the dispatcher
+            stop_acked = self.command_dispatcher.wait_for_stop(
+                timeout=self.STOP_ACK_TIMEOUT
+            )
+            if stop_acked:
+                logger.info("✓ STOP sequence finished")
             else:
-                logger.warning("⚠ Could not verify stop command")
-
-        except Exception as e:
-            logger.error(f"✗ Error during stop sequence: {e}")
+                logger.error("✗ STOP sequence did not finish in time")
 
         self.is_running = False
+        self._close_recorder()
         elapsed = (
             time.time() - self.stats["start_time"] if self.stats["start_time"] else 0
         )
@@ -138,109 +184,97 @@ class AutonomousDrivingService:
         return {
             "success": True,
             "message": "Stopped autonomous driving",
+            "stop_acked": stop_acked,
             "stats": self.get_stats(),
+            "frame_grabber": self.frame_grabber.get_stats(),
+            "command_dispatcher": self.command_dispatcher.get_stats(),
+            "frame_arena": self.lane_tracker.arena.get_stats(),
+            "motion_gate": self._motion_gate_stats(),
         }
 
     def _polling_loop(self):
         """
-        Background loop for /capture polling and lane tracking
+        Background loop for lane tracking on frames from the shared grabber
         Real-time processing: Skip old frames, process only latest
         """
         logger.info("Starting ULTRA-FAST real-time polling loop")
-        base_capture_url = self.esp32_service.get_capture_url()
-        TARGET_FPS = 15  # Increased to 15fps for faster response
-        FRAME_INTERVAL = 1.0 / TARGET_FPS  # 0.067 seconds
-        MIN_COMMAND_INTERVAL = 0.15  # Minimum 150ms between commands
 
-        # Send initial forward command
-        self._send_command_to_esp32(self.DEFAULT_COMMAND)
+        # Grabber source: the shared grabber (no extra /capture load);
+        # offline sources: e.g. a replayed recording
+        source = self.frame_source
+        frames = iter(source)
+
+        if not self.offline:
+            # Commands go through the dispatcher thread (never block this loop)
+            self.command_dispatcher.start()
+
+            # Send initial forward command
+            self._send_command_to_esp32(self.DEFAULT_COMMAND)
 
         frame_counter = 0
-        last_command_time = 0
 
         while not self._stop_polling and self.is_running:
             try:
                 loop_start = time.time()
 
-                # CRITICAL: Add timestamp to prevent caching!
-                capture_url = f"{base_capture_url}?t={int(time.time() * 1000)}"
-
-                # TIMING: Image capture
-                capture_start = time.time()
-                response = requests.get(
-                    capture_url,
-                    timeout=1.5,
-                    headers={"Cache-Control": "no-cache", "Pragma": "no-cache"},
-                )
-                capture_time = (time.time() - capture_start) * 1000
-
-                if response.status_code != 200:
-                    logger.warning(f"Failed to capture image: {response.status_code}")
-                    self.stats["errors"] += 1
-                    time.sleep(FRAME_INTERVAL)
-                    continue
-
-                # TIMING: Image decode
-                decode_start = time.time()
-                nparr = np.frombuffer(response.content, np.uint8)
-                image = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
-                decode_time = (time.time() - decode_start) * 1000
-
-                if image is None or image.size == 0:
-                    logger.warning("Failed to decode image")
-                    self.stats["errors"] += 1
-                    time.sleep(FRAME_INTERVAL)
-                    continue
+                # Wait for a frame newer than the last one analyzed
+                # (pipelined grabber: the next /capture is already in flight
+                # while this frame is analyzed)
+                image = next(frames, None)
+                wait_time = (time.time() - loop_start) * 1000
+                if image is None:
+                    logger.info("Frame source exhausted")
+                    break
+
+                # Record raw JPEG + capture timing (command added below)
+                if self.recorder is not None:
+                    self.recorder.record(
+                        source.jpeg, source.timestamp, source.latency_ms
+                    )
+                capture_time = source.latency_ms
+                decode_time = source.decode_ms
+                frame_age = (time.time() - source.timestamp) * 1000
 
                 frame_counter += 1
                 self.stats["frames_processed"] = frame_counter
 
                 # TIMING: Lane analysis
+                # (debug images are lazy: only rendered when read below)
                 analysis_start = time.time()
-                result = self.process_frame(image, send_command=False, debug=False)
+                result = self.process_frame(image, send_command=False, debug=True)
                 analysis_time = (time.time() - analysis_start) * 1000
 
                 if result.get("success"):
-                    # Send command IMMEDIATELY if interval passed
+                    # Hand the command to the dispatcher (latest wins, no wait)
                     current_time = time.time()
-                    time_since_last_command = current_time - last_command_time
-
-                    if time_since_last_command >= MIN_COMMAND_INTERVAL:
-                        # TIMING: Command send
-                        command_start = time.time()
-                        sent = self._send_command_to_esp32(result["command"])
-                        command_time = (time.time() - command_start) * 1000
-
-                        if sent:
-                            last_command_time = current_time
-                            self.stats["commands_sent"] += 1
-
-                        # Always update frame time (even if command not sent)
-                        total_time = (current_time - loop_start) * 1000
-                        self.stats["last_frame_time"] = int(total_time)
-
-                        logger.info(
-                            f"[{frame_counter}] {result['command']} "
-                            f"L:{result['histogram']['left']} "
-                            f"C:{result['histogram']['center']} "
-                            f"R:{result['histogram']['right']} "
-                            f"| Cap:{capture_time:.0f}ms Dec:{decode_time:.0f}ms "
-                            f"Ana:{analysis_time:.0f}ms Cmd:{command_time:.0f}ms "
-                            f"TOT={total_time:.0f}ms"
+                    self._send_command_to_esp32(result["command"])
+                    if self.recorder is not None:
+                        self.recorder.set_command(
+                            self.COMMAND_MAP.get(result["command"])
                         )
-                    else:
-                        # Even if command not sent, update frame time
-                        total_time = (time.time() - loop_start) * 1000
-                        self.stats["last_frame_time"] = int(total_time)
 
-                    # Debug image every 1 second (non-blocking)
+                    total_time = (current_time - loop_start) * 1000
+                    self.stats["last_frame_time"] = int(total_time)
+
+                    logger.info(
+                        f"[{frame_counter}] {result['command']} "
+                        f"L:{result['histogram']['left']} "
+                        f"C:{result['histogram']['center']} "
+                        f"R:{result['histogram']['right']} "
+                        f"| Cap:{capture_time:.0f}ms Dec:{decode_time:.0f}ms "
+                        f"Wait:{wait_time:.0f}ms Age:{frame_age:.0f}ms "
+                        f"Ana:{analysis_time:.0f}ms"
+                        f"{'(reused)' if result['reused'] else ''} "
+                        f"Ack:{self.command_dispatcher.stats['last_ack_ms']}ms "
+                        f"TOT={total_time:.0f}ms"
+                    )
+
+                    # Debug image every 1 second, rendered from this frame's
+                    # analysis (no second tracker run)
                     if current_time - self.last_image_update_time >= 1.0:
                         try:
-                            debug_result = self.lane_tracker.process_frame(
-                                image, debug=True
-                            )
-                            if debug_result.get("debug_images"):
-                                processed_image = debug_result["debug_images"].get(
+                            if result["debug_images"]:
+                                processed_image = result["debug_images"].get(
                                     "7_final", image
                                 )
                                 _, buffer = cv2.imencode(
@@ -255,20 +289,18 @@ class AutonomousDrivingService:
                 else:
                     logger.warning(f"Processing failed: {result.get('error')}")
 
-                # Minimal sleep - prioritize speed
+                # Pacing comes from the grabber (waits for the next frame)
                 elapsed = time.time() - loop_start
-                if elapsed < FRAME_INTERVAL:
-                    time.sleep(FRAME_INTERVAL - elapsed)
-                else:
-                    # No sleep if already slow - process next immediately
-                    if elapsed > 0.15:
-                        logger.warning(f"⚠ Slow: {elapsed*1000:.0f}ms")
+                if elapsed > 0.15:
+                    logger.warning(f"⚠ Slow: {elapsed*1000:.0f}ms")
 
             except Exception as e:
                 logger.error(f"Polling loop error: {e}")
                 self.stats["errors"] += 1
-                time.sleep(FRAME_INTERVAL)
+                time.sleep(0.1)
 
+        if self.offline:
+            self.is_running = False
         logger.info("Polling loop ended")
 
     def process_frame(
@@ -290,7 +322,8 @@ class AutonomousDrivingService:
                 "histogram": {...},
                 "confidence": float,
                 "sent_to_esp32": bool,
-                "debug_images": {...}  # Only in debug mode
+                "reused": bool,  # Previous decision reused (scene unchanged)
+                "debug_images": {...}  # Only in debug mode (rendered lazily)
             }
         """
         try:
@@ -331,6 +364,7 @@ class AutonomousDrivingService:
                 "histogram": result["histogram"],
                 "confidence": result["confidence"],
                 "sent_to_esp32": sent_to_esp32,
+                "reused": result.get("reused", False),
                 "debug_images": result.get("debug_images", {}),
             }
 
@@ -341,43 +375,44 @@ class AutonomousDrivingService:
 
     def _send_command_to_esp32(self, command: str) -> bool:
         """
-        Send command to ESP32 (with duplicate filtering)
+        Queue command for the ESP32 (with duplicate filtering, non-blocking)
 
         Args:
             command: "LEFT" | "RIGHT" | "CENTER" | "STOP"
 
         Returns:
-            Success status
+            True if the command was handed to the dispatcher
         """
-        # Prevent duplicate commands
-        if command == self.last_command:
-            logger.debug(f"Ignoring duplicate command: {command}")
-            return False
-
         # Convert to ESP32 command
         esp32_cmd = self.COMMAND_MAP.get(command)
         if not esp32_cmd:
             logger.warning(f"Unknown command: {command}")
             return False
 
-        # Send command
-        try:
-            logger.info(f"🚗 Sending command to ESP32: {command} → {esp32_cmd}")
-            response = self.esp32_service.send_command("control", {"cmd": esp32_cmd})
-            if response.get("success"):
-                self.last_command = command
-                self.stats["commands_sent"] += 1
-                logger.info(f"✓ Command sent successfully: {command} → {esp32_cmd}")
-                return True
-            else:
-                logger.warning(f"✗ Command failed: {response}")
-                return False
+        # Prevent duplicate commands (a failed send is retried on the next frame)
+        if esp32_cmd == self.command_dispatcher.get_current_command():
+            logger.debug(f"Ignoring duplicate command: {command}")
+            return False
 
-        except Exception as e:
-            self.stats["errors"] += 1
-            logger.error(f"✗ ESP32 command error: {e}")
+        if self.offline:
+            # Analysis only: keep the decision, never drive the car
+            self.last_command = command
             return False
 
+        logger.info(f"🚗 Queueing command for ESP32: {command} → {esp32_cmd}")
+        self.command_dispatcher.submit(esp32_cmd)
+        self.last_command = command
+        self.stats["commands_sent"] += 1
+        return True
+
+    def _close_recorder(self):
+        """Finish the session recording (writes the frame index)"""
+        if self.recorder is None:
+            return
+        recorder, self.recorder = self.recorder, None
+        recorder.close()
+        logger.info(f"Recording saved: {recorder.path} ({recorder.frame_count} frames)")
+
     def get_status(self) -> Dict[str, Any]:
         """
         Get autonomous driving status
@@ -411,6 +446,10 @@ class AutonomousDrivingService:
             "state": self.lane_tracker.state,
             "command_history": clean_history,  # Cleaned history without bytes
             "stats": self.get_stats(),
+            "frame_grabber": self.frame_grabber.get_stats(),
+            "command_dispatcher": self.command_dispatcher.get_stats(),
+            "frame_arena": self.lane_tracker.arena.get_stats(),
+            "motion_gate": self._motion_gate_stats(),
         }
 
         # Add latest processed image if available
@@ -444,6 +483,16 @@ class AutonomousDrivingService:
             "last_frame_time": self.stats["last_frame_time"],
         }
 
+    def _motion_gate_stats(self) -> Optional[Dict[str, Any]]:
+        """
+        Get motion gate statistics (frames that reused the previous decision)
+
+        Returns:
+            Statistics dictionary or None if the gate is disabled
+        """
+        gate = self.lane_tracker.motion_gate
+        return gate.get_stats() if gate is not None else None
+
     def analyze_single_frame(
         self, image: np.ndarray, draw_overlay: bool = True
     ) -> Dict[str, Any]:
@@ -0,0 +1,329 @@
+"""
+Command Dispatcher
+
+Dedicated thread that sends motor commands to the ESP32-CAM so the frame
+analysis loop never blocks on the network.
+
+- Steering commands go to a single-slot mailbox: the latest command wins and
+  an unsent older command is dropped instead of queued.
+- Stop has its own priority lane: it preempts any pending steering command,
+  is repeated for reliability and optionally verified via /status.
+- A stop latches: steering submitted after it is dropped until start() is
+  called again (a late frame can't restart the car after stopping).
+- Every command's ack latency (submit → HTTP 200) is recorded.
+"""
+
+import logging
+import threading
+import time
+from typing import Optional, Dict, Any
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+
+class CommandDispatcher:
+    """Latest-wins motor command dispatcher with a priority stop lane"""
+
+    STOP_COMMAND = "stop"
+
+    def __init__(
+        self,
+        base_url: str,
+        timeout: float = 1.0,
+        min_interval: float = 0.05,
+        stop_repeats: int = 3,
+        stop_interval: float = 0.1,
+        verify_stop: bool = True,
+    ):
+        """
+        Initialize command dispatcher (the thread is started with start())
+
+        Args:
+            base_url: ESP32-CAM base URL (e.g., http://192.168.0.65)
+            timeout: Per-request timeout in seconds
+            min_interval: Minimum interval between steering commands
+            stop_repeats: How many times the stop command is sent
+            stop_interval: Delay between stop repeats in seconds
+            verify_stop: Check /status motor_status after stopping
+        """
+        self.base_url = base_url
+        self.timeout = timeout
+        self.min_interval = min_interval
+        self.stop_repeats = stop_repeats
+        self.stop_interval = stop_interval
+        self.verify_stop = verify_stop
+
+        self._cond = threading.Condition()
+        self._pending_command: Optional[str] = None
+        self._pending_since = 0.0
+        self._stop_requested_at: Optional[float] = None
+        self._stop_latched = False  # Set by submit_stop(), cleared by start()
+        self._stop_done = threading.Event()
+        self._running = False
+        self._thread = None
+
+        self._last_acked_command: Optional[str] = None
+        self._last_send_time = 0.0
+
+        # Own pooled keep-alive session (never shared with capture traffic)
+        self.session = requests.Session()
+        self.session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+
+        self.stats = {
+            "submitted": 0,
+            "sent": 0,
+            "dropped": 0,  # Steering commands superseded before being sent
+            "failed": 0,
+            "stops_sent": 0,
+            "last_ack_ms": 0,
+            "max_ack_ms": 0,
+            "total_ack_ms": 0.0,
+            "last_stop_ack_ms": 0,
+        }
+
+    # ----- Lifecycle -----
+    def start(self):
+        """Start the dispatcher thread (idempotent) and accept steering again"""
+        with self._cond:
+            self._stop_latched = False
+            if self._running:
+                return
+            self._running = True
+
+        self._thread = threading.Thread(
+            target=self._run, name="command-dispatcher", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"Command dispatcher started ({self.base_url})")
+
+    def shutdown(self):
+        """Stop the dispatcher thread (pending steering is discarded)"""
+        with self._cond:
+            if not self._running:
+                return
+            self._running = False
+            self._cond.notify_all()
+
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=self.timeout + 1.0)
+        logger.info("Command dispatcher stopped")
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    # ----- Producer API (never blocks on the network) -----
+    def submit(self, command: str):
+        """
+        Submit a steering command (latest wins, dropped after a stop)
+
+        Args:
+            command: ESP32 command ("left", "right", "center", "stop")
+        """
+        if command == self.STOP_COMMAND:
+            self.submit_stop()
+            return
+
+        with self._cond:
+            if self._stop_latched:
+                # Stopped: ignore steering until start() resumes driving
+                self.stats["dropped"] += 1
+                return
+            if self._pending_command is not None:
+                self.stats["dropped"] += 1
+            else:
+                self._pending_since = time.time()
+            self._pending_command = command
+            self.stats["submitted"] += 1
+            self._cond.notify_all()
+
+    def submit_stop(self):
+        """Submit a stop command (preempts and latches out steering commands)"""
+        with self._cond:
+            self._stop_latched = True
+            if self._pending_command is not None:
+                self.stats["dropped"] += 1
+                self._pending_command = None
+            if self._stop_requested_at is None:
+                self._stop_requested_at = time.time()
+            self._stop_done.clear()
+            self.stats["submitted"] += 1
+            self._cond.notify_all()
+
+    def wait_for_stop(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the last submitted stop has been sent
+
+        Args:
+            timeout: Maximum wait in seconds (None = forever)
+
+        Returns:
+            True if the stop sequence finished within timeout
+        """
+        return self._stop_done.wait(timeout)
+
+    def get_current_command(self) -> Optional[str]:
+        """
+        Get the command the car is heading towards
+
+        Returns:
+            Pending command if any, else the last acknowledged command
+        """
+        with self._cond:
+            if self._stop_requested_at is not None:
+                return self.STOP_COMMAND
+            if self._pending_command is not None:
+                return self._pending_command
+            return self._last_acked_command
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get dispatcher statistics
+
+        Returns:
+            Statistics dictionary
+        """
+        sent = self.stats["sent"]
+        return {
+            "running": self._running,
+            "submitted": self.stats["submitted"],
+            "sent": sent,
+            "dropped": self.stats["dropped"],
+            "failed": self.stats["failed"],
+            "stops_sent": self.stats["stops_sent"],
+            "last_ack_ms": self.stats["last_ack_ms"],
+            "avg_ack_ms": int(self.stats["total_ack_ms"] / sent) if sent else 0,
+            "max_ack_ms": self.stats["max_ack_ms"],
+            "last_stop_ack_ms": self.stats["last_stop_ack_ms"],
+            "last_acked_command": self._last_acked_command,
+        }
+
+    # ----- Dispatcher thread -----
+    def _run(self):
+        """Background loop: take the highest-priority command and send it"""
+        while True:
+            with self._cond:
+                while (
+                    self._running
+                    and self._stop_requested_at is None
+                    and self._pending_command is None
+                ):
+                    self._cond.wait()
+                if not self._running:
+                    break
+
+                if self._stop_requested_at is not None:
+                    requested_at = self._stop_requested_at
+                    self._stop_requested_at = None
+                    stop = True
+                else:
+                    # Rate limiting: wait on the condition so a newer command
+                    # (or a stop) can still replace this one
+                    wait = self.min_interval - (time.time() - self._last_send_time)
+                    if wait > 0:
+                        self._cond.wait(wait)
+                        continue
+                    command = self._pending_command
+                    requested_at = self._pending_since
+                    self._pending_command = None
+                    stop = False
+
+            if stop:
+                self._send_stop(requested_at)
+            else:
+                self._send_steering(command, requested_at)
+
+        self.session.close()
+
+    def _send_steering(self, command: str, requested_at: float):
+        """Send one steering command"""
+        if self._send_control(command, requested_at):
+            logger.debug(f"Command acked: {command}")
+        else:
+            logger.warning(f"Command failed: {command}")
+
+    def _send_stop(self, requested_at: float):
+        """Send the stop sequence (repeated, optionally verified)"""
+        acked = False
+        for attempt in range(self.stop_repeats):
+            if self._send_control(self.STOP_COMMAND, requested_at, record=not acked):
+                if not acked:
+                    self.stats["last_stop_ack_ms"] = self.stats["last_ack_ms"]
+                acked = True
+            if attempt < self.stop_repeats - 1:
+                time.sleep(self.stop_interval)
+
+        self.stats["stops_sent"] += 1
+        if acked:
+            logger.info(f"STOP acked in {self.stats['last_stop_ack_ms']}ms")
+        else:
+            logger.error("STOP command failed")
+
+        if self.verify_stop and not self._verify_motor_stopped():
+            logger.warning("Motor may not be fully stopped")
+
+        with self._cond:
+            # Signal only if no newer stop was requested meanwhile
+            if self._stop_requested_at is None:
+                self._stop_done.set()
+
+    def _send_control(
+        self, command: str, requested_at: float, record: bool = True
+    ) -> bool:
+        """
+        Send /control?cmd=<command>
+
+        Args:
+            command: ESP32 command
+            requested_at: Submit time (for ack latency)
+            record: Record ack latency for this attempt
+
+        Returns:
+            Success status
+        """
+        try:
+            response = self.session.get(
+                f"{self.base_url}/control",
+                params={"cmd": command},
+                timeout=self.timeout,
+            )
+            self._last_send_time = time.time()
+        except requests.exceptions.RequestException as e:
+            self._last_send_time = time.time()
+            self.stats["failed"] += 1
+            logger.error(f"Command error ({command}): {e}")
+            return False
+
+        if response.status_code != 200:
+            self.stats["failed"] += 1
+            logger.warning(f"Command {command} failed: HTTP {response.status_code}")
+            return False
+
+        self._last_acked_command = command
+        if record:
+            ack_ms = int((self._last_send_time - requested_at) * 1000)
+            self.stats["sent"] += 1
+            self.stats["last_ack_ms"] = ack_ms
+            self.stats["total_ack_ms"] += ack_ms
+            self.stats["max_ack_ms"] = max(self.stats["max_ack_ms"], ack_ms)
+        return True
+
+    def _verify_motor_stopped(self) -> bool:
+        """
+        Verify motor status via /status
+
+        Returns:
+            True if the ESP32 reports the motor as stopped
+        """
+        try:
+            response = self.session.get(
+                f"{self.base_url}/status", timeout=self.timeout
+            )
+            if response.status_code == 200:
+                return response.json().get("motor_status") == "stopped"
+        except (requests.exceptions.RequestException, ValueError) as e:
+            logger.warning(f"Could not verify motor status: {e}")
+        return False
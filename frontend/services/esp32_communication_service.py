@@ -1,9 +1,14 @@
 """
 ESP32-CAM Communication Service
 Handles HTTP communication with ESP32-CAM
+
+Control traffic (/control, /led, /speed, /camera, /status) and capture
+traffic (/capture) use separate keep-alive connection pools, so a slow JPEG
+download never delays a steering command.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import logging
 from typing import Dict, Optional, Any
 import time
@@ -14,13 +19,21 @@ logger = logging.getLogger(__name__)
 class ESP32CommunicationService:
     """Service class for ESP32-CAM communication"""
 
-    def __init__(self, base_url: str, timeout: int = 10):
+    def __init__(
+        self,
+        base_url: str,
+        timeout: int = 10,
+        control_pool_size: int = 2,
+        capture_pool_size: int = 1,
+    ):
         """
         Initialize ESP32 communication service
 
         Args:
             base_url: ESP32-CAM base URL (e.g., http://192.168.0.65)
             timeout: Request timeout in seconds
+            control_pool_size: Keep-alive connections kept for control traffic
+            capture_pool_size: Keep-alive connections kept for capture traffic
         """
         self.base_url = base_url
         self.timeout = timeout
@@ -29,6 +42,69 @@ class ESP32CommunicationService:
             0.05  # 50ms minimum interval between commands for smoother control
         )
 
+        # Separate pools: control commands never wait behind a JPEG download
+        self.control_session = self._create_session(control_pool_size)
+        self.capture_session = self._create_session(capture_pool_size)
+
+    @staticmethod
+    def _create_session(pool_size: int) -> requests.Session:
+        """
+        Create a keep-alive session with a single-host connection pool
+
+        Args:
+            pool_size: Number of connections kept alive
+
+        Returns:
+            Configured requests session
+        """
+        session = requests.Session()
+        # Retries are handled by callers; pool_block=False opens an extra
+        # short-lived connection instead of waiting when the pool is busy
+        adapter = HTTPAdapter(
+            pool_connections=1, pool_maxsize=pool_size, max_retries=0, pool_block=False
+        )
+        session.mount("http://", adapter)
+        session.headers.update({"Connection": "keep-alive"})
+        return session
+
+    @staticmethod
+    def _pool_stats(session: requests.Session) -> Dict[str, Any]:
+        """
+        Connection reuse counters of a session's connection pools
+
+        Returns:
+            {"requests", "new_connections", "reused", "reuse_ratio"}
+        """
+        total_requests = 0
+        new_connections = 0
+        pools = session.get_adapter("http://").poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            total_requests += pool.num_requests
+            new_connections += pool.num_connections
+
+        reused = max(0, total_requests - new_connections)
+        return {
+            "requests": total_requests,
+            "new_connections": new_connections,
+            "reused": reused,
+            "reuse_ratio": round(reused / total_requests, 3) if total_requests else 0.0,
+        }
+
+    def get_connection_stats(self) -> Dict[str, Any]:
+        """
+        Get connection reuse counters for control and capture pools
+
+        Returns:
+            {"control": {...}, "capture": {...}}
+        """
+        return {
+            "control": self._pool_stats(self.control_session),
+            "capture": self._pool_stats(self.capture_session),
+        }
+
     def get_status(self) -> Optional[Dict[str, Any]]:
         """
         Get ESP32-CAM status information
@@ -37,7 +113,9 @@ class ESP32CommunicationService:
             Status dictionary or None (if failed)
         """
         try:
-            response = requests.get(f"{self.base_url}/status", timeout=self.timeout)
+            response = self.control_session.get(
+                f"{self.base_url}/status", timeout=self.timeout
+            )
 
             if response.status_code != 200:
                 logger.error(f"Status check failed: HTTP {response.status_code}")
@@ -80,7 +158,9 @@ class ESP32CommunicationService:
             if params and params.get("cmd") == "stop":
                 # Send stop command multiple times to ensure it's received
                 for _ in range(3):
-                    response = requests.get(url, params=params, timeout=self.timeout)
+                    response = self.control_session.get(
+                        url, params=params, timeout=self.timeout
+                    )
                     if response.status_code != 200:
                         logger.warning(
                             f"Stop command failed: HTTP {response.status_code}"
@@ -88,7 +168,7 @@ class ESP32CommunicationService:
                     time.sleep(0.1)  # 100ms between retries
 
                 # Verify motor status
-                status_response = requests.get(
+                status_response = self.control_session.get(
                     f"{self.base_url}/status", timeout=self.timeout
                 )
                 if status_response.status_code == 200:
@@ -100,7 +180,9 @@ class ESP32CommunicationService:
                         logger.warning("Could not verify motor status")
             else:
                 # Normal command handling
-                response = requests.get(url, params=params, timeout=self.timeout)
+                response = self.control_session.get(
+                    url, params=params, timeout=self.timeout
+                )
 
             self.last_command_time = time.time()
 
@@ -151,7 +233,9 @@ class ESP32CommunicationService:
             Connection status
         """
         try:
-            response = requests.get(f"{self.base_url}/status", timeout=self.timeout)
+            response = self.control_session.get(
+                f"{self.base_url}/status", timeout=self.timeout
+            )
             return response.status_code == 200
         except:
             return False
@@ -164,7 +248,9 @@ class ESP32CommunicationService:
             True if motors are confirmed stopped
         """
         try:
-            response = requests.get(f"{self.base_url}/status", timeout=self.timeout)
+            response = self.control_session.get(
+                f"{self.base_url}/status", timeout=self.timeout
+            )
             if response.status_code == 200:
                 data = response.json()
                 return data.get("motor_status") == "stopped"
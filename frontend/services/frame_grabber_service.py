@@ -0,0 +1,396 @@
+"""
+Frame Grabber Service
+
+Single background producer that polls the ESP32-CAM /capture endpoint and
+shares the latest decoded frame with every consumer (autonomous loop,
+camera/AI routes, browser tabs), so camera load stays constant no matter
+how many consumers are active.
+
+In pipelined mode the next /capture request starts as soon as a consumer
+picks up the current frame, so the transfer overlaps with the consumer's
+decode/analysis. At most one unconsumed frame is held; it is refetched
+once older than stale_age.
+"""
+
+import logging
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Iterator, Optional, Dict, Any
+
+import numpy as np
+import requests
+
+# Add repo root to sys.path (shared frame_source package)
+_REPO_ROOT = str(Path(__file__).resolve().parents[2])
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+
+from frame_source import FrameSource, PollingFrameSource
+
+logger = logging.getLogger(__name__)
+
+
+class GrabbedFrame:
+    """Frame published by FrameGrabberService (shared, treat as read-only)"""
+
+    __slots__ = ("image", "jpeg", "seq", "captured_at", "latency_ms", "decode_ms")
+
+    def __init__(
+        self,
+        image: np.ndarray,
+        jpeg: bytes,
+        seq: int,
+        captured_at: float,
+        latency_ms: float,
+        decode_ms: float,
+    ):
+        """
+        Args:
+            image: Decoded BGR image (read-only, copy before drawing on it)
+            jpeg: Raw JPEG bytes as received from the ESP32
+            seq: Monotonic sequence number (starts at 1)
+            captured_at: time.time() when the response was received
+            latency_ms: /capture round trip time in ms
+            decode_ms: JPEG decode time in ms
+        """
+        self.image = image
+        self.jpeg = jpeg
+        self.seq = seq
+        self.captured_at = captured_at
+        self.latency_ms = latency_ms
+        self.decode_ms = decode_ms
+
+    @property
+    def age(self) -> float:
+        """Seconds since this frame was captured"""
+        return time.time() - self.captured_at
+
+
+class FrameGrabberService:
+    """Shared single-producer /capture frame grabber"""
+
+    # Back-off after consecutive capture failures (seconds)
+    ERROR_BACKOFF_MIN = 0.1
+    ERROR_BACKOFF_MAX = 1.0
+
+    def __init__(
+        self,
+        capture_url: str,
+        target_fps: float = 15,
+        timeout: float = 1.5,
+        idle_timeout: float = 5.0,
+        pipelined: bool = False,
+        stale_age: float = 0.3,
+        session: Optional[requests.Session] = None,
+    ):
+        """
+        Initialize frame grabber (the thread is started with start())
+
+        Args:
+            capture_url: ESP32-CAM /capture URL
+            target_fps: Upper bound on the capture rate
+            timeout: /capture request timeout in seconds
+            idle_timeout: Pause capturing when no consumer asked for a frame
+                          within this many seconds
+            pipelined: Fetch the next frame as soon as the current one is
+                       picked up (instead of polling at target_fps)
+            stale_age: Pipelined mode: refetch an unconsumed frame older
+                       than this many seconds
+            session: Session to fetch with (e.g. the ESP32 service's capture
+                     pool); a private one is created if None
+        """
+        self.capture_url = capture_url
+        self.frame_interval = 1.0 / target_fps
+        self.timeout = timeout
+        self.idle_timeout = idle_timeout
+        self.pipelined = pipelined
+        self.stale_age = stale_age
+        self._session = session
+
+        self._cond = threading.Condition()
+        self._latest: Optional[GrabbedFrame] = None
+        self._consumed_seq = 0
+        self._last_demand = 0.0
+        self._running = False
+        self._stop_event = threading.Event()
+        self._thread = None
+
+        self.stats = {
+            "frames_captured": 0,
+            "capture_errors": 0,
+            "frames_discarded": 0,
+            "last_latency_ms": 0,
+            "last_decode_ms": 0,
+            "start_time": None,
+        }
+
+    # ----- Lifecycle -----
+    def start(self):
+        """Start the background producer thread (idempotent)"""
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+            self._stop_event.clear()
+            self.stats["start_time"] = time.time()
+
+        self._thread = threading.Thread(
+            target=self._run, name="frame-grabber", daemon=True
+        )
+        self._thread.start()
+        logger.info(
+            f"Frame grabber started ({self.capture_url}, "
+            f"max {1.0 / self.frame_interval:.0f}fps)"
+        )
+
+    def stop(self):
+        """Stop the background producer thread"""
+        with self._cond:
+            if not self._running:
+                return
+            self._running = False
+            self._stop_event.set()
+            self._cond.notify_all()
+
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=self.timeout + 1.0)
+        logger.info("Frame grabber stopped")
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    # ----- Consumer API -----
+    def get_latest(
+        self, max_age: Optional[float] = None, timeout: Optional[float] = None
+    ) -> Optional[GrabbedFrame]:
+        """
+        Get the latest frame, waiting for a fresh one if needed
+
+        Args:
+            max_age: Maximum acceptable frame age in seconds (None = any)
+            timeout: Maximum time to wait for a new frame
+
+        Returns:
+            GrabbedFrame or None (no frame within timeout)
+        """
+        with self._cond:
+            self._mark_demand()
+            frame = self._latest
+            if frame is not None and (max_age is None or frame.age <= max_age):
+                return self._take(frame)
+            after_seq = frame.seq if frame is not None else 0
+
+        return self.wait_for_frame(after_seq, timeout)
+
+    def wait_for_frame(
+        self, after_seq: int, timeout: Optional[float] = None
+    ) -> Optional[GrabbedFrame]:
+        """
+        Block until a frame newer than after_seq is published
+
+        Args:
+            after_seq: Sequence number of the last frame the caller consumed
+            timeout: Maximum time to wait (default: 2x request timeout)
+
+        Returns:
+            Newest GrabbedFrame (intermediate frames are skipped) or None
+        """
+        if timeout is None:
+            timeout = self.timeout * 2
+        deadline = time.time() + timeout
+
+        with self._cond:
+            self._mark_demand()
+            while self._latest is None or self._latest.seq <= after_seq:
+                remaining = deadline - time.time()
+                if remaining <= 0 or not self._running:
+                    return None
+                self._cond.wait(remaining)
+            return self._take(self._latest)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get grabber statistics
+
+        Returns:
+            Statistics dictionary
+        """
+        start_time = self.stats["start_time"]
+        elapsed = time.time() - start_time if start_time else 0
+        latest = self._latest
+
+        return {
+            "running": self._running,
+            "active": self._has_demand(),
+            "pipelined": self.pipelined,
+            "frames_captured": self.stats["frames_captured"],
+            "capture_errors": self.stats["capture_errors"],
+            "frames_discarded": self.stats["frames_discarded"],
+            "last_latency_ms": self.stats["last_latency_ms"],
+            "last_decode_ms": self.stats["last_decode_ms"],
+            "latest_seq": latest.seq if latest else 0,
+            "latest_age_ms": int(latest.age * 1000) if latest else None,
+            "avg_fps": (
+                f"{self.stats['frames_captured'] / elapsed:.1f}"
+                if elapsed > 0
+                else "0.0"
+            ),
+        }
+
+    # ----- Producer -----
+    def _mark_demand(self):
+        """Record consumer demand and wake an idle producer (lock held)"""
+        self._last_demand = time.time()
+        self._cond.notify_all()
+
+    def _take(self, frame: GrabbedFrame) -> GrabbedFrame:
+        """Mark frame consumed so a pipelined producer fetches the next (lock held)"""
+        if frame.seq > self._consumed_seq:
+            self._consumed_seq = frame.seq
+            self._cond.notify_all()
+        return frame
+
+    def _has_demand(self) -> bool:
+        return time.time() - self._last_demand <= self.idle_timeout
+
+    def _run(self):
+        """Background loop: fetch, decode and publish frames"""
+        # Fetch/decode is shared with the other tools via frame_source
+        source = PollingFrameSource(
+            self.capture_url, timeout=self.timeout, session=self._session
+        )
+        error_backoff = self.ERROR_BACKOFF_MIN
+
+        while True:
+            # Sleep while nobody is consuming frames
+            with self._cond:
+                while self._running and not self._has_demand():
+                    self._cond.wait(self.idle_timeout)
+                if not self._running:
+                    break
+
+            fetch_start = time.time()
+            frame = self._fetch_frame(source)
+
+            if frame is None:
+                self.stats["capture_errors"] += 1
+                self._sleep(error_backoff)
+                error_backoff = min(error_backoff * 2, self.ERROR_BACKOFF_MAX)
+                continue
+
+            error_backoff = self.ERROR_BACKOFF_MIN
+            with self._cond:
+                # Frame replaced before anyone picked it up
+                if self._latest is not None and self._latest.seq > self._consumed_seq:
+                    self.stats["frames_discarded"] += 1
+                self._latest = frame
+                self._cond.notify_all()
+
+            if self.pipelined:
+                self._wait_for_pickup(frame)
+
+            # Rate cap: never poll the camera faster than target_fps
+            elapsed = time.time() - fetch_start
+            if elapsed < self.frame_interval:
+                self._sleep(self.frame_interval - elapsed)
+
+        if self._session is None:
+            source.session.close()
+
+    def _wait_for_pickup(self, frame: GrabbedFrame):
+        """
+        Pipelined mode: hold at most one unconsumed frame
+
+        Returns as soon as a consumer takes the frame (so the next fetch
+        overlaps with its processing), when the frame becomes stale, or on stop.
+        """
+        with self._cond:
+            while self._running and self._consumed_seq < frame.seq:
+                remaining = self.stale_age - frame.age
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+
+    def _fetch_frame(self, source: PollingFrameSource) -> Optional[GrabbedFrame]:
+        """
+        Fetch and decode one frame from /capture
+
+        Returns:
+            GrabbedFrame or None on failure
+        """
+        image = source.read()
+        if image is None:
+            return None
+
+        # Shared between consumers: forbid in-place drawing
+        image.flags.writeable = False
+
+        self.stats["frames_captured"] += 1
+        self.stats["last_latency_ms"] = int(source.latency_ms)
+        self.stats["last_decode_ms"] = int(source.decode_ms)
+
+        seq = self._latest.seq + 1 if self._latest else 1
+        return GrabbedFrame(
+            image,
+            source.jpeg.obj,
+            seq,
+            source.timestamp,
+            source.latency_ms,
+            source.decode_ms,
+        )
+
+    def _sleep(self, seconds: float):
+        """Interruptible sleep (wakes up early on stop() only)"""
+        self._stop_event.wait(seconds)
+
+
+class GrabberFrameSource(FrameSource):
+    """FrameSource view of a FrameGrabberService (one consumer's frames)"""
+
+    is_live = True
+
+    def __init__(self, grabber: FrameGrabberService, timeout: float = 1.5):
+        """
+        Args:
+            grabber: Shared frame grabber (started on iteration)
+            timeout: Max wait for a new frame before logging a warning
+        """
+        super().__init__()
+        self.grabber = grabber
+        self.timeout = timeout
+        self._closed = False
+
+    def frames(self) -> Iterator[np.ndarray]:
+        """
+        Yield every frame newer than the previous one (read-only images)
+
+        Iteration ends when the source is closed or the grabber is stopped.
+
+        Yields:
+            BGR image
+        """
+        self.grabber.start()
+        last_seq = 0
+
+        while not self._closed:
+            frame = self.grabber.wait_for_frame(last_seq, timeout=self.timeout)
+            if frame is None:
+                if not self.grabber.is_running:
+                    # Stopped grabber returns None immediately: don't spin
+                    logger.info("Frame grabber stopped, ending frame iteration")
+                    return
+                logger.warning("No frame from grabber")
+                self.stats["errors"] += 1
+                continue
+
+            last_seq = frame.seq
+            self.decode_ms = frame.decode_ms
+            self._publish(frame.jpeg, frame.captured_at, frame.latency_ms, frame.seq)
+            yield frame.image
+
+    def close(self):
+        """End iteration (the shared grabber keeps running for other consumers)"""
+        self._closed = True
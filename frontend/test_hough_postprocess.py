@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+"""
+Hough 후처리 벤치마크 스크립트
+
+HoughLinesP 결과 (N, 1, 4) 선분 개수별로
+LaneDetector._classify_lanes / LineDetectorModule._calculate_center_point의
+배열 연산 구현과 기존 선분별 파이썬 루프 구현의 처리 시간을 비교합니다.
+
+새 구현은 선분 길이 가중 평균이므로 대표선 좌표는 기존 단순 평균과 다를 수 있고,
+좌/우 분류 결과(검출된 차선 쪽)는 같아야 합니다.
+
+사용법:
+    python test_hough_postprocess.py
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+# Add repo root to sys.path (shared line_tracking package)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai.detectors.lane_detector import LaneDetector  # noqa: E402
+from line_tracking.line_detector_module import LineDetectorModule  # noqa: E402
+
+SEGMENT_COUNTS = [10, 50, 100, 300, 1000]
+WIDTH, HEIGHT = 320, 240
+REPEATS = 500
+
+
+def make_lines(count, rng):
+    """무작위 선분 생성 (HoughLinesP 출력 형식, 좌/우 차선 + 바닥 무늬)"""
+    x1 = rng.integers(0, WIDTH, count)
+    y1 = rng.integers(HEIGHT // 2, HEIGHT, count)
+    x2 = np.clip(x1 + rng.integers(-60, 61, count), 0, WIDTH - 1)
+    y2 = np.clip(y1 - rng.integers(0, 80, count), 0, HEIGHT - 1)
+    return np.stack([x1, y1, x2, y2], axis=1).astype(np.int32).reshape(-1, 1, 4)
+
+
+def classify_lanes_loop(lines, image_width):
+    """기존 구현: 선분별 루프 + 단순 평균 (비교용)"""
+    left_lines = []
+    right_lines = []
+    center_x = image_width // 2
+
+    for line in lines:
+        x1, y1, x2, y2 = line[0]
+        if x2 == x1:
+            continue
+        slope = (y2 - y1) / (x2 - x1)
+        if abs(slope) < 0.5:
+            continue
+        if slope < 0 and x1 < center_x and x2 < center_x:
+            left_lines.append((x1, y1, x2, y2))
+        elif slope > 0 and x1 > center_x and x2 > center_x:
+            right_lines.append((x1, y1, x2, y2))
+
+    detected = []
+    for side, side_lines in (("left", left_lines), ("right", right_lines)):
+        if side_lines:
+            detected.append(
+                {
+                    "side": side,
+                    "line": tuple(
+                        int(np.mean([line[i] for line in side_lines]))
+                        for i in range(4)
+                    ),
+                }
+            )
+    return detected
+
+
+def center_point_loop(lines):
+    """기존 구현: 선분별 루프 + 단순 평균 (비교용)"""
+    x_positions = []
+    for line in lines:
+        x1, y1, x2, y2 = line[0]
+        x_positions.append((x1 + x2) // 2)
+    return int(np.mean(x_positions))
+
+
+def measure_us(func, *args):
+    """호출당 평균 시간 (마이크로초)"""
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        func(*args)
+    return (time.perf_counter() - start) / REPEATS * 1e6
+
+
+def main():
+    lane_detector = LaneDetector()
+    line_detector = LineDetectorModule()
+    rng = np.random.default_rng(0)
+    failed = 0
+
+    print("=" * 72)
+    print("🔍 Hough Post-processing Benchmark")
+    print("=" * 72)
+    print(
+        f"{'segments':<10}{'classify loop':>15}{'vectorized':>12}{'speedup':>9}"
+        f"{'center loop':>14}{'vectorized':>12}{'speedup':>9}"
+    )
+
+    for count in SEGMENT_COUNTS:
+        lines = make_lines(count, rng)
+
+        expected = [lane["side"] for lane in classify_lanes_loop(lines, WIDTH)]
+        actual = [
+            lane["side"] for lane in lane_detector._classify_lanes(lines, WIDTH)
+        ]
+        if actual != expected:
+            print(f"❌ {count} segments: {actual} != {expected}")
+            failed += 1
+            continue
+
+        classify_loop_us = measure_us(classify_lanes_loop, lines, WIDTH)
+        classify_us = measure_us(lane_detector._classify_lanes, lines, WIDTH)
+        center_loop_us = measure_us(center_point_loop, lines)
+        center_us = measure_us(line_detector._calculate_center_point, lines, WIDTH)
+        print(
+            f"{count:<10}{classify_loop_us:>13.1f}us{classify_us:>10.1f}us"
+            f"{classify_loop_us / classify_us:>8.1f}x"
+            f"{center_loop_us:>12.1f}us{center_us:>10.1f}us"
+            f"{center_loop_us / center_us:>8.1f}x"
+        )
+
+    print("=" * 72)
+    if failed:
+        print(f"❌ {failed}개 분류 결과 불일치")
+        return 1
+    print("✅ 모든 분류 결과 일치")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+"""
+ROI 우선 처리 비교 스크립트
+
+같은 프레임을 전체 프레임 경로와 ROI 우선 경로로 처리하여
+명령 일치율, 마스크 일치율, 단계별 처리 시간 절감을 출력합니다.
+
+사용법:
+    python test_roi_first.py                 # 합성 트랙 300프레임
+    python test_roi_first.py session.esprec  # 녹화 파일
+"""
+
+import os
+import sys
+
+import numpy as np
+
+# Add repo root to sys.path (shared frame_source package)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from frame_source import ReplayFrameSource, SyntheticFrameSource  # noqa: E402
+from ai.core import AutonomousLaneTrackerV2  # noqa: E402
+
+STAGES = ("preprocess", "mask", "noise", "steering", "corner", "total")
+
+
+def compare(source, max_frames: int = 300) -> int:
+    """두 처리 경로 비교"""
+    legacy = AutonomousLaneTrackerV2(roi_first=False)
+    roi_first = AutonomousLaneTrackerV2(roi_first=True)
+
+    times = {"full": {s: [] for s in STAGES}, "roi": {s: [] for s in STAGES}}
+    same_command = 0
+    mask_agreement = []
+    frames = 0
+    failed = 0  # 처리 실패 (ERROR 상태)
+
+    for image in source:
+        full_result = legacy.process_frame(image, debug=True)
+        roi_result = roi_first.process_frame(image, debug=True)
+        if "timings" not in full_result or "timings" not in roi_result:
+            failed += 1
+            continue
+
+        for stage in STAGES:
+            times["full"][stage].append(full_result["timings"][stage])
+            times["roi"][stage].append(roi_result["timings"][stage])
+
+        same_command += full_result["command"] == roi_result["command"]
+        full_mask = full_result["debug_images"]["6_clean_mask"]
+        roi_mask = roi_result["debug_images"]["6_clean_mask"]
+        mask_agreement.append(np.mean(full_mask == roi_mask))
+
+        frames += 1
+        if frames >= max_frames:
+            break
+
+    if frames == 0:
+        print(f"❌ 비교할 프레임 없음 (처리 실패 {failed}프레임, 320x240 필요)")
+        return 1
+
+    print("=" * 56)
+    print(f"🧪 ROI 우선 처리 비교 ({frames}프레임)")
+    print("=" * 56)
+    print(f"{'단계':<12}{'전체 (ms)':>12}{'ROI 우선 (ms)':>16}{'절감':>10}")
+    for stage in STAGES:
+        full_ms = float(np.median(times["full"][stage]))
+        roi_ms = float(np.median(times["roi"][stage]))
+        saving = (1 - roi_ms / full_ms) * 100 if full_ms > 0 else 0
+        print(f"{stage:<12}{full_ms:>12.3f}{roi_ms:>16.3f}{saving:>9.1f}%")
+    print("-" * 56)
+    print(f"명령 일치율:   {same_command / frames * 100:.1f}%")
+    print(f"마스크 일치율: {np.mean(mask_agreement) * 100:.2f}%")
+    if failed:
+        print(f"처리 실패:     {failed}프레임")
+    print("=" * 56)
+    return 0
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        frame_source = ReplayFrameSource(sys.argv[1], mode="max")
+    else:
+        frame_source = SyntheticFrameSource(count=300)
+
+    with frame_source:
+        sys.exit(compare(frame_source))
@@ -4,11 +4,13 @@ ESP32-CAM 자율주행을 위한 라인 추적 모듈
 """
 
 from .line_detector_module import LineDetectorModule
+from .projection_line_detector_module import ProjectionLineDetectorModule
 from .direction_judge_module import DirectionJudgeModule
 from .visualization_module import VisualizationModule
 
 __all__ = [
     "LineDetectorModule",
+    "ProjectionLineDetectorModule",
     "DirectionJudgeModule",
     "VisualizationModule",
 ]
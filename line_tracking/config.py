@@ -2,14 +2,17 @@
 라인 트래킹 설정 파일
 """
 
-# ESP32-CAM 연결 설정
-ESP32_IP = "192.168.0.65"
+import os
+
+# ESP32-CAM 연결 설정 (환경변수로 덮어쓰기 가능, 예: 스탠드인 서버 127.0.0.1:8080)
+ESP32_IP = os.getenv("ESP32_IP", "192.168.0.65")
 ESP32_BASE_URL = f"http://{ESP32_IP}"
 
 # 영상 설정
 CAMERA_WIDTH = 320
 CAMERA_HEIGHT = 240
 CAPTURE_FPS = 10  # 초당 프레임 수
+CAPTURE_TIMEOUT = 2  # 캡처 타임아웃 (초)
 
 # 라인 검출 설정
 CANNY_LOW_THRESHOLD = 85
@@ -19,6 +22,15 @@ MIN_LINE_LENGTH = 10
 MAX_LINE_GAP = 10
 ROI_BOTTOM_RATIO = 0.5  # 화면 하단 50%만 분석
 
+# 라인 검출 방식: "hough" (Canny + Hough Lines) | "projection" (이진화 + 열 투영)
+LINE_DETECTOR_MODE = "hough"
+
+# 열 투영 검출 설정 (LINE_DETECTOR_MODE = "projection")
+PROJECTION_BANDS = 6  # ROI를 나눌 가로 띠 개수 (띠별 중심 → 방향 추정)
+PROJECTION_MIN_FILL = 0.5  # 라인 열로 볼 띠 안의 라인 픽셀 비율
+PROJECTION_MAX_LINE_WIDTH = 80  # 라인으로 인정할 최대 폭 (픽셀)
+LINE_IS_BRIGHT = True  # True: 어두운 바닥 위 밝은 라인, False: 밝은 바닥 위 어두운 라인
+
 # 방향 판단 설정
 DEADZONE_THRESHOLD = 30  # 픽셀 (이 범위 내면 직진)
 STRONG_TURN_THRESHOLD = 80  # 픽셀
@@ -5,7 +5,7 @@ Canny Edge Detection + Hough Lines를 사용한 라인 검출
 
 import cv2
 import numpy as np
-from typing import Optional, Tuple, List
+from typing import Dict, Optional, Tuple, List
 import logging
 
 logger = logging.getLogger(__name__)
@@ -41,6 +41,9 @@ class LineDetectorModule:
         self.max_line_gap = max_line_gap
         self.roi_bottom_ratio = roi_bottom_ratio
         
+        # (높이, ROI 비율) → ROI 시작 Y (해상도가 바뀔 때만 다시 계산)
+        self._roi_start_cache: Dict[Tuple[int, float], int] = {}
+        
         logger.info("라인 검출기 초기화 완료")
     
     def detect_line_center(self, frame: np.ndarray) -> Tuple[Optional[int], np.ndarray]:
@@ -62,7 +65,7 @@ class LineDetectorModule:
         height, width = frame.shape[:2]
         
         # 1. ROI 영역 추출 (하단 영역만)
-        roi_start_y = int(height * self.roi_bottom_ratio)
+        roi_start_y = self.get_roi_start_y(height)
         roi = frame[roi_start_y:height, 0:width]
         
         # 2. 그레이스케일 변환
@@ -95,10 +98,10 @@ class LineDetectorModule:
         image_width: int
     ) -> Optional[int]:
         """
-        검출된 라인들의 중심점 계산
+        검출된 라인들의 중심점 계산 (배열 연산, 라인 길이 가중 평균)
         
         Args:
-            lines: Hough Lines 결과
+            lines: Hough Lines 결과 ((N, 1, 4) 또는 (N, 4))
             image_width: 이미지 너비
         
         Returns:
@@ -108,22 +111,19 @@ class LineDetectorModule:
         if lines is None or len(lines) == 0:
             return None
         
-        # 모든 라인의 중심점을 X 좌표 기준으로 계산
-        x_positions = []
-        
-        for line in lines:
-            x1, y1, x2, y2 = line[0]
-            
-            # 라인의 중심점 X 좌표
-            center_x = (x1 + x2) // 2
-            x_positions.append(center_x)
+        segments = lines.reshape(-1, 4).astype(np.float64)
+        x1, y1, x2, y2 = segments.T
         
-        # Early return: X 좌표가 없으면 None
-        if not x_positions:
-            return None
+        # 라인별 중심점 X 좌표와 길이 (긴 라인일수록 큰 가중치)
+        centers_x = (x1 + x2) / 2
+        lengths = np.hypot(x2 - x1, y2 - y1)
         
-        # 전체 라인의 평균 중심점 계산
-        final_center_x = int(np.mean(x_positions))
+        # 길이 0인 라인만 있으면 단순 평균
+        total = lengths.sum()
+        if total > 0:
+            final_center_x = int(lengths @ centers_x / total)
+        else:
+            final_center_x = int(centers_x.mean())
         
         return final_center_x
     
@@ -137,5 +137,10 @@ class LineDetectorModule:
         Returns:
             ROI 시작 Y 좌표
         """
-        return int(height * self.roi_bottom_ratio)
+        key = (height, self.roi_bottom_ratio)
+        roi_start_y = self._roi_start_cache.get(key)
+        if roi_start_y is None:
+            roi_start_y = int(height * self.roi_bottom_ratio)
+            self._roi_start_cache[key] = roi_start_y
+        return roi_start_y
 
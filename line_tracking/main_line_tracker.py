@@ -8,14 +8,17 @@ import sys
 import time
 import logging
 from pathlib import Path
+from typing import Optional
 
 # 부모 디렉토리를 sys.path에 추가 (services 모듈 import용)
 sys.path.append(str(Path(__file__).parent.parent))
 
 from line_detector_module import LineDetectorModule
+from projection_line_detector_module import ProjectionLineDetectorModule
 from direction_judge_module import DirectionJudgeModule
 from visualization_module import VisualizationModule
 from services.esp32_communication import ESP32Communication
+from frame_source import FrameSource, PollingFrameSource
 import config as cfg
 
 # 로깅 설정
@@ -36,14 +39,24 @@ class MainLineTracker:
         logger.info("=" * 60)
 
         # 모듈 초기화
-        self.line_detector = LineDetectorModule(
-            canny_low=cfg.CANNY_LOW_THRESHOLD,
-            canny_high=cfg.CANNY_HIGH_THRESHOLD,
-            hough_threshold=cfg.HOUGH_THRESHOLD,
-            min_line_length=cfg.MIN_LINE_LENGTH,
-            max_line_gap=cfg.MAX_LINE_GAP,
-            roi_bottom_ratio=cfg.ROI_BOTTOM_RATIO,
-        )
+        if cfg.LINE_DETECTOR_MODE == "projection":
+            self.line_detector = ProjectionLineDetectorModule(
+                roi_bottom_ratio=cfg.ROI_BOTTOM_RATIO,
+                n_bands=cfg.PROJECTION_BANDS,
+                min_fill_ratio=cfg.PROJECTION_MIN_FILL,
+                max_line_width=cfg.PROJECTION_MAX_LINE_WIDTH,
+                line_is_bright=cfg.LINE_IS_BRIGHT,
+            )
+        else:
+            self.line_detector = LineDetectorModule(
+                canny_low=cfg.CANNY_LOW_THRESHOLD,
+                canny_high=cfg.CANNY_HIGH_THRESHOLD,
+                hough_threshold=cfg.HOUGH_THRESHOLD,
+                min_line_length=cfg.MIN_LINE_LENGTH,
+                max_line_gap=cfg.MAX_LINE_GAP,
+                roi_bottom_ratio=cfg.ROI_BOTTOM_RATIO,
+            )
+        logger.info(f"라인 검출 방식: {cfg.LINE_DETECTOR_MODE}")
 
         self.direction_judge = DirectionJudgeModule(
             deadzone_threshold=cfg.DEADZONE_THRESHOLD,
@@ -61,6 +74,7 @@ class MainLineTracker:
         self.frame_count = 0
         self.last_command = None
         self.start_time = time.time()
+        self.offline = False  # 오프라인 소스 재생 중 (명령 전송 안 함)
 
         logger.info("✅ 시스템 초기화 완료")
 
@@ -111,7 +125,7 @@ class MainLineTracker:
             offset = 0
 
         # 3. ESP32에 명령 전송
-        if cfg.ENABLE_COMMAND_SEND:
+        if cfg.ENABLE_COMMAND_SEND and not self.offline:
             if command != self.last_command:
                 success = self.esp32_comm.send_command(command)
                 if success:
@@ -137,19 +151,28 @@ class MainLineTracker:
         if self.frame_count % 10 == 0:
             elapsed = time.time() - self.start_time
             fps = self.frame_count / elapsed if elapsed > 0 else 0
+            heading = getattr(self.line_detector, "last_heading", None)
+            heading_text = f" | 방향: {heading:+.1f}°" if heading is not None else ""
             logger.info(
                 f"프레임: {self.frame_count} | "
                 f"FPS: {fps:.1f} | "
                 f"명령: {command.upper()} | "
                 f"오프셋: {offset}px"
+                f"{heading_text}"
             )
 
-    def run(self) -> None:
+    def run(self, frame_source: Optional[FrameSource] = None) -> None:
         """
         메인 실행 루프
+
+        Args:
+            frame_source: 프레임 소스 (None이면 ESP32 폴링,
+                          녹화 재생 등 오프라인 소스면 연결 확인/명령 전송 생략)
         """
+        self.offline = frame_source is not None and not frame_source.is_live
+
         # 연결 확인
-        if not self.check_connection():
+        if not self.offline and not self.check_connection():
             return
 
         logger.info("=" * 60)
@@ -159,8 +182,15 @@ class MainLineTracker:
         logger.info("")
 
         try:
-            # 폴링 모드로 프레임 수신
-            frame_generator = self.esp32_comm.polling_generator(fps=cfg.CAPTURE_FPS)
+            # 외부 소스 또는 폴링 모드로 프레임 수신
+            if frame_source is not None:
+                frame_generator = frame_source
+            else:
+                frame_generator = PollingFrameSource(
+                    f"{cfg.ESP32_BASE_URL}/capture",
+                    fps=cfg.CAPTURE_FPS,
+                    timeout=cfg.CAPTURE_TIMEOUT,
+                )
 
             for frame in frame_generator:
                 # 프레임 처리
@@ -186,7 +216,7 @@ class MainLineTracker:
         logger.info("시스템 종료 중...")
 
         # 마지막 정지 명령 전송
-        if cfg.ENABLE_COMMAND_SEND:
+        if cfg.ENABLE_COMMAND_SEND and not self.offline:
             logger.info("정지 명령 전송")
             self.esp32_comm.send_command("stop")
 
@@ -0,0 +1,198 @@
+"""
+투영 라인 검출 모듈
+ROI 이진화 + 여러 가로 띠의 열 투영(column projection)으로 라인 중심을 찾는
+Canny + Hough Lines의 빠른 대안
+"""
+
+import cv2
+import numpy as np
+from typing import Any, Dict, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class ProjectionLineDetectorModule:
+    """열 투영 라인 검출기 클래스 (LineDetectorModule과 같은 인터페이스)"""
+
+    def __init__(
+        self,
+        roi_bottom_ratio: float = 0.5,
+        n_bands: int = 6,
+        min_fill_ratio: float = 0.5,
+        min_line_width: int = 2,
+        max_line_width: int = 80,
+        min_contrast: int = 40,
+        line_is_bright: bool = True,
+    ):
+        """
+        투영 라인 검출기 초기화
+
+        Args:
+            roi_bottom_ratio: ROI 하단 영역 비율 (0.0 ~ 1.0)
+            n_bands: ROI를 나눌 가로 띠(스캔라인 묶음) 개수
+            min_fill_ratio: 라인 열로 볼 띠 안의 라인 픽셀 비율 하한
+            min_line_width: 라인으로 인정할 최소 폭 (픽셀)
+            max_line_width: 라인으로 인정할 최대 폭 (픽셀, 넓으면 조명/바닥)
+            min_contrast: ROI 최대-최소 밝기 차 하한 (미만이면 라인 없음)
+            line_is_bright: True면 밝은 라인 (어두운 바닥), False면 어두운 라인
+        """
+        self.roi_bottom_ratio = roi_bottom_ratio
+        self.n_bands = n_bands
+        self.min_fill_ratio = min_fill_ratio
+        self.min_line_width = min_line_width
+        self.max_line_width = max_line_width
+        self.min_contrast = min_contrast
+        self.line_is_bright = line_is_bright
+
+        # (높이, ROI 비율) → ROI 시작 Y (해상도가 바뀔 때만 다시 계산)
+        self._roi_start_cache: Dict[Tuple[int, float], int] = {}
+
+        self.last_heading: Optional[float] = None  # 마지막 라인 방향 (도)
+
+        logger.info("투영 라인 검출기 초기화 완료")
+
+    def detect_line_center(self, frame: np.ndarray) -> Tuple[Optional[int], np.ndarray]:
+        """
+        프레임에서 라인의 중심점 X 좌표를 검출
+
+        Args:
+            frame: 입력 이미지 (BGR)
+
+        Returns:
+            (중심점_x, 처리된_이미지)
+            - 중심점_x: 라인의 중심 X 좌표 (없으면 None)
+            - 처리된_이미지: ROI 이진 마스크 (디버깅용)
+        """
+        result = self.detect_line(frame)
+        center_x = result["center_x"]
+        return (None if center_x is None else int(center_x)), result["mask"]
+
+    def detect_line(self, frame: np.ndarray) -> Dict[str, Any]:
+        """
+        라인 중심(서브픽셀)과 방향 검출
+
+        Args:
+            frame: 입력 이미지 (BGR)
+
+        Returns:
+            {
+                "center_x": 띠별 중심 평균 X (float, 없으면 None),
+                "heading": 라인 방향 (도, 0: 수직, 양수: 위로 갈수록 오른쪽, 없으면 None),
+                "band_centers": [(y, x), ...] 원본 이미지 기준 띠별 중심,
+                "mask": ROI 이진 마스크
+            }
+        """
+        self.last_heading = None
+
+        # Early return: 빈 프레임
+        if frame is None or frame.size == 0:
+            return self._not_found(frame)
+
+        height, width = frame.shape[:2]
+
+        # 1. ROI 영역 추출 (하단 영역, 띠 높이가 같도록 위쪽 나머지 행 제외)
+        roi_start_y = self.get_roi_start_y(height)
+        band_height = (height - roi_start_y) // self.n_bands
+        if band_height == 0:
+            return self._not_found(frame)
+        roi_start_y = height - band_height * self.n_bands
+        gray = cv2.cvtColor(frame[roi_start_y:height], cv2.COLOR_BGR2GRAY)
+
+        # 2. 이진화 (Otsu, 대비가 너무 낮으면 라인 없음)
+        low, high, _, _ = cv2.minMaxLoc(gray)
+        if high - low < self.min_contrast:
+            return self._not_found(np.zeros_like(gray))
+        mode = cv2.THRESH_BINARY if self.line_is_bright else cv2.THRESH_BINARY_INV
+        _, mask = cv2.threshold(gray, 0, 255, mode | cv2.THRESH_OTSU)
+
+        # 3. 띠별 열 투영 (면적 평균 축소 = 띠 안 라인 픽셀 비율 * 255)
+        projection = cv2.resize(
+            mask, (width, self.n_bands), interpolation=cv2.INTER_AREA
+        )
+
+        # 4. 띠별 라인 구간 → 서브픽셀 중심
+        band_x = self._band_centers(projection)
+        valid = ~np.isnan(band_x)
+        band_y = roi_start_y + (np.arange(self.n_bands) + 0.5) * band_height
+        band_centers = [
+            (float(y), float(x)) for y, x in zip(band_y[valid], band_x[valid])
+        ]
+
+        center_x = float(band_x[valid].mean()) if valid.any() else None
+
+        # 5. 방향: 띠 중심들에 x = slope * y + c 직선 맞춤 (최소제곱 닫힌 해)
+        heading = None
+        if len(band_centers) >= 2:
+            ys = band_y[valid] - band_y[valid].mean()
+            slope = ys @ band_x[valid] / (ys @ ys)
+            heading = float(np.degrees(np.arctan(-slope)))
+        self.last_heading = heading
+
+        return {
+            "center_x": center_x,
+            "heading": heading,
+            "band_centers": band_centers,
+            "mask": mask,
+        }
+
+    def get_roi_start_y(self, height: int) -> int:
+        """
+        ROI 시작 Y 좌표 반환
+
+        Args:
+            height: 이미지 높이
+
+        Returns:
+            ROI 시작 Y 좌표
+        """
+        key = (height, self.roi_bottom_ratio)
+        roi_start_y = self._roi_start_cache.get(key)
+        if roi_start_y is None:
+            roi_start_y = int(height * self.roi_bottom_ratio)
+            self._roi_start_cache[key] = roi_start_y
+        return roi_start_y
+
+    @staticmethod
+    def _not_found(mask: np.ndarray) -> Dict[str, Any]:
+        """라인 없음 결과"""
+        return {"center_x": None, "heading": None, "band_centers": [], "mask": mask}
+
+    def _band_centers(self, projection: np.ndarray) -> np.ndarray:
+        """
+        띠별 라인 구간의 투영 가중 중심 평균 (모든 띠를 한 번에 계산)
+
+        Args:
+            projection: (띠 개수, 너비) uint8 열 투영 (0 ~ 255)
+
+        Returns:
+            띠별 중심 X (라인 구간이 없으면 NaN)
+        """
+        n_bands, width = projection.shape
+
+        # 라인 열 구간 (시작, 끝) 찾기: 앞뒤에 0 열을 붙여 경계 차분
+        padded = np.zeros((n_bands, width + 2), dtype=np.int8)
+        np.greater_equal(projection, self.min_fill_ratio * 255, out=padded[:, 1:-1])
+        band_index, columns = np.nonzero(np.diff(padded, axis=1))
+
+        # 행 우선 순서라 구간마다 (시작, 끝)이 번갈아 나옴, 폭 조건에 맞는 구간만
+        band_index, starts, ends = band_index[::2], columns[::2], columns[1::2]
+        widths = ends - starts
+        keep = (widths >= self.min_line_width) & (widths <= self.max_line_width)
+        band_index, starts, ends = band_index[keep], starts[keep], ends[keep]
+
+        # 구간별 투영 가중 중심 (띠 끝에 0 열을 붙여 펼친 배열에서 구간 합 한 번)
+        mass = np.zeros((n_bands, width + 1), dtype=np.int32)
+        mass[:, :width] = projection
+        moment = mass * np.arange(width + 1, dtype=np.int32)
+        bounds = np.empty(2 * len(starts), dtype=np.intp)
+        bounds[0::2] = band_index * (width + 1) + starts
+        bounds[1::2] = band_index * (width + 1) + ends
+        segment_mass = np.add.reduceat(mass.ravel(), bounds)[0::2]
+        segment_x = np.add.reduceat(moment.ravel(), bounds)[0::2] / segment_mass
+
+        # 띠별 구간 중심 평균 (여러 라인이면 그 가운데)
+        counts = np.bincount(band_index, minlength=n_bands)
+        sums = np.bincount(band_index, weights=segment_x, minlength=n_bands)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(counts > 0, sums / counts, np.nan)
@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+"""
+투영 라인 검출기 비교 스크립트
+
+같은 프레임을 Canny + Hough 경로(LineDetectorModule)와
+열 투영 경로(ProjectionLineDetectorModule)로 처리하여
+처리 시간, 검출률, 중심점 일치율을 나란히 출력합니다.
+
+사용법:
+    python test_projection_detector.py                 # 합성 트랙 300프레임
+    python test_projection_detector.py session.esprec  # 녹화 파일
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# 부모 디렉토리를 sys.path에 추가 (frame_source 패키지 import용)
+sys.path.append(str(Path(__file__).parent.parent))
+sys.path.append(str(Path(__file__).parent))
+
+from frame_source import ReplayFrameSource, SyntheticFrameSource  # noqa: E402
+from line_detector_module import LineDetectorModule  # noqa: E402
+from projection_line_detector_module import ProjectionLineDetectorModule  # noqa: E402
+import config as cfg  # noqa: E402
+
+AGREEMENT_TOLERANCE = 10  # 중심점이 이 거리(픽셀) 이내면 일치
+
+
+def measure(detector, frame):
+    """중심점 검출 + 처리 시간 (ms)"""
+    start = time.perf_counter()
+    center_x, _ = detector.detect_line_center(frame)
+    return center_x, (time.perf_counter() - start) * 1000
+
+
+def compare(source, max_frames: int = 300) -> int:
+    """두 검출 경로 비교"""
+    hough = LineDetectorModule(
+        canny_low=cfg.CANNY_LOW_THRESHOLD,
+        canny_high=cfg.CANNY_HIGH_THRESHOLD,
+        hough_threshold=cfg.HOUGH_THRESHOLD,
+        min_line_length=cfg.MIN_LINE_LENGTH,
+        max_line_gap=cfg.MAX_LINE_GAP,
+        roi_bottom_ratio=cfg.ROI_BOTTOM_RATIO,
+    )
+    projection = ProjectionLineDetectorModule(
+        roi_bottom_ratio=cfg.ROI_BOTTOM_RATIO,
+        n_bands=cfg.PROJECTION_BANDS,
+        min_fill_ratio=cfg.PROJECTION_MIN_FILL,
+        max_line_width=cfg.PROJECTION_MAX_LINE_WIDTH,
+        line_is_bright=cfg.LINE_IS_BRIGHT,
+    )
+
+    times = {"hough": [], "projection": []}
+    found = {"hough": 0, "projection": 0}
+    agreed = 0
+    differences = []
+    headings = []
+    frames = 0
+
+    for frame in source:
+        hough_x, hough_ms = measure(hough, frame)
+        projection_x, projection_ms = measure(projection, frame)
+        times["hough"].append(hough_ms)
+        times["projection"].append(projection_ms)
+
+        found["hough"] += hough_x is not None
+        found["projection"] += projection_x is not None
+        if hough_x is None or projection_x is None:
+            agreed += hough_x is None and projection_x is None
+        else:
+            difference = abs(hough_x - projection_x)
+            differences.append(difference)
+            agreed += difference <= AGREEMENT_TOLERANCE
+        if projection.last_heading is not None:
+            headings.append(projection.last_heading)
+
+        frames += 1
+        if frames >= max_frames:
+            break
+
+    if frames == 0:
+        print("❌ 비교할 프레임 없음")
+        return 1
+
+    print("=" * 56)
+    print(f"🧪 라인 검출기 비교 ({frames}프레임)")
+    print("=" * 56)
+    print(f"{'':<16}{'Hough':>18}{'투영':>18}")
+    for label, func in (("중앙값 (ms)", np.median), ("p95 (ms)", _p95)):
+        print(
+            f"{label:<16}{func(times['hough']):>18.3f}"
+            f"{func(times['projection']):>18.3f}"
+        )
+    print(
+        f"{'검출률':<16}{found['hough'] / frames * 100:>17.1f}%"
+        f"{found['projection'] / frames * 100:>17.1f}%"
+    )
+    print("-" * 56)
+    speedup = np.median(times["hough"]) / np.median(times["projection"])
+    print(f"속도 향상:       {speedup:.1f}x (중앙값 기준)")
+    print(f"중심점 일치율:   {agreed / frames * 100:.1f}% (±{AGREEMENT_TOLERANCE}px)")
+    if differences:
+        print(
+            f"중심점 차이:     평균 {np.mean(differences):.1f}px, "
+            f"최대 {np.max(differences):.0f}px"
+        )
+    if headings:
+        print(
+            f"방향 추정:       {np.min(headings):+.1f}° ~ {np.max(headings):+.1f}° "
+            f"({len(headings)}프레임)"
+        )
+    print("=" * 56)
+    return 0
+
+
+def _p95(values):
+    """95 백분위수"""
+    return float(np.percentile(values, 95))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        frame_source = ReplayFrameSource(sys.argv[1], mode="max")
+    else:
+        frame_source = SyntheticFrameSource(count=300)
+
+    with frame_source:
+        sys.exit(compare(frame_source))